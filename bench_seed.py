@@ -0,0 +1,141 @@
+"""
+Бенчмарк генерации WXR (seed.py) на нескольких размерах корпуса.
+Каждый прогон идёт в отдельном процессе: время, items/sec, пик RSS,
+пик аллокаций (tracemalloc) и размер файла. Результат — JSON, который
+можно сравнить с сохранённым baseline.
+
+    python3 bench_seed.py --sizes 1000,10000,100000 -o bench.json
+    python3 bench_seed.py --baseline bench.json   # exit 1 при регрессии
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def run_once(items, workers, indent, trace):
+    """Один прогон в чистом процессе; trace=True включает tracemalloc (медленнее)"""
+    import seed
+    import tracemalloc
+
+    fd, path = tempfile.mkstemp(suffix='.wxr.xml')
+    os.close(fd)
+    try:
+        if trace:
+            tracemalloc.start()
+        started = time.perf_counter()
+        seed.write_synthetic_wxr(path, items, seed=1, until=datetime(2026, 1, 1), indent=indent, workers=workers)
+        wall = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] if trace else None
+        if trace:
+            tracemalloc.stop()
+        return {
+            'wall_s': round(wall, 3),
+            'output_bytes': os.path.getsize(path),
+            # ru_maxrss: килобайты в Linux, байты в macOS
+            'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                                 / (1 << 20 if sys.platform == 'darwin' else 1 << 10), 1),
+            'peak_alloc_mb': round(peak / (1 << 20), 1) if peak is not None else None,
+        }
+    finally:
+        os.remove(path)
+
+
+def isolated(*args):
+    """run_once в свежем spawn-процессе, чтобы пик RSS не наследовался от прошлых прогонов"""
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(run_once, *args).result()
+
+
+def bench(sizes, workers=1, indent='  ', memory=True):
+    runs = []
+    for items in sizes:
+        timed = isolated(items, workers, indent, False)
+        run = {
+            'items': items,
+            'wall_s': timed['wall_s'],
+            'items_per_sec': round(items / timed['wall_s']) if timed['wall_s'] else None,
+            'output_bytes': timed['output_bytes'],
+            'peak_rss_mb': timed['peak_rss_mb'],
+            'peak_alloc_mb': None,
+        }
+        if memory:
+            run['peak_alloc_mb'] = isolated(items, workers, indent, True)['peak_alloc_mb']
+        alloc = f"{run['peak_alloc_mb']:.1f}" if run['peak_alloc_mb'] is not None else '-'
+        print(f"  {items:>9} items  {run['wall_s']:>8.2f}s  {run['items_per_sec'] or 0:>8} items/s  "
+              f"RSS {run['peak_rss_mb']:>7.1f} MB  alloc {alloc:>7} MB  "
+              f"{run['output_bytes'] / 1e6:>9.1f} MB out", flush=True)
+        runs.append(run)
+    return {
+        'created_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'workers': workers,
+        'indent': len(indent),
+        'runs': runs,
+    }
+
+
+def compare(result, baseline, tolerance):
+    """Список регрессий относительно baseline (по совпадающим размерам)"""
+    base = {run['items']: run for run in baseline.get('runs', [])}
+    regressions = []
+    for run in result['runs']:
+        ref = base.get(run['items'])
+        if not ref:
+            continue
+        if ref.get('items_per_sec') and run['items_per_sec'] < ref['items_per_sec'] * (1 - tolerance):
+            regressions.append(f"{run['items']} items: {run['items_per_sec']} items/s "
+                               f"(baseline {ref['items_per_sec']})")
+        for key in ('peak_rss_mb', 'peak_alloc_mb', 'output_bytes'):
+            if ref.get(key) and run.get(key) and run[key] > ref[key] * (1 + tolerance):
+                regressions.append(f"{run['items']} items: {key} {run[key]} (baseline {ref[key]})")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк генерации WXR в seed.py")
+    parser.add_argument('--sizes', type=lambda v: [int(x) for x in v.split(',')], default=DEFAULT_SIZES,
+                        help="размеры корпуса через запятую (по умолчанию 1000,10000,100000,1000000)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="процессов генерации (по умолчанию 1 — tracemalloc видит только свой процесс)")
+    parser.add_argument('--compact', action='store_true', help="мерить компактный вывод без отступов")
+    parser.add_argument('--no-memory', action='store_true', help="не делать второй прогон с tracemalloc")
+    parser.add_argument('-o', '--output', default='bench_seed.json', help="куда записать результат (JSON)")
+    parser.add_argument('--baseline', help="JSON прошлого прогона для сравнения")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="допустимое ухудшение (по умолчанию 0.15)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"📊 seed.py WXR benchmark: {', '.join(map(str, args.sizes))} items, workers={args.workers}")
+    result = bench(args.sizes, args.workers, '' if args.compact else '  ', not args.no_memory)
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f"Результат: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        if regressions:
+            print(f"❌ Регрессии относительно {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"✅ В пределах {args.tolerance:.0%} от {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM JOBS ARCHIVER
+Moves old completed/failed telegram_jobs into gzip JSONL files
+
+    python3 scripts/telegram-archive-jobs.py                     # older than 7 days
+    python3 scripts/telegram-archive-jobs.py --older-than 30 --out-dir /var/backups/telegram_jobs
+    python3 scripts/telegram-archive-jobs.py --no-delete         # export only
+
+Same as `telegram-tools archive ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.archive import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM DRAIN
+Move pending Telegram updates into telegram_jobs instead of dropping them
+
+    python3 scripts/telegram-drain-updates.py                   # drain + re-arm webhook
+    python3 scripts/telegram-drain-updates.py --save drained.jsonl --no-rearm
+
+Steps: deleteWebhook (drop_pending_updates=False) -> getUpdates pages ->
+telegram_jobs + telegram_webhook_updates -> setWebhook again.
+The webhook is re-armed even if draining fails half-way.
+
+Same as `telegram-tools drain ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.drain import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM / SUPABASE EMULATOR
+Local in-memory stand-in for the Bot API and /rest/v1, with latency and fault injection
+
+    python3 scripts/telegram-emulator.py --jobs 20000 --updates 500
+    python3 scripts/telegram-emulator.py --latency 50 --jitter 20 --fail-rate 0.1 --faults 429=2,503=1,hang=1
+
+Then, in another shell:
+    export TELEGRAM_API_URL=http://127.0.0.1:8790
+    python3 scripts/telegram-purge-jobs.py --config scripts/telegram-emulator.example.json
+
+Same as `telegram-tools emulator ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.emulator import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n🛑 Emulator stopped\n")
+        sys.exit(0)
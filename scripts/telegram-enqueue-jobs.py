@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM ENQUEUE JOBS
+Bulk-insert synthetic text-generate / url-parse jobs into telegram_jobs
+
+    python3 scripts/telegram-enqueue-jobs.py --count 20000              # backlog burst
+    python3 scripts/telegram-enqueue-jobs.py --rate 50 --duration 120   # steady Poisson arrivals
+    python3 scripts/telegram-enqueue-jobs.py --target queue --mix url-parse=1
+
+Jobs go in batched PostgREST POSTs with several in flight; the report shows
+insert throughput and latency. Only a local Supabase unless --allow-remote.
+
+Same as `telegram-tools enqueue ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.enqueue import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM PRUNE UPDATES
+Delete old telegram_webhook_updates rows (webhook idempotency table)
+
+    python3 scripts/telegram-prune-updates.py                  # keep 7 days
+    python3 scripts/telegram-prune-updates.py --days 14 --dry-run
+    python3 scripts/telegram-prune-updates.py --quiet          # cron
+
+Rows go oldest first in bounded batches along received_at, so the webhook's
+inserts never wait on a long delete. A lock file keeps cron runs from overlapping.
+
+Same as `telegram-tools prune ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.prune import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
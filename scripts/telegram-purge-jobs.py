@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM QUEUE PURGE
+Batched delete of telegram_jobs with status/type filters
+
+    python3 scripts/telegram-purge-jobs.py                      # all jobs
+    python3 scripts/telegram-purge-jobs.py --status failed,completed
+    python3 scripts/telegram-purge-jobs.py --type url-parse --dry-run
+
+Same as `telegram-tools purge ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.purge import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
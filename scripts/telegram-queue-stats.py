@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM QUEUE ANALYTICS
+Latency percentiles, throughput, retries and backlog age for telegram_jobs
+
+    python3 scripts/telegram-queue-stats.py                 # last 24h, text report
+    python3 scripts/telegram-queue-stats.py --since 168 --json > week.json
+
+Same as `telegram-tools stats ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.stats import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
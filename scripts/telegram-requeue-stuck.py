@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM STUCK-JOB RECOVERY
+Requeue 'processing' jobs whose lease expired instead of wiping the queue
+
+    python3 scripts/telegram-requeue-stuck.py                   # one pass, 5 min lease
+    python3 scripts/telegram-requeue-stuck.py --lease 120 --dry-run
+    python3 scripts/telegram-requeue-stuck.py --loop 15         # reaper every 15s
+
+Same as `telegram-tools requeue ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.requeue import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
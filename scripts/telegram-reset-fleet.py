@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM FLEET RESET
+Reset several bots / environments concurrently from one config
+
+    python3 scripts/telegram-reset-fleet.py                     # every target in the config
+    python3 scripts/telegram-reset-fleet.py --only prod,staging --no-purge
+
+Config: {"targets": [{"name": "prod", "telegram": {...}, "supabase": {...}}, ...]};
+top-level "telegram"/"supabase" values are shared defaults
+(see scripts/telegram-fleet.example.json).
+
+Same as `telegram-tools fleet ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.fleet import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
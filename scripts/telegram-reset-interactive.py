@@ -5,12 +5,16 @@ TELEGRAM BOT AUTOMATIC RESET v7.14.1
 Интерактивная версия с вводом токенов
 """
 
+import argparse
 import os
 import sys
-import time
 import json
-import requests
-from dotenv import load_dotenv
+
+from telegram_tools.client import get_client
+from telegram_tools.commands.reset import STEPS
+from telegram_tools.config import load_config
+from telegram_tools.fleet import reset_target
+from telegram_tools.trace import Trace
 
 # Colors
 GREEN = '\033[0;32m'
@@ -54,135 +58,37 @@ def get_env_or_input(var_name, prompt, secret=False):
     else:
         return input(f"Enter {prompt}: ").strip()
 
-def reset_supabase_queue(supabase_url, service_key):
-    """Reset Telegram queue in Supabase"""
-    print_step(2, 4, "Resetting Supabase queue...")
-    
-    # Extract project ID
-    project_id = supabase_url.split('//')[1].split('.')[0]
-    print_info(f"Project ID: {project_id}")
-    
-    headers = {
-        'apikey': service_key,
-        'Authorization': f'Bearer {service_key}',
-        'Content-Type': 'application/json'
-    }
-    
-    # Delete all jobs
-    print_info("Deleting all jobs from telegram_jobs...")
-    try:
-        response = requests.delete(
-            f"{supabase_url}/rest/v1/telegram_jobs?id=not.is.null",
-            headers=headers
-        )
-        if response.status_code in [200, 204]:
-            print_success("All jobs deleted")
-        else:
-            print_warning(f"Delete response: {response.status_code} - {response.text[:100]}")
-    except Exception as e:
-        print_error(f"Failed to delete jobs: {e}")
-    
-    # Verify queue is empty
-    print_info("Verifying queue is empty...")
-    try:
-        response = requests.get(
-            f"{supabase_url}/rest/v1/telegram_jobs?select=count",
-            headers=headers
-        )
-        data = response.json()
-        if len(data) == 0 or (isinstance(data, list) and len(data) == 0):
-            print_success("Queue is empty (0 jobs)")
-            return True
-        else:
-            print_warning(f"Queue count: {data}")
-            return True
-    except Exception as e:
-        print_error(f"Failed to verify queue: {e}")
-        return False
+def run_reset(config, trace):
+    """Purge the queue and rotate the webhook (telegram_tools.fleet.reset_target)"""
+    print_step(2, 3, "Resetting Supabase queue and Telegram webhook...")
+    print_info(f"Project ID: {config['supabase_url'].split('//')[1].split('.')[0]}")
+    print_info(f"Webhook URL: {config['webhook_url']}")
 
-def manage_webhook(bot_token, secret_token):
-    """Manage Telegram webhook"""
-    print_step(3, 4, "Managing Telegram webhook...")
-    
-    api_url = f"https://api.telegram.org/bot{bot_token}"
-    webhook_url = "https://www.icoffio.com/api/telegram-simple/webhook"
-    
-    # Get current webhook info
-    print_info("Fetching current webhook info...")
-    try:
-        response = requests.get(f"{api_url}/getWebhookInfo")
-        webhook_info = response.json()
-        print_info(f"Current webhook: {json.dumps(webhook_info, indent=2)}")
-    except Exception as e:
-        print_warning(f"Failed to get webhook info: {e}")
-    
-    # Delete existing webhook
-    print_info("Deleting existing webhook...")
-    try:
-        response = requests.post(f"{api_url}/deleteWebhook")
-        delete_result = response.json()
-        if delete_result.get('ok'):
-            print_success("Webhook deleted")
-        else:
-            print_warning(f"Delete response: {delete_result}")
-    except Exception as e:
-        print_error(f"Failed to delete webhook: {e}")
-    
-    time.sleep(2)
-    
-    # Set new webhook
-    print_info("Setting new webhook...")
-    webhook_data = {
-        'url': webhook_url,
-        'secret_token': secret_token,
-        'allowed_updates': ['message', 'callback_query'],
-        'max_connections': 40,
-        'drop_pending_updates': True
-    }
-    
-    try:
-        response = requests.post(
-            f"{api_url}/setWebhook",
-            json=webhook_data
-        )
-        set_result = response.json()
-        
-        if set_result.get('ok'):
-            print_success("Webhook set successfully")
-        else:
-            print_error("Failed to set webhook")
-            print_info(f"Response: {set_result}")
-            return False
-    except Exception as e:
-        print_error(f"Failed to set webhook: {e}")
+    def progress(step, seconds):
+        print_success(f"{STEPS[step]} ({seconds:.2f}s)")
+
+    result = reset_target({'name': 'interactive', **config}, trace.attach(get_client()),
+                          progress=progress, trace=trace)
+    if result['deleted'] is not None:
+        print_info(f"{result['deleted']} jobs deleted, {result['remaining']} left")
+    trace.print_summary()
+    if not result['ok']:
+        print_error(result['error'])
         return False
-    
-    time.sleep(2)
-    
-    # Verify webhook
-    print_info("Verifying new webhook...")
-    try:
-        response = requests.get(f"{api_url}/getWebhookInfo")
-        new_webhook_info = response.json()
-        
-        if new_webhook_info.get('result', {}).get('url') == webhook_url:
-            print_success("Webhook verified")
-            print_info(f"Webhook info:\n{json.dumps(new_webhook_info, indent=2)}")
-            return True
-        else:
-            print_warning("Webhook verification unclear")
-            print_info(f"Response: {json.dumps(new_webhook_info, indent=2)}")
-            return True
-    except Exception as e:
-        print_warning(f"Failed to verify webhook: {e}")
-        return True
+    print_info(f"Webhook info:\n{json.dumps(result['webhook'], indent=2)}")
+    return True
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Interactive Telegram bot reset")
+    parser.add_argument('--trace', metavar='FILE', help="write phase timings + HTTP calls as JSON")
+    args = parser.parse_args(argv)
+    trace = Trace('reset-interactive')
     print_header()
     
     # Step 1: Load environment
-    print_step(1, 4, "Loading environment...")
-    load_dotenv('.env.local')
+    print_step(1, 3, "Loading environment...")
+    with trace.phase('config'):
+        config = load_config()  # also loads .env.local into os.environ, if python-dotenv is installed
     
     # Get required variables
     print_info("Checking required variables...")
@@ -217,18 +123,19 @@ def main():
     
     print_success("All variables collected")
     
-    # Step 2: Reset Supabase queue
-    if not reset_supabase_queue(supabase_url, service_key):
-        print_error("Failed to reset queue")
-        sys.exit(1)
-    
-    # Step 3: Manage webhook
-    if not manage_webhook(bot_token, secret_token):
-        print_error("Failed to manage webhook")
+    # Steps 2-3: Reset Supabase queue, recreate webhook
+    config.update(bot_token=bot_token, secret_token=secret_token,
+                  supabase_url=supabase_url, service_key=service_key)
+    ok = run_reset(config, trace)
+    if args.trace:
+        trace.write(args.trace)
+        print_info(f"Trace written to {args.trace}")
+    if not ok:
+        print_error("Failed to reset")
         sys.exit(1)
     
-    # Step 4: Final status
-    print_step(4, 4, "Final status")
+    # Step 3: Final status
+    print_step(3, 3, "Final status")
     print(f"\n{BLUE}{'=' * 50}{NC}")
     print(f"{GREEN}{BOLD}✅ TELEGRAM BOT RESET COMPLETED!{NC}")
     print(f"{BLUE}{'=' * 50}{NC}\n")
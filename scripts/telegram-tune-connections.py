@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM max_connections TUNER
+Measure the webhook route at increasing concurrency and set max_connections at the knee
+
+    npm run dev
+    python3 scripts/telegram-tune-connections.py --dry-run      # measure + recommend only
+    python3 scripts/telegram-tune-connections.py --steps 5,10,20,40,80 --duration 20 --p95-budget 2
+
+The load runs against http://localhost:3000 (path from the config) unless
+--url/--base say otherwise; the result is applied to the configured bot
+with drop_pending_updates=False.
+
+Same as `telegram-tools tune ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.tune import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM WEBHOOK LOAD TEST
+Replay synthetic Telegram updates against the webhook route at a target RPS
+
+    npm run dev                                                 # local server first
+    python3 scripts/telegram-webhook-load.py --rps 50 --concurrency 40 --duration 30
+    python3 scripts/telegram-webhook-load.py --rps 0 --requests 2000 --duplicates 0.2 --json
+
+The path and secret_token come from the reset config; the host defaults to
+http://localhost:3000. Non-local targets need --allow-remote.
+Synthetic update_ids start at 900000000000 (see telegram_webhook_updates).
+
+Same as `telegram-tools load ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.load import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user\n")
+        sys.exit(1)
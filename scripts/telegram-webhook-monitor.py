@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+TELEGRAM WEBHOOK MONITOR
+Long-running health monitor with a Prometheus /metrics endpoint
+
+    python3 scripts/telegram-webhook-monitor.py                 # poll every 15s, :9464/metrics
+    python3 scripts/telegram-webhook-monitor.py --once          # one poll, print metrics, exit
+    python3 scripts/telegram-webhook-monitor.py --reset-pending-updates 500 --reset-sustain 4
+
+With a --reset-* threshold the usual reset (delete + set webhook, verify)
+runs once the backlog stays above it for --reset-sustain polls in a row.
+
+Same as `telegram-tools monitor ...` (scripts/telegram_tools/cli.py)
+"""
+
+import sys
+
+from telegram_tools.commands.monitor import main
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n🛑 Monitor stopped\n")
+        sys.exit(0)
@@ -0,0 +1,6 @@
+"""
+Shared helpers for the Telegram bot reset scripts
+(telegram-reset-webhook.py, scripts/telegram-reset-simple.py,
+scripts/telegram-reset-interactive.py) and the `telegram-tools` CLI
+(cli.py, one module per subcommand in commands/).
+"""
@@ -0,0 +1,85 @@
+"""
+Archive terminal telegram_jobs rows to rotating gzip JSONL files.
+
+Rows are read oldest-first with keyset pagination on (created_at, id),
+appended to the current archive file, flushed + fsynced, and only then
+deleted by id — a crash never loses a row that is not on disk yet.
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import gzip
+import json
+import os
+import time
+
+from .jobs import TABLE, iter_pages, job_filters
+from .rest import in_chunks, in_list
+
+TERMINAL = ('completed', 'failed')
+
+
+class RotatingJsonl:
+    """gzip JSONL writer that starts a new file every max_rows rows / max_bytes (uncompressed)"""
+
+    def __init__(self, out_dir, prefix='telegram_jobs', max_rows=100_000, max_bytes=256 << 20):
+        self.dir = Path(out_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        self.paths = []
+        self.fh = None
+        self.rows = self.bytes = 0
+
+    def _open(self):
+        path = self.dir / f"{self.prefix}-{self.stamp}-{len(self.paths) + 1:04d}.jsonl.gz"
+        self.raw = open(path, 'wb')
+        self.fh = gzip.GzipFile(fileobj=self.raw, mode='wb')
+        self.paths.append(path)
+        self.rows = self.bytes = 0
+
+    def write(self, rows):
+        """Append rows and make them durable (sync flush + fsync) before returning"""
+        for row in rows:
+            if self.fh is None or self.rows >= self.max_rows or self.bytes >= self.max_bytes:
+                self.close()
+                self._open()
+            line = json.dumps(row, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+            self.fh.write(line)
+            self.rows += 1
+            self.bytes += len(line)
+        if self.fh is not None:
+            self.fh.flush()
+            self.raw.flush()
+            os.fsync(self.raw.fileno())
+
+    def close(self):
+        if self.fh is not None:
+            self.fh.close()
+            self.raw.close()
+            self.fh = None
+
+
+def archive_jobs(rest, writer, older_than_days=7, statuses=TERMINAL, types=None,
+                 page_size=500, delete=True, progress=None):
+    """
+    Move terminal jobs older than `older_than_days` into `writer`.
+    Returns (archived, deleted).
+    """
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).isoformat()
+    base = job_filters(statuses, types, before=cutoff)
+    started = time.monotonic()
+    archived = deleted = 0
+    for rows in iter_pages(rest, base, '*', page_size):
+        writer.write(rows)
+        archived += len(rows)
+        if delete:
+            # same status filter: never delete a row that changed state after we read it
+            for ids in in_chunks(row['id'] for row in rows):
+                removed = rest.delete(TABLE, [('id', in_list(ids)), *job_filters(statuses)])
+                deleted += len(ids) if removed is None else removed
+        if progress:
+            progress(archived, deleted, time.monotonic() - started)
+    return archived, deleted
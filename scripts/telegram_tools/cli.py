@@ -0,0 +1,83 @@
+"""
+telegram-tools: one entry point for the Telegram bot / queue scripts.
+
+    telegram-tools info                      # webhook + telegram_jobs status
+    telegram-tools reset [--no-purge]        # purge queue, rotate webhook
+    telegram-tools purge --status failed
+    telegram-tools startup                   # cold-start time of every subcommand
+    telegram-tools --time stats              # import / run time of one invocation
+
+Nothing beyond the interpreter's own startup modules is imported here:
+a subcommand's module (and with it requests, asyncio, the emulator, ...)
+is imported only when that subcommand runs, so `info` and `--help` don't
+pay for tools they don't use. The hyphenated scripts/telegram-*.py files
+are thin wrappers around the same subcommands.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+COMMANDS = {
+    'info': "webhook status and telegram_jobs counts (stdlib only, fast)",
+    'reset': "purge telegram_jobs, delete + set the webhook, verify",
+    'fleet': "reset several bots / environments concurrently",
+    'purge': "batched delete of telegram_jobs with filters",
+    'archive': "move old terminal jobs to JSONL.gz, then delete them",
+    'stats': "latency / throughput report for telegram_jobs",
+    'requeue': "requeue 'processing' jobs whose lease expired",
+    'drain': "move pending updates into telegram_jobs instead of dropping them",
+    'enqueue': "bulk-insert synthetic jobs to load-test the worker",
+    'prune': "delete old telegram_webhook_updates rows in bounded batches",
+    'monitor': "poll webhook + queue health, serve Prometheus /metrics",
+    'load': "load-test the webhook route with synthetic updates",
+    'tune': "pick setWebhook max_connections from measured capacity",
+    'emulator': "local Bot API + PostgREST stand-in with fault injection",
+    'startup': "measure the cold-start time of the subcommands",
+}
+
+
+def prog_name():
+    name = os.path.basename(sys.argv[0] or '')
+    return 'telegram-tools' if name in ('', '__main__.py', '-c') else name
+
+
+def usage(prog):
+    width = max(map(len, COMMANDS))
+    lines = [f"usage: {prog} [--time] <command> [options]", "", "commands:"]
+    lines += [f"  {name:<{width}}  {text}" for name, text in COMMANDS.items()]
+    lines += ["", f"{prog} <command> --help shows the options of one command;",
+              "--time prints import / run time of the command to stderr."]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    started = time.perf_counter()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    prog = prog_name()
+    show_time = bool(argv) and argv[0] == '--time'
+    if show_time:
+        argv = argv[1:]
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage(prog))
+        return 0 if argv else 2
+    name, args = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(f"{prog}: unknown command '{name}'\n\n{usage(prog)}", file=sys.stderr)
+        return 2
+
+    module = importlib.import_module(f'{__package__}.commands.{name}')
+    imported = time.perf_counter()
+    sys.argv[0] = f"{prog} {name}"  # argparse usage lines read "telegram-tools <command>"
+    try:
+        return module.main(args)
+    except KeyboardInterrupt:
+        message, code = getattr(module, 'INTERRUPTED', ("❌ Cancelled by user", 1))
+        print(f"\n\n{message}\n")
+        return code
+    finally:
+        if show_time:
+            done = time.perf_counter()
+            print(f"⏱️  {name}: import {(imported - started) * 1000:.1f}ms, "
+                  f"run {(done - imported) * 1000:.1f}ms", file=sys.stderr)
@@ -0,0 +1,164 @@
+"""
+Pooled HTTP client for the Telegram Bot API and Supabase PostgREST.
+
+One requests.Session per process: connections are kept alive per host,
+every call has a bounded (connect, read) timeout, and 429/5xx responses
+are retried with Telegram's retry_after / Retry-After or jittered
+exponential backoff.
+"""
+
+import os
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Override to point the scripts at a local Bot API stand-in
+TELEGRAM_API = os.getenv('TELEGRAM_API_URL', "https://api.telegram.org").rstrip('/')
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# idempotent methods, retried by default; a POST that is safe to repeat opts in with retry=True
+RETRY_METHODS = {'GET', 'HEAD', 'DELETE', 'PUT', 'PATCH'}
+
+
+class HttpClient:
+    """requests.Session wrapper with keep-alive pools, timeouts and retries"""
+
+    def __init__(self, timeout=(5, 30), retries=4, backoff=0.5, max_backoff=30,
+                 deadline=120, pool_size=10):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.trace = None  # trace.Trace recording every attempt, see Trace.attach()
+        self.session = requests.Session()
+        # pool_connections = hosts kept warm, pool_maxsize = sockets per host
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def delay(self, attempt, response=None):
+        """Seconds to wait before the next attempt"""
+        if response is not None:
+            wait = retry_after(response)
+            if wait is not None:
+                return min(wait, self.max_backoff)
+        # full jitter: uniform(0, base * 2^attempt), capped
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    def request(self, method, url, retry=None, **kwargs):
+        """
+        Send a request. Retries connection errors, timeouts and 429/5xx until
+        `retries` or `deadline` is exhausted; the last response is returned
+        as-is so callers keep their own status handling.
+        retry=None retries only RETRY_METHODS; True / False force it on / off.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        if retry is None:
+            retry = method.upper() in RETRY_METHODS
+        retries = self.retries if retry else 0
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            call = None
+            sent = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if self.trace:
+                    call = self.trace.http(method, url, sent, error=type(e).__name__, attempt=attempt)
+                if attempt >= retries:
+                    raise
+                response = None
+            else:
+                if self.trace:
+                    call = self.trace.http(method, url, sent, response, attempt=attempt)
+                if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                    return response
+            wait = self.delay(attempt, response)
+            if call:
+                call['retry_wait_s'] = wait
+            if time.monotonic() - started + wait > self.deadline:
+                if response is None:
+                    raise requests.Timeout(f"{method} {redact(url)}: deadline {self.deadline}s exceeded")
+                return response
+            time.sleep(wait)
+            attempt += 1
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+
+def retry_after(response):
+    """Telegram's parameters.retry_after, else the Retry-After header (seconds)"""
+    if response.status_code == 429:
+        try:
+            body = response.json()
+            parameters = body.get('parameters') if isinstance(body, dict) else None
+            value = parameters.get('retry_after') if isinstance(parameters, dict) else None
+            if value is not None:
+                return float(value)
+        except (TypeError, ValueError):
+            pass
+    header = response.headers.get('Retry-After')
+    if header and header.isdigit():
+        return float(header)
+    return None
+
+
+def redact(url):
+    """Hide the bot token in https://api.telegram.org/bot<token>/method"""
+    if '/bot' not in url:
+        return url
+    head, _, rest = url.partition('/bot')
+    token, sep, tail = rest.partition('/')
+    return f"{head}/bot{token[:6]}…{sep}{tail}" if token else url
+
+
+def telegram_url(bot_token, method=''):
+    return f"{TELEGRAM_API}/bot{bot_token}/{method}" if method else f"{TELEGRAM_API}/bot{bot_token}"
+
+
+def supabase_headers(service_key, prefer=None):
+    headers = {
+        'apikey': service_key,
+        'Authorization': f'Bearer {service_key}',
+        'Content-Type': 'application/json',
+    }
+    if prefer:
+        headers['Prefer'] = prefer
+    return headers
+
+
+_default = None
+
+
+def get_client():
+    """Process-wide shared client, so every script reuses the same pools"""
+    global _default
+    if _default is None:
+        _default = HttpClient()
+    return _default
@@ -0,0 +1,4 @@
+"""
+Subcommands of telegram-tools (see ../cli.py). Each module exposes
+main(argv=None) -> exit code and is imported only when its subcommand runs.
+"""
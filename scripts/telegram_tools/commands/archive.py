@@ -0,0 +1,52 @@
+"""
+`archive` subcommand: moves old completed/failed telegram_jobs into gzip JSONL files
+"""
+
+import argparse
+
+from ..archive import TERMINAL, RotatingJsonl, archive_jobs
+from ..config import load_config, require
+from ..jobs import count_jobs
+from ..rest import PostgREST
+
+
+def csv(value):
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Archive old terminal telegram_jobs to JSONL.gz")
+    parser.add_argument('--older-than', type=float, default=7, help="days since created_at (default 7)")
+    parser.add_argument('--status', type=csv, default=list(TERMINAL), help="statuses to archive (default completed,failed)")
+    parser.add_argument('--type', type=csv, help="only these job types")
+    parser.add_argument('--out-dir', default='backups/telegram_jobs', help="archive directory (default backups/telegram_jobs)")
+    parser.add_argument('--page-size', type=int, default=500, help="rows per page / delete batch (default 500)")
+    parser.add_argument('--rotate-rows', type=int, default=100_000, help="rows per archive file (default 100000)")
+    parser.add_argument('--no-delete', action='store_true', help="write the archive but keep the rows")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if set(args.status) - set(TERMINAL):
+        raise SystemExit("❌ Only completed/failed jobs can be archived")
+    config = require(load_config(args.config), 'supabase_url', 'service_key')
+    rest = PostgREST(config['supabase_url'], config['service_key'])
+
+    def progress(archived, deleted, elapsed):
+        rate = archived / elapsed if elapsed else 0
+        print(f"\r   Archived {archived}, deleted {deleted} ({rate:.0f} rows/s)", end='', flush=True)
+
+    print(f"📦 Archiving {','.join(args.status)} jobs older than {args.older_than:g} days -> {args.out_dir}")
+    writer = RotatingJsonl(args.out_dir, max_rows=args.rotate_rows)
+    try:
+        archived, deleted = archive_jobs(rest, writer, args.older_than, args.status, args.type,
+                                         args.page_size, not args.no_delete, progress)
+    finally:
+        writer.close()
+    print()
+    for path in writer.paths:
+        print(f"   {path}")
+    print(f"✅ Archived {archived} jobs, deleted {deleted}; {count_jobs(rest)} jobs left in telegram_jobs")
+    return 0
@@ -0,0 +1,79 @@
+"""
+`drain` subcommand: move pending Telegram updates into telegram_jobs instead of dropping them
+"""
+
+import argparse
+
+from ..client import get_client, telegram_url
+from ..config import load_config, require
+from ..drain import drain
+from ..rest import PostgREST
+from ..webhook import ALLOWED_UPDATES, delete_webhook, set_webhook, wait_for_webhook
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Drain pending Telegram updates into telegram_jobs",
+        epilog="Updates that produce no job (commands, button presses, short texts) are consumed from "
+               "Telegram but not marked as processed; keep them with --save to replay them later.")
+    parser.add_argument('--limit', type=int, default=100, help="updates per getUpdates call (max 100)")
+    parser.add_argument('--save', help="also append every raw update to this JSONL file "
+                                       "(the only copy of the skipped ones)")
+    parser.add_argument('--no-rearm', action='store_true', help="leave the webhook deleted afterwards")
+    parser.add_argument('--max-connections', type=int,
+                        help="setWebhook max_connections (default from config or 40)")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def print_stats(stats):
+    print(f"\r   Fetched {stats['fetched']}: {stats['enqueued']} jobs, "
+          f"{stats['duplicates']} duplicates, {stats['skipped']} not submissions", end='', flush=True)
+
+
+def rearm(config, max_connections):
+    print("🔗 Re-arming webhook...")
+    data = set_webhook(config['bot_token'], config['webhook_url'], config.get('secret_token'),
+                       max_connections, drop_pending_updates=False)
+    if not data.get('ok'):
+        print(f"❌ setWebhook failed: {data.get('description')}")
+        return False
+    converged, _, elapsed, polls = wait_for_webhook(config['bot_token'], config['webhook_url'], ALLOWED_UPDATES)
+    print(f"{'✅' if converged else '⚠️ '} Webhook {'active' if converged else 'not confirmed'}: "
+          f"{config['webhook_url']} ({elapsed:.2f}s, {polls} polls)")
+    return converged
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = require(load_config(args.config), 'bot_token', 'supabase_url', 'service_key')
+    rest = PostgREST(config['supabase_url'], config['service_key'])
+
+    info = get_client().get(telegram_url(config['bot_token'], 'getWebhookInfo')).json().get('result', {})
+    print(f"📋 Pending updates: {info.get('pending_update_count', 0)} (webhook: {info.get('url') or 'none'})")
+
+    print("🗑️  Deleting webhook, keeping pending updates...")
+    data = delete_webhook(config['bot_token'], drop_pending_updates=False)
+    if not data.get('ok'):
+        print(f"❌ deleteWebhook failed: {data.get('description')}")
+        return 1
+
+    save = open(args.save, 'a', encoding='utf-8') if args.save else None
+    failed = False
+    try:
+        stats = drain(config['bot_token'], rest, min(args.limit, 100), save, print_stats)
+        if stats['fetched']:
+            print()
+        print(f"✅ Drained {stats['fetched']} updates: {stats['enqueued']} jobs enqueued, "
+              f"{stats['duplicates']} already handled, {stats['skipped']} not submissions")
+    except Exception as e:
+        print(f"\n❌ Drain stopped: {e}")
+        failed = True
+    finally:
+        if save:
+            save.close()
+        # keep a tuned value (telegram.max_connections) instead of falling back to 40
+        max_connections = args.max_connections or config.get('max_connections') or 40
+        if not args.no_rearm and not rearm(config, max_connections):
+            failed = True
+    return 1 if failed else 0
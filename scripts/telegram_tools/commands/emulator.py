@@ -0,0 +1,63 @@
+"""
+`emulator` subcommand: local in-memory stand-in for the Bot API and /rest/v1, with latency and fault injection
+"""
+
+import argparse
+
+from ..emulator import Emulator, Faults, synthetic_jobs, synthetic_update_rows, synthetic_updates
+
+FAULT_KINDS = ('429', '500', '502', '503', '504', 'hang')
+INTERRUPTED = ("🛑 Emulator stopped", 0)  # Ctrl+C is the normal way to stop it
+
+
+def parse_faults(value):
+    """'429=2,503=1' -> {'429': 2.0, '503': 1.0}"""
+    kinds = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in FAULT_KINDS:
+            raise argparse.ArgumentTypeError(f"unknown fault: {name} (use {', '.join(FAULT_KINDS)})")
+        kinds[name.strip()] = float(weight or 1)
+    return kinds
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Local Telegram Bot API + PostgREST emulator")
+    parser.add_argument('--host', default='127.0.0.1', help="bind address (default 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8790, help="port (default 8790)")
+    parser.add_argument('--latency', type=float, default=0, help="added latency per request, ms")
+    parser.add_argument('--jitter', type=float, default=0, help="+/- uniform jitter on the latency, ms")
+    parser.add_argument('--fail-rate', type=float, default=0, help="share of requests that fail (0..1)")
+    parser.add_argument('--faults', type=parse_faults, help="fault kinds and weights (default 429=1,503=1)")
+    parser.add_argument('--retry-after', type=int, default=1, help="retry_after for injected 429s, s (default 1)")
+    parser.add_argument('--hang', type=float, default=35, help="how long an injected hang lasts, s (default 35)")
+    parser.add_argument('--apply-delay', type=float, default=0, help="seconds before setWebhook shows up in getWebhookInfo")
+    parser.add_argument('--jobs', type=int, default=0, help="seed telegram_jobs with this many synthetic rows")
+    parser.add_argument('--dedup-rows', type=int, default=0,
+                        help="seed telegram_webhook_updates with this many rows over the last 30 days")
+    parser.add_argument('--updates', type=int, default=0, help="queue this many pending updates for --token")
+    parser.add_argument('--token', default='test', help="bot token for --updates (default 'test')")
+    parser.add_argument('--seed', type=int, default=1, help="RNG seed for data and faults (default 1)")
+    parser.add_argument('--verbose', action='store_true', help="log every request")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    faults = Faults(args.latency / 1000, args.jitter / 1000, args.fail_rate, args.faults,
+                    args.retry_after, args.hang, args.seed)
+    emulator = Emulator(args.host, args.port, faults, args.apply_delay, quiet=not args.verbose)
+    store = emulator.store
+    if args.jobs:
+        store.table('telegram_jobs').extend(synthetic_jobs(args.jobs, args.seed))
+    if args.dedup_rows:
+        store.table('telegram_webhook_updates').extend(synthetic_update_rows(args.dedup_rows, seed=args.seed))
+    if args.updates:
+        store.bot(args.token).updates.extend(synthetic_updates(args.updates, seed=args.seed))
+
+    print(f"🧪 Emulator on {emulator.url} ({args.jobs} jobs, {args.updates} pending updates)")
+    print(f"   export TELEGRAM_API_URL={emulator.url}")
+    print(f"   supabase.url = {emulator.url}, any service_role_key")
+    print(f"   stats: curl {emulator.url}/_emulator/stats")
+    emulator.serve_forever()
+    return 0
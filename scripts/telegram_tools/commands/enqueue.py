@@ -0,0 +1,109 @@
+"""
+`enqueue` subcommand: bulk-insert synthetic telegram_jobs (backlogs for worker load tests, backfills)
+"""
+
+import argparse
+import json
+
+from ..config import is_local, load_config, require
+from ..enqueue import DEFAULT_MIX, KINDS, TARGETS, JobSource, enqueue
+from ..rest import PostgREST, PostgRESTError
+
+
+def parse_mix(value):
+    """'text-generate=7,url-parse=3' -> {'text-generate': 7.0, 'url-parse': 3.0}"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in KINDS:
+            raise argparse.ArgumentTypeError(f"unknown job kind: {name} (use {', '.join(KINDS)})")
+        try:
+            mix[name.strip()] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight: {part}")
+        if not mix[name.strip()] > 0:
+            raise argparse.ArgumentTypeError(f"weight must be greater than zero: {part}")
+    return mix
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Insert synthetic text-generate / url-parse jobs into telegram_jobs")
+    parser.add_argument('--count', type=int, help="jobs to insert (default 1000 unless --duration)")
+    parser.add_argument('--rate', type=float, default=0, help="jobs/second, 0 = burst (default 0)")
+    parser.add_argument('--duration', type=float, help="stop after this many seconds (steady mode)")
+    parser.add_argument('--uniform', action='store_true', help="evenly spaced arrivals instead of Poisson")
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help="job kinds and weights (default text-generate=0.7,url-parse=0.3)")
+    parser.add_argument('--target', choices=TARGETS, default='simple',
+                        help="simple: telegram-simple rows for /api/telegram-simple/worker (default); "
+                             "queue: text-generate / url-parse rows for QueueService")
+    parser.add_argument('--notify', action='store_true', help="let the worker message the (fake) chats")
+    parser.add_argument('--chats', type=int, default=50, help="distinct synthetic chats (default 50)")
+    parser.add_argument('--batch-rows', type=int, default=500, help="rows per POST (default 500)")
+    parser.add_argument('--batch-bytes', type=int, default=1 << 20, help="max POST body (default 1 MiB)")
+    parser.add_argument('--linger-ms', type=float, default=250,
+                        help="steady mode: max wait before a partial batch is sent (default 250)")
+    parser.add_argument('--concurrency', type=int, default=4, help="POSTs in flight (default 4)")
+    parser.add_argument('--seed', type=int, default=1, help="RNG seed (default 1)")
+    parser.add_argument('--allow-remote', action='store_true', help="allow a non-local Supabase")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    args = parser.parse_args(argv)
+    if args.count is None and args.duration is None:
+        args.count = 1000
+    return args
+
+
+def ms(summary, key):
+    return f"{summary[key] * 1000:.0f}" if summary.get(key) is not None else '-'
+
+
+def print_report(run_id, report):
+    print("=" * 60)
+    print(f"📥 ENQUEUE — run {run_id}")
+    print("=" * 60)
+    print(f"Inserted: {report['rows']} jobs in {report['requests']} POSTs "
+          f"({report['rows_per_request']} rows each), {report['bytes'] / 1e6:.1f} MB, {report['elapsed_s']:.1f}s")
+    if report['duplicates']:
+        print(f"⚠️  {report['duplicates']} of {report['sent']} jobs already existed and were ignored")
+    print(f"Throughput: {report['rows_per_s']} jobs/s, {report['mb_per_s']} MB/s "
+          f"(offered {report['offered_rate'] or 'burst'}{'' if not report['offered_rate'] else ' jobs/s ' + report['arrivals']})")
+    print(f"Kinds: {report['kinds']}")
+    print(f"\n   {'latency (ms)':<16} {'count':>7} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for name, s in (('POST', report['request_latency']), ('arrival->insert', report['lag'])):
+        print(f"   {name:<16} {s['count']:>7} {ms(s, 'mean_s'):>8} {ms(s, 'p50_s'):>8} "
+              f"{ms(s, 'p95_s'):>8} {ms(s, 'p99_s'):>8} {ms(s, 'max_s'):>8}")
+    print(f"\n   Cleanup: DELETE FROM telegram_jobs WHERE id LIKE 'load_{run_id}_%';")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = require(load_config(args.config), 'supabase_url', 'service_key')
+    if not is_local(config['supabase_url']) and not args.allow_remote:
+        print(f"❌ {config['supabase_url']} is not local; pass --allow-remote if you really mean it "
+              f"(the worker will process these jobs)")
+        return 1
+    rest = PostgREST(config['supabase_url'], config['service_key'])
+    source = JobSource(args.mix, args.target, args.seed, args.chats, args.notify)
+
+    progress = None if args.json else (lambda r: print(
+        f"\r   {r.rows} inserted, {r.rows / r.elapsed:.0f} jobs/s", end='', flush=True))
+    if not args.json:
+        planned = f"{args.count} jobs" if args.count else f"{args.duration:g}s"
+        pace = f"{args.rate:g}/s {'uniform' if args.uniform else 'Poisson'}" if args.rate else 'burst'
+        print(f"🚀 {planned}, {pace}, {args.concurrency} x {args.batch_rows}-row POSTs -> "
+              f"{config['supabase_url']} ({args.target})")
+    try:
+        result = enqueue(rest, source, args.count, args.rate, args.duration, not args.uniform, args.batch_rows,
+                         args.batch_bytes, args.linger_ms / 1000, args.concurrency, args.seed, progress)
+    except PostgRESTError as e:
+        print(f"\n❌ Insert failed: {e}")
+        return 1
+    report = {'run_id': source.run_id, 'target': args.target,
+              **result.report(args.rate, 'uniform' if args.uniform else 'poisson')}
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print()
+        print_report(source.run_id, report)
+    return 0
@@ -0,0 +1,61 @@
+"""
+`fleet` subcommand: reset several bots / environments concurrently from one config
+"""
+
+import argparse
+import time
+
+from ..config import load_targets
+from ..fleet import reset_all
+from ..trace import Trace
+
+
+def csv(value):
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent webhook + queue reset for several bots")
+    parser.add_argument('--only', type=csv, help="only these target names")
+    parser.add_argument('--workers', type=int, default=8, help="targets reset at once (default 8)")
+    parser.add_argument('--no-purge', action='store_true', help="only rotate webhooks, keep telegram_jobs")
+    parser.add_argument('--trace', metavar='FILE', help="write per-target phase timings + HTTP calls as JSON")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def print_summary(results):
+    width = max(8, *(len(r['name']) for r in results))
+    print(f"\n{'target':<{width}}  {'status':<6} {'purge':>7} {'delete':>7} {'set':>7} {'verify':>7} {'total':>7}  {'jobs':>7}  note")
+    for r in results:
+        t = r['timings']
+        cells = ' '.join(f"{t[k]:>6.2f}s" if k in t else f"{'-':>7}" for k in ('purge', 'delete', 'set', 'verify', 'total'))
+        jobs = '-' if r['deleted'] is None else str(r['deleted'])
+        note = r['error'] or (f"{r['remaining']} left" if r['remaining'] else '')
+        print(f"{r['name']:<{width}}  {'✅ ok' if r['ok'] else '❌ fail':<6} {cells}  {jobs:>7}  {note}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    targets = load_targets(args.config, args.only)
+    print(f"🔄 Resetting {len(targets)} target(s): {', '.join(t['name'] for t in targets)}")
+
+    trace = Trace('fleet') if args.trace else None
+    started = time.monotonic()
+    results = reset_all(targets, args.workers, not args.no_purge, trace)
+    wall = time.monotonic() - started
+
+    print_summary(results)
+    if trace:
+        trace.print_summary()
+        trace.write(args.trace)
+        print(f"\n📝 Trace written to {args.trace}")
+    failed = [r['name'] for r in results if not r['ok']]
+    slowest = max(r['timings']['total'] for r in results)
+    print(f"\n⏱️  Wall {wall:.2f}s (slowest target {slowest:.2f}s, "
+          f"sum {sum(r['timings']['total'] for r in results):.2f}s)")
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}")
+        return 1
+    print("✅ All targets reset")
+    return 0
@@ -0,0 +1,134 @@
+"""
+`info` subcommand: webhook status and telegram_jobs counts.
+
+Runs on every deploy check, so it stays on the standard library: no
+requests / dotenv import (~100 ms on a cold start), just one http.client
+connection per host. .env.local is only read when the config files and
+the environment have no bot token.
+"""
+
+import argparse
+from datetime import datetime
+from http.client import HTTPConnection, HTTPSConnection
+from urllib.parse import quote, urlsplit
+import json
+import os
+import time
+
+from ..config import load_config, require
+
+STATUSES = ('pending', 'processing', 'completed', 'failed')  # jobs.STATUSES, without importing requests
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Show webhook status and telegram_jobs counts")
+    parser.add_argument('--no-jobs', action='store_true', help="skip the telegram_jobs counts")
+    parser.add_argument('--json', action='store_true', help="print JSON instead of text")
+    parser.add_argument('--timing', action='store_true', help="print local vs network time")
+    parser.add_argument('--timeout', type=float, default=10, help="per-request timeout in seconds (default 10)")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+class Http:
+    """One keep-alive connection per host, plus the time spent waiting on it"""
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.connections = {}
+        self.network = 0.0
+
+    def request(self, method, url, headers=None):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        if key not in self.connections:
+            kind = HTTPSConnection if parts.scheme == 'https' else HTTPConnection
+            self.connections[key] = kind(parts.netloc, timeout=self.timeout)
+        started = time.perf_counter()
+        try:
+            conn = self.connections[key]
+            conn.request(method, parts.path + (f"?{parts.query}" if parts.query else ''), headers=headers or {})
+            response = conn.getresponse()
+            return response.status, response.getheaders(), response.read()
+        finally:
+            self.network += time.perf_counter() - started
+
+    def close(self):
+        for conn in self.connections.values():
+            conn.close()
+
+
+def webhook_info(http, bot_token):
+    api = os.getenv('TELEGRAM_API_URL', "https://api.telegram.org").rstrip('/')
+    status, _, body = http.request('GET', f"{api}/bot{bot_token}/getWebhookInfo")
+    data = json.loads(body or b'{}')
+    if not data.get('ok'):
+        raise RuntimeError(f"getWebhookInfo: HTTP {status} {data.get('description', '')}".strip())
+    return data['result']
+
+
+def job_counts(http, supabase_url, service_key):
+    """HEAD + count=exact per status, like jobs.count_jobs"""
+    headers = {'apikey': service_key, 'Authorization': f"Bearer {service_key}", 'Prefer': 'count=exact'}
+    counts = {}
+    for status in STATUSES:
+        url = f"{supabase_url.rstrip('/')}/rest/v1/telegram_jobs?select=id&status=eq.{quote(status)}"
+        code, response_headers, _ = http.request('HEAD', url, headers)
+        if code >= 400:
+            raise RuntimeError(f"telegram_jobs: HTTP {code}")
+        content_range = dict((k.lower(), v) for k, v in response_headers).get('content-range', '')
+        total = content_range.rpartition('/')[2]
+        counts[status] = int(total) if total.isdigit() else None
+    return counts
+
+
+def main(argv=None):
+    started = time.perf_counter()
+    args = parse_args(argv)
+    config = load_config(args.config, dotenv=False)
+    if not config.get('bot_token'):
+        config = require(load_config(args.config), 'bot_token')  # secrets only in .env.local
+
+    http = Http(args.timeout)
+    report = {'webhook': None, 'jobs': None, 'errors': []}
+    try:
+        try:
+            report['webhook'] = webhook_info(http, config['bot_token'])
+        except (OSError, ValueError, RuntimeError) as e:
+            report['errors'].append(str(e))
+        if not args.no_jobs and config.get('supabase_url') and config.get('service_key'):
+            try:
+                report['jobs'] = job_counts(http, config['supabase_url'], config['service_key'])
+            except (OSError, ValueError, RuntimeError) as e:
+                report['errors'].append(str(e))
+    finally:
+        http.close()
+    total = time.perf_counter() - started
+    report['timing'] = {'total_ms': round(total * 1000, 1), 'network_ms': round(http.network * 1000, 1),
+                        'local_ms': round((total - http.network) * 1000, 1)}
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, config['webhook_url'], args.timing)
+    return 1 if report['errors'] else 0
+
+
+def print_report(report, expected_url, timing=False):
+    info = report['webhook']
+    if info is not None:
+        url = info.get('url') or 'not set'
+        print(f"🌐 Webhook: {url} {'✅' if info.get('url') == expected_url else f'⚠️  (expected {expected_url})'}")
+        print(f"   pending_update_count={info.get('pending_update_count', 0)} "
+              f"max_connections={info.get('max_connections', '-')} "
+              f"allowed_updates={','.join(info.get('allowed_updates') or []) or '-'}")
+        if info.get('last_error_date'):
+            when = datetime.fromtimestamp(info['last_error_date']).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"   ⚠️  Last error {when}: {info.get('last_error_message')}")
+    if report['jobs'] is not None:
+        print("📋 Jobs: " + ' '.join(f"{status}={count}" for status, count in report['jobs'].items()))
+    for error in report['errors']:
+        print(f"❌ {error}")
+    if timing:
+        t = report['timing']
+        print(f"⏱️  {t['total_ms']:.1f}ms total: {t['network_ms']:.1f}ms network, {t['local_ms']:.1f}ms local")
@@ -0,0 +1,97 @@
+"""
+`load` subcommand: replay synthetic Telegram updates against the webhook route at a target RPS
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from ..config import is_local, load_config, webhook_target
+from ..loadgen import DEFAULT_MIX, UpdateSource, run_load
+
+
+def parse_mix(value):
+    """'command=5,callback_query=3' -> {'command': 5.0, 'callback_query': 3.0}"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown update kind: {name} (use {', '.join(DEFAULT_MIX)})")
+        try:
+            mix[name.strip()] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight: {part}")
+        if not mix[name.strip()] > 0:
+            raise argparse.ArgumentTypeError(f"weight must be greater than zero: {part}")
+    return mix
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test /api/telegram-simple/webhook with synthetic updates")
+    parser.add_argument('--base', default='http://localhost:3000', help="server to hit (default http://localhost:3000)")
+    parser.add_argument('--url', help="full webhook URL (overrides --base and the config path)")
+    parser.add_argument('--allow-remote', action='store_true', help="allow a non-local target")
+    parser.add_argument('--rps', type=float, default=50, help="offered requests/second, 0 = closed loop (default 50)")
+    parser.add_argument('--concurrency', type=int, default=40, help="parallel connections (default 40, like max_connections)")
+    parser.add_argument('--duration', type=float, default=30, help="seconds to run (default 30)")
+    parser.add_argument('--requests', type=int, help="stop after this many requests")
+    parser.add_argument('--duplicates', type=float, default=0.0, help="fraction of re-sent update_ids (default 0)")
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help="update kinds and weights (default command=0.5,callback_query=0.3,text=0.1,url=0.1)")
+    parser.add_argument('--chats', type=int, default=50, help="distinct synthetic chats (default 50)")
+    parser.add_argument('--seed', type=int, default=1, help="RNG seed (default 1)")
+    parser.add_argument('--timeout', type=float, default=30, help="per-request timeout in seconds (default 30)")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def ms(summary, key):
+    return f"{summary[key] * 1000:.0f}" if summary.get(key) is not None else '-'
+
+
+def print_report(url, report):
+    print("=" * 60)
+    print(f"📈 WEBHOOK LOAD — {url}")
+    print("=" * 60)
+    print(f"Requests: {report['requests']} in {report['elapsed_s']:.1f}s "
+          f"({report['duplicates_sent']} duplicate update_ids, {report['connections_opened']} connections)")
+    print(f"Throughput: offered {report['offered_rps'] or 'max'} rps, achieved {report['achieved_rps']} rps, "
+          f"ok {report['ok_rps']} rps")
+    rate = '-' if report['error_rate'] is None else f"{report['error_rate']:.2%}"
+    print(f"Errors: {rate} {report['errors'] or ''}")
+    print(f"Statuses: {report['statuses']}")
+    print(f"\n   {'latency (ms)':<16} {'count':>7} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    rows = [('response', report['latency']), ('service', report['service_time']),
+            *((f"  {k}", v) for k, v in report['latency_by_kind'].items())]
+    for name, s in rows:
+        print(f"   {name:<16} {s['count']:>7} {ms(s, 'mean_s'):>8} {ms(s, 'p50_s'):>8} "
+              f"{ms(s, 'p95_s'):>8} {ms(s, 'p99_s'):>8} {ms(s, 'max_s'):>8}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = load_config(args.config)
+    url = webhook_target(config['webhook_url'], args.base, args.url)
+    if not is_local(url) and not args.allow_remote:
+        print(f"❌ {url} is not local; pass --allow-remote if you really mean it")
+        return 1
+
+    source = UpdateSource(args.mix, args.duplicates, args.seed, args.chats)
+    progress = None if args.json else (lambda r: print(
+        f"\r   {r.sent} sent, {sum(r.errors.values())} errors, {r.sent / r.elapsed:.0f} rps",
+        end='', flush=True))
+    if not args.json:
+        print(f"🚀 {args.rps or 'max'} rps x {args.concurrency} connections -> {url}")
+    result = asyncio.run(run_load(url, config.get('secret_token'), args.rps, args.concurrency,
+                                  args.duration, args.requests, source, args.timeout, progress))
+    report = result.report(args.rps or None)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print()
+        print_report(url, report)
+    # nothing sent means nothing was measured: report that as a failure too
+    return 1 if report['error_rate'] or not report['requests'] else 0
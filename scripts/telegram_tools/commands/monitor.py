@@ -0,0 +1,87 @@
+"""
+`monitor` subcommand: long-running health monitor with a Prometheus /metrics endpoint
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+
+from ..client import get_client
+from ..config import load_config, require
+from ..fleet import reset_target
+from ..monitor import BacklogTrigger, Monitor, serve_metrics
+from ..rest import PostgREST
+
+INTERRUPTED = ("🛑 Monitor stopped", 0)  # Ctrl+C is the normal way to stop it
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Poll webhook + queue health and expose /metrics")
+    parser.add_argument('--interval', type=float, default=15, help="seconds between polls (default 15)")
+    parser.add_argument('--window', type=float, default=300, help="rolling window in seconds (default 300)")
+    parser.add_argument('--host', default='127.0.0.1', help="/metrics bind address (default 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=9464, help="/metrics port (default 9464)")
+    parser.add_argument('--once', action='store_true', help="poll once, print the metrics and exit")
+    parser.add_argument('--reset-pending-updates', type=int, metavar='N',
+                        help="reset when pending_update_count >= N")
+    parser.add_argument('--reset-pending-jobs', type=int, metavar='N', help="reset when pending jobs >= N")
+    parser.add_argument('--reset-sustain', type=int, default=3, help="polls above threshold before a reset (default 3)")
+    parser.add_argument('--reset-cooldown', type=float, default=600, help="seconds between resets (default 600)")
+    parser.add_argument('--reset-purge', action='store_true', help="also purge telegram_jobs on reset")
+    parser.add_argument('--reset-drop-pending', action='store_true',
+                        help="drop Telegram's pending updates on reset (loses the queued user messages; "
+                             "by default they are kept and redelivered)")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def log(sample):
+    stamp = datetime.now().strftime('%H:%M:%S')
+    info = sample.webhook or {}
+    jobs = sample.jobs or {}
+    line = (f"[{stamp}] pending_updates={info.get('pending_update_count', '?')} "
+            f"jobs pending={jobs.get('pending', '?')} processing={jobs.get('processing', '?')} "
+            f"oldest={'-' if sample.oldest_pending is None else f'{sample.oldest_pending:.0f}s'} "
+            f"({sample.duration * 1000:.0f}ms)")
+    if info.get('last_error_message'):
+        line += f" last_error={info['last_error_message']!r}"
+    if sample.error:
+        line += f" ❌ {sample.error}"
+    print(line, flush=True)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = require(load_config(args.config), 'bot_token')
+    http = get_client()
+    rest = PostgREST(config['supabase_url'], config['service_key'], http) \
+        if config.get('supabase_url') and config.get('service_key') else None
+    monitor = Monitor(config, rest, http, args.window)
+
+    if args.once:
+        sample = monitor.poll()
+        sys.stdout.write(monitor.metrics())
+        return 1 if sample.error else 0
+
+    trigger = None
+    if args.reset_pending_updates is not None or args.reset_pending_jobs is not None:
+        trigger = BacklogTrigger(args.reset_pending_updates, args.reset_pending_jobs,
+                                 args.reset_sustain, args.reset_cooldown)
+
+    serve_metrics(monitor, args.host, args.port)
+    print(f"📡 Monitoring every {args.interval:g}s, window {args.window:g}s, "
+          f"metrics on http://{args.host}:{args.port}/metrics" + (" (auto-reset on)" if trigger else ''))
+    while True:
+        started = time.monotonic()
+        sample = monitor.poll()
+        log(sample)
+        reason = trigger.check(sample) if trigger else None
+        if reason:
+            print(f"🔄 Backlog threshold hit ({reason}), resetting webhook...", flush=True)
+            result = reset_target({'name': 'monitor', **config}, http, purge=args.reset_purge,
+                                  drop_pending_updates=args.reset_drop_pending)
+            monitor.resets += 1
+            print(f"{'✅' if result['ok'] else '❌'} Reset {'done' if result['ok'] else 'failed: ' + result['error']} "
+                  f"in {result['timings']['total']:.2f}s", flush=True)
+        time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
@@ -0,0 +1,103 @@
+"""
+`prune` subcommand: retention for the telegram_webhook_updates idempotency table
+"""
+
+import argparse
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+import json
+import sys
+import tempfile
+
+from ..config import load_config, require
+from ..rest import PostgREST
+from ..retention import MIN_WINDOW, count_older, cutoff_for, prune_updates, table_stats
+from ..trace import human_bytes
+
+DEFAULT_LOCK = Path(tempfile.gettempdir()) / 'telegram-prune-updates.lock'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Delete old telegram_webhook_updates rows in bounded batches")
+    parser.add_argument('--days', type=float, default=7,
+                        help=f"keep this many days (default 7, minimum {MIN_WINDOW.total_seconds() / 86400:g})")
+    parser.add_argument('--batch-size', type=int, default=1000, help="rows per DELETE (default 1000)")
+    parser.add_argument('--max-batches', type=int, help="stop after this many batches")
+    parser.add_argument('--max-seconds', type=float, default=300, help="stop after this long (default 300)")
+    parser.add_argument('--pause', type=float, default=0, help="seconds to sleep between batches (default 0)")
+    parser.add_argument('--dry-run', action='store_true', help="only count the rows that would go")
+    parser.add_argument('--lock', default=str(DEFAULT_LOCK), help=f"lock file against overlapping runs "
+                                                                   f"(default {DEFAULT_LOCK})")
+    parser.add_argument('--quiet', action='store_true', help="one summary line (for cron)")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+@contextmanager
+def single_run(path):
+    """Yields False if another run holds the lock (non-blocking flock; no-op where fcntl is missing)"""
+    try:
+        import fcntl
+    except ImportError:
+        yield True
+        return
+    with open(path, 'a') as fh:
+        try:
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def size(n):
+    return 'size n/a (stats function not deployed)' if n is None else human_bytes(n)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = require(load_config(args.config), 'supabase_url', 'service_key')
+    rest = PostgREST(config['supabase_url'], config['service_key'])
+    try:
+        cutoff = cutoff_for(timedelta(days=args.days))
+    except ValueError as e:
+        raise SystemExit(f"❌ {e}")
+    say = (lambda *a, **k: None) if args.quiet or args.json else print
+
+    with single_run(args.lock) as acquired:
+        if not acquired:
+            print(f"⏭️  Another prune holds {args.lock}, skipping")
+            return 0
+        before = table_stats(rest)
+        say(f"📋 telegram_webhook_updates: ~{before['rows']} rows, {size(before['total_bytes'])}; "
+            f"removing received_at < {cutoff}")
+        if args.dry_run:
+            older = count_older(rest, cutoff)
+            summary = {'cutoff': cutoff, 'would_delete': older, 'before': before}
+            print(json.dumps(summary, indent=2) if args.json else f"🔍 {older} rows would be deleted")
+            return 0
+
+        def progress(deleted, batches, elapsed):
+            print(f"\r   Deleted {deleted} rows in {batches} batches ({deleted / elapsed if elapsed else 0:.0f} rows/s)",
+                  end='', flush=True)
+
+        result = prune_updates(rest, cutoff, args.batch_size, args.max_batches, args.max_seconds, args.pause,
+                               None if args.quiet or args.json else progress)
+        if result['batches']:
+            say()
+        after = table_stats(rest)
+
+    summary = {'cutoff': cutoff, **result, 'before': before, 'after': after}
+    if args.json:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+    else:
+        left = '' if result['complete'] else ' (stopped at the batch / time limit, the next run continues)'
+        print(f"{'✅' if result['complete'] else '⏸️ '} Pruned {result['deleted']} rows in {result['batches']} batches, "
+              f"{result['elapsed_s']:.1f}s; table now ~{after['rows']} rows, {size(after['total_bytes'])}{left}")
+    return 0
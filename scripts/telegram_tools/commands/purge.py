@@ -0,0 +1,43 @@
+"""
+`purge` subcommand: batched delete of telegram_jobs with status/type filters
+"""
+
+import argparse
+
+from ..config import load_config, require
+from ..jobs import STATUSES, count_jobs, print_progress, purge_jobs
+from ..rest import PostgREST
+
+
+def csv(value):
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Purge telegram_jobs in bounded batches")
+    parser.add_argument('--status', type=csv, help=f"only these statuses ({','.join(STATUSES)})")
+    parser.add_argument('--type', type=csv, help="only these job types (e.g. text-generate,url-parse)")
+    parser.add_argument('--before', help="only jobs created before this ISO timestamp")
+    parser.add_argument('--batch-size', type=int, default=500, help="rows per DELETE (default 500)")
+    parser.add_argument('--dry-run', action='store_true', help="only count matching jobs")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = require(load_config(args.config), 'supabase_url', 'service_key')
+    rest = PostgREST(config['supabase_url'], config['service_key'])
+
+    print(f"📋 Matching jobs: {count_jobs(rest, args.status, args.type, args.before)}")
+    if args.dry_run:
+        return 0
+
+    deleted = purge_jobs(rest, args.status, args.type, args.before, args.batch_size, print_progress())
+    print()
+    remaining = count_jobs(rest, args.status, args.type, args.before)
+    if remaining == 0:
+        print(f"✅ Deleted {deleted} jobs, none left")
+        return 0
+    print(f"⚠️  Deleted {deleted} jobs, {remaining} still match")
+    return 1
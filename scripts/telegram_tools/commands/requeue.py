@@ -0,0 +1,52 @@
+"""
+`requeue` subcommand: requeue 'processing' jobs whose lease expired instead of wiping the queue
+"""
+
+import argparse
+from datetime import datetime
+
+from ..config import load_config, require
+from ..rest import PostgREST
+from ..reaper import reap, run_reaper
+
+
+def csv(value):
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Requeue telegram_jobs stuck in processing")
+    parser.add_argument('--lease', type=float, default=300, help="seconds since started_at before a job counts as stuck (default 300)")
+    parser.add_argument('--type', type=csv, help="only these job types")
+    parser.add_argument('--batch-size', type=int, default=500, help="rows per page (default 500)")
+    parser.add_argument('--loop', type=float, metavar='SECONDS', help="keep running, one pass every SECONDS")
+    parser.add_argument('--dry-run', action='store_true', help="only count stuck jobs")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def log_pass(result, elapsed):
+    stamp = datetime.now().strftime('%H:%M:%S')
+    if 'error' in result:
+        print(f"[{stamp}] ❌ {result['error']}", flush=True)
+    elif result['found']:
+        print(f"[{stamp}] 🔄 {result['found']} stuck: {result['requeued']} requeued, "
+              f"{result['failed']} failed ({elapsed:.2f}s)", flush=True)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = require(load_config(args.config), 'supabase_url', 'service_key')
+    rest = PostgREST(config['supabase_url'], config['service_key'])
+
+    if args.loop:
+        print(f"♻️  Reaper: lease {args.lease:g}s, every {args.loop:g}s (Ctrl+C to stop)")
+        run_reaper(rest, args.lease, args.loop, args.type, args.batch_size, log_pass)
+        return 0
+
+    result = reap(rest, args.lease, args.type, args.batch_size, args.dry_run)
+    if args.dry_run:
+        print(f"📋 Stuck jobs (processing > {args.lease:g}s): {result['found']}")
+        return 0
+    print(f"✅ {result['found']} stuck jobs: {result['requeued']} back to pending, {result['failed']} failed")
+    return 0
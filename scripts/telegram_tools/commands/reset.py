@@ -0,0 +1,77 @@
+"""
+`reset` subcommand: delete the webhook, then purge telegram_jobs while the
+webhook is set again and verified (fleet.reset_target). The one reset flow
+behind telegram-reset-simple.py, telegram-reset-webhook.py and
+`telegram-tools reset`.
+"""
+
+import argparse
+from pathlib import Path
+
+from ..client import get_client, redact, telegram_url
+from ..config import load_config, require
+from ..fleet import reset_target
+from ..trace import Trace
+
+STEPS = {'delete': "Webhook deleted", 'preflight': "Pre-flight checked", 'purge': "Queue purged",
+         'set': "Webhook set", 'verify': "Webhook verified"}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Reset the Telegram webhook (and the telegram_jobs queue)")
+    parser.add_argument('--no-purge', action='store_true', help="only rotate the webhook, keep telegram_jobs")
+    parser.add_argument('--url', help="webhook URL (default from config)")
+    parser.add_argument('--max-connections', type=int, help="setWebhook max_connections (default from config or 40)")
+    parser.add_argument('--trace', metavar='FILE', help="write phase timings + HTTP calls as JSON")
+    parser.add_argument('--calls', action='store_true', help="list every HTTP call under the timing table")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    trace = Trace('reset')
+    if args.config and not Path(args.config).exists():
+        print(f"❌ Config file not found: {args.config}")
+        print("\n1. Copy: cp scripts/telegram-config.example.json scripts/telegram-config.json")
+        print("2. Edit: scripts/telegram-config.json")
+        print("3. Run this command again\n")
+        return 1
+    with trace.phase('config'):
+        config = load_config(args.config)
+    keys = ('bot_token',) if args.no_purge else ('bot_token', 'supabase_url', 'service_key')
+    require(config, *keys)
+    if args.url:
+        config['webhook_url'] = args.url
+    if args.max_connections:
+        config['max_connections'] = args.max_connections
+
+    print(f"🔄 Resetting {redact(telegram_url(config['bot_token']))} -> {config['webhook_url']}")
+
+    def progress(step, seconds):
+        print(f"   ✔ {STEPS[step]:<17} {seconds:6.2f}s", flush=True)
+
+    result = reset_target({'name': 'default', **config}, trace.attach(get_client()), not args.no_purge,
+                          progress, trace)
+    before = result['preflight']
+    if before and before['jobs'] is not None:
+        print(f"   📋 Queue before reset: {before['jobs']} jobs")
+    if before and before['last_error']:
+        print(f"   ⚠️  Last delivery error: {before['last_error']}")
+    if result['deleted'] is not None:
+        print(f"   {'⚠️ ' if result['remaining'] else '🗑️ '} {result['deleted']} jobs deleted, "
+              f"{result['remaining']} left")
+    trace.print_summary(args.calls)
+    if args.trace:
+        trace.write(args.trace)
+        print(f"\n📝 Trace written to {args.trace}")
+    if not result['ok']:
+        print(f"\n❌ Reset failed after {result['timings']['total']:.2f}s: {result['error']}")
+        return 1
+
+    info = result['webhook'] or {}
+    print(f"\n✅ Reset done in {result['timings']['total']:.2f}s ({result['polls']} verify polls)")
+    print(f"   pending_update_count={info.get('pending_update_count', 0)} "
+          f"max_connections={info.get('max_connections', '?')}")
+    print("\n🧪 Next: send /start and a text to the bot, a reply should arrive in 5-15 seconds\n")
+    return 0
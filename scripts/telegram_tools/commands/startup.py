@@ -0,0 +1,92 @@
+"""
+`startup` subcommand: cold-start time of the other subcommands.
+
+Every run is a fresh interpreter doing `python -m telegram_tools <command>
+--help` (imports + argument parsing, no network), compared with a bare
+`python -c pass` so the interpreter's own startup isn't counted as ours.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from ..cli import COMMANDS
+
+PACKAGE_PARENT = str(Path(__file__).resolve().parent.parent.parent)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the cold-start time of telegram-tools subcommands")
+    parser.add_argument('commands', nargs='*', help="subcommands to measure (default all)")
+    parser.add_argument('--runs', type=int, default=10, help="fresh interpreters per command (default 10)")
+    parser.add_argument('--budget-ms', type=float, default=100,
+                        help="max overhead of `info` over bare python (default 100)")
+    parser.add_argument('--imports', type=int, default=0, metavar='N',
+                        help="also list the N slowest imports of each command (python -X importtime)")
+    return parser.parse_args(argv)
+
+
+def spawn(cmd, env):
+    started = time.perf_counter()
+    proc = subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = (time.perf_counter() - started) * 1000
+    if proc.returncode:
+        raise RuntimeError(f"{' '.join(cmd[1:])} exited with {proc.returncode}: {proc.stderr.strip()[-200:]}")
+    return elapsed
+
+
+def measure(cmd, runs, env):
+    """Median / min wall milliseconds over `runs` fresh processes (one warm-up run for the page cache)"""
+    spawn(cmd, env)
+    samples = [spawn(cmd, env) for _ in range(runs)]
+    return statistics.median(samples), min(samples)
+
+
+def import_times(cmd, env):
+    """{module: cumulative_ms} from `python -X importtime`"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', *cmd], env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and 'cumulative' not in line:
+            _, cumulative, module = line[len('import time:'):].split('|')
+            times[module.strip()] = int(cumulative) / 1000
+    return times
+
+
+def slowest_imports(name, env, top, baseline):
+    """[(cumulative_ms, module)] slowest first, minus our own modules and what bare python imports anyway"""
+    times = import_times(['-m', 'telegram_tools', name, '--help'], env)
+    rows = [(ms, module) for module, ms in times.items()
+            if module not in baseline and not module.startswith('telegram_tools')]
+    return sorted(rows, reverse=True)[:top]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    names = args.commands or [name for name in COMMANDS if name != 'startup']
+    unknown = [name for name in names if name not in COMMANDS]
+    if unknown:
+        raise SystemExit(f"❌ Unknown command(s): {', '.join(unknown)}")
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [PACKAGE_PARENT, os.getenv('PYTHONPATH')]))}
+
+    base, base_min = measure([sys.executable, '-c', 'pass'], args.runs, env)
+    print(f"🐍 Bare interpreter: {base:.1f}ms median, {base_min:.1f}ms min ({args.runs} runs)\n")
+    print(f"{'command':<10} {'median':>9} {'min':>9} {'overhead':>9}")
+    baseline = import_times(['-c', 'pass'], env) if args.imports else {}
+    over = []
+    for name in names:
+        median, low = measure([sys.executable, '-m', 'telegram_tools', name, '--help'], args.runs, env)
+        overhead = median - base
+        flag = ''
+        if name == 'info' and overhead > args.budget_ms:
+            flag = f"  ❌ over {args.budget_ms:g}ms budget"
+            over.append(name)
+        print(f"{name:<10} {median:>7.1f}ms {low:>7.1f}ms {overhead:>7.1f}ms{flag}", flush=True)
+        for cumulative, module in slowest_imports(name, env, args.imports, baseline) if args.imports else []:
+            print(f"{'':<10}   {cumulative:>7.1f}ms  {module}")
+    return 1 if over else 0
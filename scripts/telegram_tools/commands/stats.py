@@ -0,0 +1,74 @@
+"""
+`stats` subcommand: latency percentiles, throughput, retries and backlog age for telegram_jobs
+"""
+
+import argparse
+import json
+import sys
+
+from ..config import load_config, require
+from ..rest import PostgREST
+from ..stats import collect
+
+
+def fmt_seconds(value):
+    if value is None:
+        return '-'
+    if value < 1:
+        return f"{value * 1000:.0f}ms"
+    if value < 120:
+        return f"{value:.1f}s"
+    if value < 7200:
+        return f"{value / 60:.1f}m"
+    return f"{value / 3600:.1f}h"
+
+
+def print_latency(title, table):
+    print(f"\n{title}")
+    if not table:
+        print("   (no data)")
+        return
+    print(f"   {'type':<18} {'count':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for job_type, s in table.items():
+        print(f"   {job_type:<18} {s['count']:>8} {fmt_seconds(s.get('p50_s')):>8} "
+              f"{fmt_seconds(s.get('p95_s')):>8} {fmt_seconds(s.get('p99_s')):>8} {fmt_seconds(s.get('max_s')):>8}")
+
+
+def print_report(report):
+    print("=" * 60)
+    print(f"📊 TELEGRAM QUEUE — last {report['window_hours']:g}h ({report['jobs']} jobs)")
+    print("=" * 60)
+    counts = report['status_counts']
+    print("\nCurrent queue: " + ', '.join(f"{k} {v}" for k, v in counts.items()))
+    print(f"Oldest pending: {fmt_seconds(report['oldest_pending_age_s'])}")
+    print_latency("⏳ Queue wait (started_at - created_at)", report['queue_wait'])
+    print_latency("⚙️  Processing (completed_at - started_at)", report['processing'])
+    t = report['throughput']
+    print(f"\n🚀 Throughput: {t['completed']} completed, {t['per_minute']} jobs/min avg, "
+          f"{t['peak_per_minute']} jobs/min peak")
+    print("\n🔁 Retries: " + ', '.join(f"{k}×{v}" for k, v in report['retries'].items()))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Latency / throughput report for telegram_jobs")
+    parser.add_argument('--since', type=float, default=24, help="window in hours by created_at (default 24)")
+    parser.add_argument('--type', type=lambda v: v.split(','), help="only these job types")
+    parser.add_argument('--page-size', type=int, default=1000, help="rows per page (default 1000)")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = require(load_config(args.config), 'supabase_url', 'service_key')
+    rest = PostgREST(config['supabase_url'], config['service_key'])
+    progress = None if args.json else (lambda n: print(f"\r   Scanned {n} jobs", end='', file=sys.stderr, flush=True))
+    report = collect(rest, args.since, args.type, args.page_size, progress)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(file=sys.stderr)
+        print_report(report)
+    return 0
@@ -0,0 +1,97 @@
+"""
+`tune` subcommand: measure the webhook route at increasing concurrency and set max_connections at the knee
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from ..config import is_local, load_config, require, webhook_target
+from ..tuner import DEFAULT_STEPS, TELEGRAM_MAX, measure, pick_knee
+from ..webhook import ALLOWED_UPDATES, set_webhook, wait_for_webhook
+
+
+def steps(value):
+    levels = sorted({int(part) for part in value.split(',') if part.strip()})
+    if not levels or levels[0] < 1 or levels[-1] > TELEGRAM_MAX:
+        raise argparse.ArgumentTypeError(f"steps must be within 1..{TELEGRAM_MAX}")
+    return levels
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pick setWebhook max_connections from measured capacity")
+    parser.add_argument('--base', default='http://localhost:3000', help="server to load (default http://localhost:3000)")
+    parser.add_argument('--url', help="full webhook URL to load (overrides --base)")
+    parser.add_argument('--allow-remote', action='store_true', help="allow a non-local load target")
+    parser.add_argument('--steps', type=steps, default=DEFAULT_STEPS,
+                        help="concurrency levels (default 1,2,5,10,20,40,60,80,100)")
+    parser.add_argument('--duration', type=float, default=10, help="seconds per level (default 10)")
+    parser.add_argument('--max-error-rate', type=float, default=0.01, help="error budget per level (default 0.01)")
+    parser.add_argument('--p95-budget', type=float, help="p95 latency budget in seconds")
+    parser.add_argument('--timeout', type=float, default=30, help="per-request timeout in seconds (default 30)")
+    parser.add_argument('--seed', type=int, default=1, help="RNG seed for synthetic updates (default 1)")
+    parser.add_argument('--dry-run', action='store_true', help="don't call setWebhook (it is only called when the "
+                                                                  "measured URL is the configured webhook)")
+    parser.add_argument('--json', action='store_true', help="print the measurements as JSON")
+    parser.add_argument('--config', help="config JSON (default scripts/telegram-config.json)")
+    return parser.parse_args(argv)
+
+
+def print_step(step):
+    p95 = f"{step.p95 * 1000:.0f}ms" if step.p95 is not None else '-'
+    print(f"   {step.concurrency:>4} conn  {step.ok_rps:>8.1f} ok rps  p95 {p95:>8}  "
+          f"errors {step.error_rate:>6.2%}  power {step.power:>8.1f}  {'' if step.valid else '⚠️  over budget'}",
+          flush=True)
+
+
+def apply(config, max_connections):
+    data = set_webhook(config['bot_token'], config['webhook_url'], config.get('secret_token'),
+                       max_connections, drop_pending_updates=False)
+    if not data.get('ok'):
+        print(f"❌ setWebhook failed: {data.get('description')}")
+        return False
+    converged, info, elapsed, _ = wait_for_webhook(config['bot_token'], config['webhook_url'], ALLOWED_UPDATES)
+    applied = (info or {}).get('max_connections')
+    if not converged or applied != max_connections:
+        print(f"⚠️  Webhook reports max_connections={applied} after {elapsed:.2f}s")
+        return False
+    print(f"✅ max_connections={applied} applied to {config['webhook_url']} ({elapsed:.2f}s)")
+    print(f"   Put \"max_connections\": {applied} into the telegram config so later resets keep it")
+    return True
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = load_config(args.config)
+    if not args.dry_run:
+        require(config, 'bot_token', 'webhook_url')
+    url = webhook_target(config['webhook_url'], args.base, args.url)
+    if not is_local(url) and not args.allow_remote:
+        print(f"❌ {url} is not local; pass --allow-remote if you really mean it")
+        return 1
+
+    if not args.json:
+        print(f"🎛️  Tuning max_connections against {url} ({args.duration:g}s per level)")
+    results = asyncio.run(measure(url, config.get('secret_token'), args.steps, args.duration,
+                                  args.max_error_rate, args.p95_budget, args.seed, args.timeout,
+                                  None if args.json else print_step))
+    knee = pick_knee(results)
+    if args.json:
+        json.dump({'steps': [step.as_dict() for step in results],
+                   'max_connections': knee.concurrency if knee else None}, sys.stdout, indent=2)
+        print()
+    if not knee:
+        print("❌ No level stayed within the error/latency budget; max_connections left unchanged")
+        return 1
+    if not args.json:
+        print(f"\n🎯 Knee: {knee.concurrency} connections ({knee.ok_rps:.1f} ok rps, "
+              f"p95 {knee.p95 * 1000:.0f}ms)")
+    if args.dry_run:
+        return 0
+    if url.rstrip('/') != (config.get('webhook_url') or '').rstrip('/'):
+        # a dev server's capacity says nothing about the production webhook
+        print(f"ℹ️  Measured {url}, not the configured webhook {config['webhook_url']}; setWebhook skipped. "
+              f"Suggested max_connections: {knee.concurrency}")
+        return 0
+    return 0 if apply(config, knee.concurrency) else 1
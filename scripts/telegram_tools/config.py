@@ -0,0 +1,130 @@
+"""
+Config loading shared by the Telegram tooling.
+
+Sources, later ones filling gaps only:
+  1. scripts/telegram-config.json ({"telegram": {...}, "supabase": {...}})
+  2. telegram-reset-config.json in the repo root (flat keys)
+  3. environment / .env.local (TELEGRAM_BOT_TOKEN, NEXT_PUBLIC_SUPABASE_URL, ...)
+"""
+
+import json
+import os
+from pathlib import Path
+from urllib.parse import urlsplit
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = SCRIPTS_DIR.parent
+DEFAULT_WEBHOOK_URL = "https://www.icoffio.com/api/telegram-simple/webhook"
+
+CONFIG_FILES = [SCRIPTS_DIR / 'telegram-config.json', REPO_ROOT / 'telegram-reset-config.json']
+# load / enqueue / tune refuse other hosts without --allow-remote
+LOCAL_HOSTS = {'localhost', '127.0.0.1', '::1', '0.0.0.0'}
+
+
+def _from_json(path):
+    with open(path, 'r') as f:
+        return _parse(json.load(f))
+
+
+def _parse(raw):
+    telegram = raw.get('telegram', {})
+    supabase = raw.get('supabase', {})
+    return {
+        'bot_token': telegram.get('bot_token') or raw.get('telegram_bot_token'),
+        'secret_token': telegram.get('secret_token') or raw.get('telegram_secret_token'),
+        'webhook_url': telegram.get('webhook_url') or raw.get('webhook_url'),
+        'max_connections': telegram.get('max_connections') or raw.get('max_connections'),
+        'supabase_url': supabase.get('url') or raw.get('supabase_url'),
+        'service_key': supabase.get('service_role_key') or raw.get('supabase_service_role_key'),
+    }
+
+
+def _from_env(dotenv=True):
+    if dotenv:
+        try:
+            from dotenv import load_dotenv
+            load_dotenv(REPO_ROOT / '.env.local')
+        except ImportError:
+            pass
+    return {
+        'bot_token': os.getenv('TELEGRAM_BOT_TOKEN'),
+        'secret_token': os.getenv('TELEGRAM_SECRET_TOKEN'),
+        'webhook_url': os.getenv('TELEGRAM_WEBHOOK_URL'),
+        'max_connections': int(os.getenv('TELEGRAM_MAX_CONNECTIONS') or 0) or None,
+        'supabase_url': os.getenv('NEXT_PUBLIC_SUPABASE_URL') or os.getenv('SUPABASE_URL'),
+        'service_key': os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('SUPABASE_SERVICE_KEY'),
+    }
+
+
+def load_config(path=None, dotenv=True):
+    """
+    Merged config dict; placeholder values ('YOUR_...') count as missing.
+    dotenv=False skips .env.local (and the python-dotenv import).
+    """
+    sources = [Path(path)] if path else [p for p in CONFIG_FILES if p.exists()]
+    config = {}
+    for layer in [*(_from_json(p) for p in sources), _from_env(dotenv)]:
+        for key, value in layer.items():
+            if value and 'YOUR' not in str(value) and not config.get(key):
+                config[key] = value
+    config.setdefault('webhook_url', DEFAULT_WEBHOOK_URL)
+    return config
+
+
+def load_targets(path=None, only=None):
+    """
+    Reset targets (bots / environments). A config file with
+    {"targets": [{"name": "prod", "telegram": {...}, "supabase": {...}}, ...]}
+    yields one dict per entry, each falling back to the file's top-level
+    values only - never to env, so one bot's token can't leak into another
+    target. Without "targets" the single load_config() result is the only
+    target, named "default". `only` limits the result to those names.
+    """
+    sources = [Path(path)] if path else [p for p in CONFIG_FILES if p.exists()]
+    raw = None
+    for source in sources:
+        with open(source, 'r') as f:
+            data = json.load(f)
+        if data.get('targets'):
+            raw, base_path = data, source
+            break
+    if raw is None:
+        targets = [{'name': 'default', **load_config(path)}]
+    else:
+        base = _from_json(base_path)
+        targets = []
+        for i, entry in enumerate(raw['targets']):
+            target = {'name': entry.get('name') or f"target-{i + 1}"}
+            for key, value in _parse(entry).items():
+                # a placeholder set on the target disables the key rather than inheriting it
+                value = value or base[key]
+                target[key] = value if value and 'YOUR' not in str(value) else None
+            targets.append(target)
+    if only:
+        targets = [t for t in targets if t['name'] in only]
+        unknown = set(only) - {t['name'] for t in targets}
+        if unknown:
+            raise SystemExit(f"❌ Unknown target(s): {', '.join(sorted(unknown))}")
+    return targets
+
+
+def require(config, *keys):
+    """Exit with a readable message if any of `keys` is missing"""
+    missing = [key for key in keys if not config.get(key)]
+    if missing:
+        raise SystemExit(
+            f"❌ Missing config: {', '.join(missing)}\n"
+            f"   Fill scripts/telegram-config.json or set the env vars (see scripts/README_TELEGRAM_RESET.md)"
+        )
+    return config
+
+
+def is_local(url):
+    return urlsplit(url).hostname in LOCAL_HOSTS
+
+
+def webhook_target(webhook_url, base='http://localhost:3000', url=None):
+    """The URL to load: `url` if given, else the configured webhook path on `base`"""
+    if url:
+        return url
+    return base.rstrip('/') + (urlsplit(webhook_url or '').path or '/api/telegram-simple/webhook')
@@ -0,0 +1,185 @@
+"""
+Drain pending Telegram updates into telegram_jobs instead of dropping them.
+
+With the webhook deleted (drop_pending_updates=False) the queued updates
+are pulled through getUpdates, turned into 'telegram-simple' jobs the same
+way app/api/telegram-simple/webhook/route.ts would enqueue them, and
+recorded in telegram_webhook_updates so a later webhook redelivery is
+recognised as a duplicate. Updates that produce no job (commands,
+callback queries, short texts) get no dedup row: getUpdates can't hand
+them back, so the raw copy written with save= is the only way to replay
+them.
+"""
+
+from datetime import datetime, timezone
+import json
+import re
+import time
+
+from .client import get_client, telegram_url
+from .jobs import TABLE as JOBS_TABLE
+from .rest import in_list
+from .webhook import ALLOWED_UPDATES
+
+UPDATES_TABLE = 'telegram_webhook_updates'
+MAX_BATCH_URLS = 5
+MIN_TEXT_LENGTH = 100
+SINGLE_MARKERS = ('#single', '#one', 'one article', 'одна статья', 'jeden artykuł')
+
+_url = re.compile(r'https?://[^\s<>"\')]+', re.I)
+_url_tail = re.compile(r'[),.;!?]+$')
+
+
+class TelegramError(Exception):
+    """Bot API call answered ok=false"""
+
+
+def extract_urls(text):
+    """Same rules as extractUrls() in the webhook route: trimmed, de-duplicated, in order"""
+    urls = (_url_tail.sub('', url).strip() for url in _url.findall(text))
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+def get_updates(bot_token, offset=None, limit=100, http=None, conflict_retries=5):
+    """
+    One getUpdates page (non-blocking). Right after deleteWebhook Telegram
+    can still answer 409 for a moment, so conflicts are retried briefly.
+    """
+    http = http or get_client()
+    payload = {'limit': limit, 'timeout': 0, 'allowed_updates': ALLOWED_UPDATES}
+    if offset is not None:
+        payload['offset'] = offset
+    for attempt in range(conflict_retries + 1):
+        # same offset, same page: safe to retry
+        data = http.post(telegram_url(bot_token, 'getUpdates'), json=payload, retry=True).json()
+        if data.get('ok'):
+            return data['result']
+        if data.get('error_code') != 409 or attempt == conflict_retries:
+            raise TelegramError(f"getUpdates: {data.get('description')}")
+        time.sleep(0.2 * (attempt + 1))
+
+
+def update_row(update):
+    """telegram_webhook_updates row, shaped like the webhook's dedup insert"""
+    callback = update.get('callback_query') or {}
+    message = update.get('message') or {}
+    chat = (callback.get('message') or {}).get('chat') or message.get('chat') or {}
+    user = callback.get('from') or message.get('from') or {}
+    return {
+        'update_id': update['update_id'],
+        'chat_id': chat.get('id'),
+        'user_id': user.get('id'),
+        'update_type': 'callback_query' if callback else 'message',
+        'received_at': datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def update_jobs(update):
+    """
+    telegram-simple job rows for one update, or [] if it isn't a submission
+    (commands, button presses, short texts). Multi-URL messages become one
+    job per URL unless they carry a single-article marker (the per-user
+    combineUrlsAsSingle setting isn't visible from here).
+    """
+    message = update.get('message') or {}
+    text = (message.get('text') or '').strip()
+    if not text or text.startswith('/'):
+        return []
+    urls = extract_urls(text)
+    if not urls and len(text) < MIN_TEXT_LENGTH:
+        return []
+
+    user = message.get('from') or {}
+    base = {
+        'chatId': message['chat']['id'],
+        'userId': user.get('id') or message['chat']['id'],
+        'username': user.get('username'),
+        'firstName': user.get('first_name'),
+        'lastName': user.get('last_name'),
+        'languageCode': user.get('language_code'),
+        'sendProgressMessage': True,
+        'sendResultMessage': True,
+    }
+    base = {key: value for key, value in base.items() if value is not None}
+    if len(urls) <= 1:
+        payloads = [{**base, 'rawText': text}]
+    elif any(marker in text.lower() for marker in SINGLE_MARKERS):
+        payloads = [{**base, 'rawText': text, 'urls': urls[:MAX_BATCH_URLS], 'combineUrlsAsSingle': True}]
+    else:
+        payloads = [{**base, 'rawText': url, 'url': url} for url in urls[:MAX_BATCH_URLS]]
+
+    # deterministic ids, so re-running a half-finished drain can't enqueue twice
+    stamp = int(message.get('date', 0)) * 1000
+    return [{
+        'id': f"simple_{stamp}_u{update['update_id']}" + (f"_{i}" if len(payloads) > 1 else ''),
+        'type': 'telegram-simple',
+        'status': 'pending',
+        'data': payload,
+        'retries': 0,
+        'max_retries': 2,
+    } for i, payload in enumerate(payloads)]
+
+
+def seen_update_ids(rest, update_ids):
+    """Which of update_ids the webhook (or an earlier drain) already recorded"""
+    rows = rest.select(UPDATES_TABLE, 'update_id', [('update_id', in_list(update_ids))])
+    return {row['update_id'] for row in rows}
+
+
+def store_batch(rest, updates):
+    """
+    Enqueue one getUpdates page. Jobs go in before the dedup rows: if we
+    die in between, the rerun sees the update as new again and the job
+    insert is a no-op thanks to the deterministic id. Only updates that
+    were enqueued are recorded; skipped ones stay unmarked so a later
+    replay (e.g. of the save= file) still treats them as new.
+    Returns (duplicates, jobs_inserted, skipped).
+    """
+    seen = seen_update_ids(rest, [u['update_id'] for u in updates])
+    fresh = [u for u in updates if u['update_id'] not in seen]
+    jobs, enqueued = [], []
+    for update in fresh:
+        rows = update_jobs(update)
+        jobs.extend(rows)
+        if rows:
+            enqueued.append(update)
+    if jobs:
+        rest.insert(JOBS_TABLE, jobs, prefer='return=minimal,resolution=ignore-duplicates',
+                    on_conflict='id', retry=True)
+    if enqueued:
+        rest.insert(UPDATES_TABLE, [update_row(u) for u in enqueued],
+                    prefer='return=minimal,resolution=ignore-duplicates', on_conflict='update_id', retry=True)
+    return len(updates) - len(fresh), len(jobs), len(fresh) - len(enqueued)
+
+
+def drain(bot_token, rest, limit=100, save=None, progress=None, http=None):
+    """
+    Pull every pending update and store it; the webhook must already be
+    deleted. The offset only moves past a page once that page is stored
+    (the final empty call confirms the last one), so Telegram keeps
+    anything we failed to persist.
+
+    save: optional text file; every raw update is appended as a JSON line.
+    progress(stats) is called after every page.
+    Returns {'fetched', 'duplicates', 'enqueued', 'skipped', 'offset'}.
+    """
+    stats = {'fetched': 0, 'duplicates': 0, 'enqueued': 0, 'skipped': 0, 'offset': None}
+    offset = None
+    while True:
+        updates = get_updates(bot_token, offset, limit, http)
+        if not updates:
+            break
+        if save:
+            for update in updates:
+                save.write(json.dumps(update, ensure_ascii=False) + '\n')
+            save.flush()
+        duplicates, enqueued, skipped = store_batch(rest, updates)
+        stats['fetched'] += len(updates)
+        stats['duplicates'] += duplicates
+        stats['enqueued'] += enqueued
+        stats['skipped'] += skipped
+        offset = updates[-1]['update_id'] + 1
+        stats['offset'] = offset
+        if progress:
+            progress(stats)
+    return stats
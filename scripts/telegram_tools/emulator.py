@@ -0,0 +1,525 @@
+"""
+Local stand-in for the Telegram Bot API and Supabase PostgREST.
+
+Serves the subset the scripts use, from memory, on one port:
+
+  /bot<token>/setWebhook | deleteWebhook | getWebhookInfo | getUpdates
+  /rest/v1/<table>        GET / HEAD / POST / PATCH / DELETE with eq, neq,
+                          lt, lte, gt, gte, in, is, or=(...)/and(...),
+                          order, limit, offset, Prefer count / return /
+                          resolution, Content-Range totals
+  /rest/v1/rpc/<fn>       always 404 (no SQL functions here)
+  /_emulator/updates      POST a list of updates to queue for getUpdates
+  /_emulator/stats        request and injected-fault counters
+
+Point the scripts at it with TELEGRAM_API_URL=http://127.0.0.1:<port> and
+supabase.url=http://127.0.0.1:<port>. Latency and faults come from a
+seeded RNG, so a run with the same seed and request order is repeatable.
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+import json
+import random
+import re
+import threading
+import time
+
+_bot_path = re.compile(r'^/bot([^/]+)/(\w+)$')
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+# column defaults the real schema fills in on insert
+DEFAULTS = {
+    'telegram_jobs': lambda: {'status': 'pending', 'retries': 0, 'max_retries': 3,
+                              'created_at': _now(), 'updated_at': _now()},
+    'telegram_webhook_updates': lambda: {'received_at': _now()},
+}
+
+
+class Faults:
+    """
+    Latency and failure injection. Each request draws once: with
+    probability `rate` it fails as 429 (with retry_after), 503, or a hang
+    longer than the client's read timeout, weighted by `kinds`.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, rate=0.0, kinds=None, retry_after=1, hang=35.0, seed=1):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate = rate
+        self.kinds = kinds or {'429': 1, '503': 1}
+        self.retry_after = retry_after
+        self.hang = hang
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def draw(self):
+        """(delay_seconds, fault or None)"""
+        with self.lock:
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+            if self.rate and self.rng.random() < self.rate:
+                return delay, self.rng.choices(list(self.kinds), list(self.kinds.values()))[0]
+        return delay, None
+
+
+class Bot:
+    """Webhook state and pending updates for one bot token"""
+
+    def __init__(self):
+        self.url = ''
+        self.allowed_updates = None
+        self.max_connections = 40
+        self.has_secret = False
+        self.apply_at = 0.0
+        self.updates = []
+
+
+class Store:
+    """In-memory tables plus Bot API state, guarded by one lock"""
+
+    def __init__(self, apply_delay=0.0):
+        self.tables = {}
+        self.bots = {}
+        self.apply_delay = apply_delay
+        self.lock = threading.Lock()
+        self.requests = Counter()
+        self.faults = Counter()
+
+    def table(self, name):
+        return self.tables.setdefault(name, [])
+
+    def bot(self, token):
+        return self.bots.setdefault(token, Bot())
+
+
+# --- PostgREST filters ---------------------------------------------------------
+
+def split_top(text, sep=','):
+    """Split on `sep` outside parentheses and double quotes"""
+    parts, depth, quoted, current = [], 0, False, ''
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == '\\' and quoted and i + 1 < len(text):
+            current += text[i:i + 2]
+            i += 2
+            continue
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == '(':
+            depth += 1
+        elif not quoted and ch == ')':
+            depth -= 1
+        if ch == sep and not depth and not quoted:
+            parts.append(current)
+            current = ''
+        else:
+            current += ch
+        i += 1
+    parts.append(current)
+    return parts
+
+
+def unquote_value(value):
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return value
+
+
+_ops = {
+    'eq': lambda a, b: a == b,
+    'neq': lambda a, b: a != b,
+    'lt': lambda a, b: a < b,
+    'lte': lambda a, b: a <= b,
+    'gt': lambda a, b: a > b,
+    'gte': lambda a, b: a >= b,
+}
+
+
+def comparison(op, raw):
+    """Check for one column value, with the filter value parsed once up front"""
+    if op == 'is':
+        return (lambda actual: actual is None) if raw == 'null' else (lambda actual: actual is (raw == 'true'))
+    if op == 'in':
+        values = {unquote_value(v) for v in split_top(raw.strip()[1:-1])}
+        return lambda actual: actual is not None and str(actual) in values
+    if op not in _ops:
+        raise ValueError(f"unsupported operator: {op}")
+    test, text = _ops[op], unquote_value(raw)
+    try:
+        number = float(text)
+    except ValueError:
+        number = None
+
+    def check(actual):
+        if actual is None:
+            return False
+        if isinstance(actual, bool):
+            return test(str(actual).lower(), text)
+        if isinstance(actual, (int, float)) and number is not None:
+            return test(actual, number)
+        return test(str(actual), text)
+    return check
+
+
+def condition(expr):
+    """Predicate for 'col.op.value', 'col.not.op.value', 'or(...)' or 'and(...)'"""
+    for word, combine in (('or', any), ('and', all)):
+        if expr.startswith(word + '('):
+            subs = [condition(part) for part in split_top(expr[len(word) + 1:-1])]
+            return lambda row: combine(sub(row) for sub in subs)
+    column, _, rest = expr.partition('.')
+    negate = rest.startswith('not.')
+    if negate:
+        rest = rest[4:]
+    op, _, value = rest.partition('.')
+    check = comparison(op, value)
+    if op == 'is':
+        return lambda row: check(row.get(column)) != negate
+    # like SQL, NULL never matches a comparison, negated or not
+    return lambda row: row.get(column) is not None and check(row.get(column)) != negate
+
+
+def row_filter(params):
+    """Predicate from query params, ignoring select/order/limit/offset/on_conflict"""
+    checks = []
+    for key, value in params:
+        if key in ('select', 'order', 'limit', 'offset', 'on_conflict', 'columns'):
+            continue
+        if key in ('or', 'and'):
+            checks.append(condition(f"{key}{value}"))
+        else:
+            checks.append(condition(f"{key}.{value}"))
+    return lambda row: all(check(row) for check in checks)
+
+
+def sort_rows(rows, order):
+    for term in reversed(order.split(',')):
+        column, _, direction = term.partition('.')
+        desc = direction.startswith('desc')
+        present = [r for r in rows if r.get(column) is not None]
+        missing = [r for r in rows if r.get(column) is None]
+        present.sort(key=lambda r: r[column], reverse=desc)
+        rows = present + missing if not desc else missing + present
+    return rows
+
+
+def project(row, select):
+    if not select or select == '*':
+        return dict(row)
+    return {column: row.get(column) for column in (c.strip() for c in select.split(','))}
+
+
+def prefer(headers):
+    return {k.strip(): v.strip() for k, _, v in
+            (part.partition('=') for part in headers.get('Prefer', '').split(','))}
+
+
+# --- HTTP ----------------------------------------------------------------------
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    store = None
+    faults = None
+    quiet = True
+
+    def log_message(self, *args):
+        if not self.quiet:
+            super().log_message(*args)
+
+    def send(self, status, body=None, headers=None):
+        data = b'' if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(data)
+
+    def body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'null') if length else None
+
+    def dispatch(self):
+        path = urlsplit(self.path).path
+        route = 'telegram' if path.startswith('/bot') else 'rest' if path.startswith('/rest/') else 'emulator'
+        with self.store.lock:
+            self.store.requests[f"{self.command} {route}"] += 1
+        if route != 'emulator':
+            delay, fault = self.faults.draw()
+            if delay:
+                time.sleep(delay)
+            if fault:
+                with self.store.lock:
+                    self.store.faults[fault] += 1
+                # drain the unread body, or it is parsed as the next request on this keep-alive socket
+                self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                return self.fail(fault, route)
+        try:
+            if route == 'telegram':
+                return self.telegram(path)
+            if route == 'rest':
+                return self.rest(path)
+            return self.emulator(path)
+        except (ValueError, KeyError, TypeError) as e:
+            return self.send(400, {'message': str(e)})
+
+    do_GET = do_POST = do_PATCH = do_DELETE = do_HEAD = dispatch
+
+    def fail(self, fault, route):
+        if fault == 'hang':
+            time.sleep(self.faults.hang)
+            return self.send(504, {'message': 'injected hang'})
+        if fault == '429':
+            wait = self.faults.retry_after
+            body = ({'ok': False, 'error_code': 429, 'description': f'Too Many Requests: retry after {wait}',
+                     'parameters': {'retry_after': wait}} if route == 'telegram' else {'message': 'rate limited'})
+            return self.send(429, body, {'Retry-After': str(wait)})
+        return self.send(int(fault), {'ok': False, 'error_code': int(fault), 'description': 'injected failure'})
+
+    # Bot API
+
+    def telegram(self, path):
+        match = _bot_path.match(path)
+        if not match:
+            return self.send(404, {'ok': False, 'error_code': 404, 'description': 'Not Found'})
+        token, method = match.groups()
+        params = dict(parse_qsl(urlsplit(self.path).query))
+        params.update(self.body() or {})
+        store = self.store
+        with store.lock:
+            bot = store.bot(token)
+            if method == 'getWebhookInfo':
+                applied = time.monotonic() >= bot.apply_at
+                info = {'url': bot.url if applied else '', 'has_custom_certificate': False,
+                        'pending_update_count': len(bot.updates), 'max_connections': bot.max_connections}
+                if applied and bot.allowed_updates:
+                    info['allowed_updates'] = bot.allowed_updates
+                return self.send(200, {'ok': True, 'result': info})
+            if method == 'setWebhook':
+                bot.url = params.get('url', '')
+                bot.allowed_updates = params.get('allowed_updates')
+                bot.max_connections = int(params.get('max_connections', 40))
+                bot.has_secret = bool(params.get('secret_token'))
+                bot.apply_at = time.monotonic() + store.apply_delay
+                if params.get('drop_pending_updates') in (True, 'true'):
+                    bot.updates.clear()
+                return self.send(200, {'ok': True, 'result': True, 'description': 'Webhook was set'})
+            if method == 'deleteWebhook':
+                bot.url = ''
+                bot.apply_at = 0.0
+                if params.get('drop_pending_updates') in (True, 'true'):
+                    bot.updates.clear()
+                return self.send(200, {'ok': True, 'result': True, 'description': 'Webhook was deleted'})
+            if method == 'getUpdates':
+                if bot.url:
+                    return self.send(409, {'ok': False, 'error_code': 409, 'description':
+                                           "Conflict: can't use getUpdates method while webhook is active"})
+                offset = int(params.get('offset') or 0)
+                if offset:
+                    bot.updates = [u for u in bot.updates if u['update_id'] >= offset]
+                limit = min(int(params.get('limit') or 100), 100)
+                return self.send(200, {'ok': True, 'result': bot.updates[:limit]})
+        return self.send(200, {'ok': True, 'result': True})
+
+    # PostgREST
+
+    def rest(self, path):
+        table_name = unquote(path[len('/rest/v1/'):].strip('/'))
+        if table_name.startswith('rpc/'):
+            self.body()  # read the arguments off the keep-alive socket
+            return self.send(404, {'code': 'PGRST202', 'message': f"function {table_name[4:]} not found"})
+        params = parse_qsl(urlsplit(self.path).query, keep_blank_values=True)
+        options = dict(params)
+        prefs = prefer(self.headers)
+        store = self.store
+        with store.lock:
+            rows = store.table(table_name)
+            if self.command == 'POST':
+                return self.insert(table_name, rows, options, prefs)
+            match = row_filter(params)
+            matched = [r for r in rows if match(r)]
+            if self.command == 'DELETE':
+                store.tables[table_name] = [r for r in rows if not match(r)]
+                return self.mutated(matched, prefs, options)
+            if self.command == 'PATCH':
+                values = self.body() or {}
+                for row in matched:
+                    row.update(values)
+                return self.mutated(matched, prefs, options)
+
+            total = len(matched)
+            if options.get('order'):
+                matched = sort_rows(matched, options['order'])
+            offset = int(options.get('offset') or 0)
+            limit = options.get('limit')
+            page = matched[offset:offset + int(limit)] if limit else matched[offset:]
+            counted = str(total) if prefs.get('count') in ('exact', 'planned', 'estimated') else '*'
+            span = f"{offset}-{offset + len(page) - 1}" if page else '*'
+            headers = {'Content-Range': f"{span}/{counted}"}
+            return self.send(200, [project(r, options.get('select')) for r in page], headers)
+
+    def mutated(self, rows, prefs, options):
+        headers = {'Content-Range': f"*/{len(rows)}"} if prefs.get('count') else {}
+        if prefs.get('return') == 'representation':
+            return self.send(200, [project(r, options.get('select')) for r in rows], headers)
+        return self.send(204, None, headers)
+
+    def insert(self, table_name, rows, options, prefs):
+        body = self.body()
+        new = body if isinstance(body, list) else [body]
+        keys = [k.strip() for k in options.get('on_conflict', 'id').split(',')]
+        index = {tuple(r.get(k) for k in keys): r for r in rows}
+        resolution = prefs.get('resolution')
+        defaults = DEFAULTS.get(table_name, dict)
+        inserted = []
+        for row in new:
+            key = tuple(row.get(k) for k in keys)
+            existing = index.get(key) if None not in key else None
+            if existing is not None:
+                if resolution == 'ignore-duplicates':
+                    continue
+                if resolution == 'merge-duplicates':
+                    existing.update(row)
+                    inserted.append(existing)
+                    continue
+                return self.send(409, {'code': '23505', 'message': 'duplicate key value violates unique constraint'})
+            row = {**defaults(), **row}
+            rows.append(row)
+            index[key] = row
+            inserted.append(row)
+        return self.mutated(inserted, prefs, options) if prefs.get('return') == 'representation' \
+            else self.send(201, None, {'Content-Range': f"*/{len(inserted)}"} if prefs.get('count') else {})
+
+    # control plane
+
+    def emulator(self, path):
+        store = self.store
+        with store.lock:
+            if path == '/_emulator/stats':
+                return self.send(200, {
+                    'requests': dict(store.requests),
+                    'faults': dict(store.faults),
+                    'tables': {name: len(rows) for name, rows in store.tables.items()},
+                    'bots': {token[:6]: {'url': b.url, 'pending': len(b.updates)} for token, b in store.bots.items()},
+                })
+            if path == '/_emulator/updates' and self.command == 'POST':
+                token = dict(parse_qsl(urlsplit(self.path).query)).get('token', 'test')
+                bot = store.bot(token)
+                bot.updates.extend(self.body() or [])
+                return self.send(200, {'ok': True, 'pending': len(bot.updates)})
+        return self.send(404, {'message': 'unknown emulator endpoint'})
+
+
+def synthetic_jobs(count, seed=1, now=None, types=('telegram-simple', 'url-parse', 'text-generate')):
+    """telegram_jobs rows spread over the last day with a realistic status mix"""
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    rows = []
+    for i in range(count):
+        created = now - timedelta(seconds=rng.randint(30, 86_400))
+        status = rng.choices(['pending', 'processing', 'completed', 'failed'], [2, 1, 6, 1])[0]
+        started = created + timedelta(seconds=rng.expovariate(1 / 5)) if status != 'pending' else None
+        finished = started + timedelta(seconds=rng.expovariate(1 / 20)) if status in ('completed', 'failed') else None
+        rows.append({
+            'id': f"emu_{i:08d}",
+            'type': rng.choice(types),
+            'status': status,
+            'data': {'chatId': 10_000 + rng.randrange(100), 'text': 'emulated'},
+            'result': None,
+            'error': 'emulated failure' if status == 'failed' else None,
+            'retries': rng.choice([0, 0, 0, 1, 2]),
+            'max_retries': 3,
+            'created_at': created.isoformat(),
+            'started_at': started and started.isoformat(),
+            'completed_at': finished and finished.isoformat(),
+            'updated_at': (finished or started or created).isoformat(),
+        })
+    return rows
+
+
+def synthetic_updates(count, first_id=1, seed=1):
+    """Pending message updates for getUpdates, one per chat rotation"""
+    rng = random.Random(seed)
+    updates = []
+    for update_id in range(first_id, first_id + count):
+        chat = 20_000 + rng.randrange(50)
+        text = rng.choice(['/start', 'https://example.com/a/%d' % update_id, 'x' * 120])
+        updates.append({'update_id': update_id, 'message': {
+            'message_id': update_id, 'date': int(time.time()), 'text': text,
+            'chat': {'id': chat, 'type': 'private'}, 'from': {'id': chat, 'is_bot': False, 'first_name': 'Emu'},
+        }})
+    return updates
+
+
+def synthetic_update_rows(count, days=30, seed=1, now=None):
+    """telegram_webhook_updates rows with received_at spread evenly over the last `days`, oldest first"""
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    step = timedelta(days=days) / max(count, 1)
+    rows = []
+    for i in range(count):
+        chat = 20_000 + rng.randrange(50)
+        rows.append({'update_id': 500_000_000 + i, 'chat_id': chat, 'user_id': chat,
+                     'update_type': rng.choice(['message', 'message', 'callback_query']),
+                     'received_at': (now - step * (count - i)).isoformat()})
+    return rows
+
+
+class Emulator:
+    """
+    The server in a background thread, for tests and benchmarks:
+
+        with Emulator(port=8790, faults=Faults(rate=0.1)) as emu:
+            subprocess.run(['python3', 'scripts/telegram-reset-simple.py',
+                            '--config', 'scripts/telegram-emulator.example.json'],
+                           env={**os.environ, 'TELEGRAM_API_URL': emu.url})
+
+    client.py reads TELEGRAM_API_URL once, when it is first imported, so
+    setting it in this process afterwards has no effect. In-process, start
+    on a fixed port and set the variable before importing anything that
+    talks to Telegram:
+
+        os.environ['TELEGRAM_API_URL'] = 'http://127.0.0.1:8790'
+        with Emulator(port=8790):
+            from telegram_tools.fleet import reset_target
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, faults=None, apply_delay=0.0, quiet=True):
+        self.store = Store(apply_delay)
+        handler = type('EmulatorHandler', (Handler,), {'store': self.store, 'faults': faults or Faults(),
+                                                        'quiet': quiet})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,270 @@
+"""
+Synthetic telegram_jobs for backfills and worker load tests.
+
+Jobs are generated deterministically from a seed (text submissions and
+article URLs with the payload the webhook would queue) and inserted with
+batched PostgREST POSTs, several in flight at once. Arrivals are either a
+burst (a backlog of N jobs, as fast as the inserts go) or a steady stream
+at a target rate with Poisson or uniform gaps; in steady mode a partial
+batch waits at most `linger` seconds, so low rates still show up promptly.
+Insert latency and arrival -> insert lag go into the same log histograms
+as the queue analytics.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from collections import Counter
+import json
+import os
+import random
+import time
+
+from .jobs import TABLE
+from .rest import content_range_total
+from .stats import LogHistogram
+
+KINDS = ('text-generate', 'url-parse')
+DEFAULT_MIX = {'text-generate': 0.7, 'url-parse': 0.3}
+# simple: telegram-simple rows, claimed by /api/telegram-simple/worker
+# queue: text-generate / url-parse rows for QueueService (/api/telegram/process-queue)
+TARGETS = ('simple', 'queue')
+CATEGORIES = ['ai', 'tech', 'apple', 'games', 'news-2']
+LANGUAGES = ['ru', 'en', 'pl', 'uk']
+DOMAINS = ['techcrunch.com', 'theverge.com', 'arstechnica.com', 'wired.com', 'habr.com', 'vc.ru',
+           'engadget.com', '9to5mac.com', 'tomshardware.com', 'bloomberg.com']
+
+_subjects = ('Apple', 'OpenAI', 'Google', 'Samsung', 'Nvidia', 'A startup from Warsaw', 'Microsoft',
+             'The EU regulator', 'Valve', 'Researchers at MIT', 'Anthropic', 'Meta')
+_verbs = ('announced', 'released', 'delayed', 'open-sourced', 'cut prices on', 'published a report on',
+          'is testing', 'acquired a maker of', 'demoed', 'raised funding for')
+_objects = ('a new on-device language model', 'a thinner laptop line', 'its next handheld console',
+            'a battery that charges in ten minutes', 'smart glasses with a display', 'a privacy dashboard',
+            'a chip for local AI inference', 'a cheaper streaming tier', 'a home robot prototype',
+            'an update to its voice assistant')
+_tails = ('Availability starts next month.', 'Prices were not disclosed.', 'Analysts expect a wider rollout.',
+          'The feature ships first in the US and Poland.', 'Early reviews are mixed.',
+          'Developers get access through a public beta.', 'It follows a similar move by competitors.')
+
+
+def _sentence(rng):
+    return f"{rng.choice(_subjects)} {rng.choice(_verbs)} {rng.choice(_objects)}."
+
+
+def _text(rng):
+    """A pasted news snippet, 3-12 sentences (what users send for text-generate)"""
+    parts = [_sentence(rng) if rng.random() < 0.6 else rng.choice(_tails) for _ in range(rng.randint(3, 12))]
+    return ' '.join(parts)
+
+
+def new_run_id():
+    """Timestamp to the millisecond plus a random suffix: two runs never share ids"""
+    now = time.time()
+    return f"{time.strftime('%Y%m%d%H%M%S', time.localtime(now))}{int(now * 1000) % 1000:03d}_{os.urandom(2).hex()}"
+
+
+def _url(rng, n):
+    words = '-'.join(rng.choice(_objects).split()[-3:])
+    return f"https://{rng.choice(DOMAINS)}/{rng.randint(2024, 2026)}/{rng.randint(1, 12):02d}/{words}-{n}"
+
+
+class JobSource:
+    """
+    Deterministic stream of (kind, row). Ids are load_<run>_<n>, so the
+    rows of one run are easy to find and delete; data.synthetic marks them
+    too. notify=False keeps the worker from messaging the fake chats.
+    """
+
+    def __init__(self, mix=None, target='simple', seed=1, chats=50, notify=False, run_id=None):
+        if target not in TARGETS:
+            raise ValueError(f"unknown target: {target}")
+        self.rng = random.Random(seed)
+        mix = mix or DEFAULT_MIX
+        self.kinds, self.weights = list(mix), list(mix.values())
+        self.target = target
+        self.notify = notify
+        self.chats = [10_000_000 + self.rng.randrange(90_000_000) for _ in range(chats)]
+        self.run_id = run_id or new_run_id()
+        self.n = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        rng = self.rng
+        kind = rng.choices(self.kinds, self.weights)[0]
+        chat_id = rng.choice(self.chats)
+        language = rng.choice(LANGUAGES)
+        url = _url(rng, self.n) if kind == 'url-parse' else None
+        if self.target == 'simple':
+            data = {
+                'chatId': chat_id,
+                'userId': chat_id,
+                'username': f"load_user_{chat_id}",
+                'firstName': f"Load{chat_id % 1000}",
+                'languageCode': language,
+                'rawText': url or _text(rng),
+                'sendProgressMessage': self.notify,
+                'sendResultMessage': self.notify,
+                'synthetic': True,
+            }
+            if url:
+                data['url'] = url
+            job_type, max_retries = 'telegram-simple', 2
+        else:
+            data = {'chatId': chat_id, 'messageId': self.n % 1_000_000 + 1, 'category': rng.choice(CATEGORIES),
+                    'language': language, 'synthetic': True}
+            if url:
+                data['url'] = url
+            else:
+                data['text'] = _text(rng)
+                data['title'] = _sentence(rng)[:-1]
+            job_type, max_retries = kind, 3
+        row = {
+            'id': f"load_{self.run_id}_{self.n:08d}",
+            'type': job_type,
+            'status': 'pending',
+            'data': data,
+            'retries': 0,
+            'max_retries': max_retries,
+        }
+        self.n += 1
+        return kind, row
+
+
+class Batch:
+    """Rows serialised once into a JSON array, bounded by row count and body size"""
+
+    def __init__(self, max_rows=500, max_bytes=1 << 20):
+        self.max_rows, self.max_bytes = max_rows, max_bytes
+        self.rows, self.size, self.arrivals = [], 2, []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def fits(self, chunk):
+        return not self.rows or (len(self.rows) < self.max_rows and self.size + len(chunk) + 1 <= self.max_bytes)
+
+    def add(self, chunk, arrival):
+        self.rows.append(chunk)
+        self.size += len(chunk) + 1
+        self.arrivals.append(arrival)
+
+    def take(self):
+        payload, arrivals = b'[' + b','.join(self.rows) + b']', self.arrivals
+        self.rows, self.size, self.arrivals = [], 2, []
+        return payload, arrivals
+
+
+class EnqueueResult:
+    """
+    Insert throughput, request latency and arrival -> insert lag of one run.
+    rows is what PostgREST reports as inserted; rows it ignored as
+    duplicates (ids already in the table) are counted in duplicates.
+    """
+
+    def __init__(self):
+        self.latency = LogHistogram()  # one POST
+        self.lag = LogHistogram()      # job arrival -> its batch acknowledged
+        self.kinds = Counter()
+        self.rows = self.sent = self.duplicates = self.requests = self.bytes = 0
+        self.elapsed = 0.0
+
+    def report(self, rate=None, arrivals=None):
+        elapsed = self.elapsed or None
+        return {
+            'rows': self.rows,
+            'sent': self.sent,
+            'duplicates': self.duplicates,
+            'requests': self.requests,
+            'bytes': self.bytes,
+            'elapsed_s': round(self.elapsed, 3),
+            'offered_rate': rate or None,
+            'arrivals': arrivals if rate else 'burst',
+            'rows_per_s': round(self.rows / elapsed, 1) if elapsed else None,
+            'mb_per_s': round(self.bytes / elapsed / 1e6, 2) if elapsed else None,
+            'rows_per_request': round(self.sent / self.requests, 1) if self.requests else None,
+            'kinds': dict(self.kinds),
+            'request_latency': self.latency.summary(),
+            'lag': self.lag.summary(),
+        }
+
+
+def enqueue(rest, source, count=None, rate=0.0, duration=None, poisson=True, batch_rows=500,
+            batch_bytes=1 << 20, linger=0.25, concurrency=4, seed=1, progress=None):
+    """
+    Insert jobs from `source` until `count` rows or `duration` seconds.
+    rate=0 is a burst; otherwise jobs arrive at `rate`/s (Poisson gaps
+    unless poisson=False) and are flushed when a batch fills or its oldest
+    job has waited `linger` seconds. Up to `concurrency` POSTs in flight.
+    progress(result) is called about once per second. Returns an EnqueueResult.
+    """
+    if count is None and duration is None:
+        raise ValueError("give count or duration")
+    result = EnqueueResult()
+    rng = random.Random(f"{seed}:arrivals")
+    batch = Batch(batch_rows, batch_bytes)
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    started = time.perf_counter()
+    reported = started
+
+    def post(payload, arrivals):
+        sent = time.perf_counter()
+        response = rest.insert(TABLE, payload, prefer='return=minimal,resolution=ignore-duplicates,count=exact',
+                               on_conflict='id', retry=True)  # ids are fixed, so a retried POST can't double-insert
+        return payload, arrivals, content_range_total(response), sent, time.perf_counter()
+
+    def collect(futures):
+        for future in futures:
+            payload, arrivals, inserted, sent, acked = future.result()
+            inserted = len(arrivals) if inserted is None else inserted
+            result.rows += inserted
+            result.sent += len(arrivals)
+            result.duplicates += len(arrivals) - inserted
+            result.requests += 1
+            result.bytes += len(payload)
+            result.latency.add(acked - sent)
+            for arrival in arrivals:
+                result.lag.add(acked - arrival)
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        inflight = set()
+
+        def flush():
+            nonlocal inflight
+            if not batch:
+                return
+            while len(inflight) >= concurrency:
+                done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                collect(done)
+            inflight.add(pool.submit(post, *batch.take()))
+
+        i = 0
+        arrival = started
+        while count is None or i < count:
+            if rate:
+                arrival += rng.expovariate(rate) if poisson else 1 / rate
+                if batch and batch.arrivals[0] + linger < arrival:
+                    time.sleep(max(0.0, batch.arrivals[0] + linger - time.perf_counter()))
+                    flush()
+                time.sleep(max(0.0, arrival - time.perf_counter()))
+            else:
+                arrival = time.perf_counter()
+            now = time.perf_counter()
+            if duration is not None and now - started >= duration:
+                break
+            kind, row = next(source)
+            chunk = dumps(row).encode('utf-8')
+            if not batch.fits(chunk):
+                flush()
+            batch.add(chunk, arrival)
+            result.kinds[kind] += 1
+            i += 1
+            if progress and now - reported >= 1.0:
+                done, inflight = wait(inflight, timeout=0)
+                collect(done)
+                result.elapsed = now - started
+                progress(result)
+                reported = now
+        flush()
+        collect(inflight)
+    result.elapsed = time.perf_counter() - started
+    return result
@@ -0,0 +1,156 @@
+"""
+Concurrent reset of several bots / environments.
+
+Every target runs the same reset as telegram-reset-simple.py (delete the
+webhook, then purge the queue while the webhook is set and verified) in
+its own worker thread, so a fleet-wide rotation takes as long as the
+slowest target.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import time
+
+from .client import HttpClient, telegram_url
+from .jobs import TABLE, count_jobs, purge_jobs
+from .rest import PostgREST
+from .steps import run_steps
+from .trace import maybe_phase
+from .webhook import ALLOWED_UPDATES, delete_webhook, set_webhook, wait_for_webhook
+
+REQUIRED = ('bot_token', 'webhook_url')
+# covers the whole-second Date header and the round trip in server_cutoff()
+CUTOFF_MARGIN = timedelta(seconds=1)
+
+
+def purge_queue(rest, before=None):
+    """Delete jobs created before `before` (all if None), then count what's left: (deleted, remaining)"""
+    return purge_jobs(rest, before=before), count_jobs(rest, before=before)
+
+
+def server_cutoff(rest, stopped):
+    """
+    `stopped` (our clock) on the database's clock, minus CUTOFF_MARGIN, as
+    ISO. created_at is set by the server, so a local clock running ahead
+    would otherwise purge jobs enqueued after delivery stopped.
+    """
+    offset = rest.clock_offset(TABLE)
+    return (stopped + timedelta(seconds=offset or 0) - CUTOFF_MARGIN).isoformat()
+
+
+def preflight(token, rest, http):
+    """
+    Bot token / Supabase sanity checks; returns the last delivery error
+    Telegram reports (if any) and the queue size the purge starts from
+    """
+    data = http.get(telegram_url(token, 'getWebhookInfo')).json()
+    if not data.get('ok'):
+        raise RuntimeError(f"getWebhookInfo: {data.get('description')}")
+    return {'last_error': data['result'].get('last_error_message'),
+            'jobs': count_jobs(rest) if rest else None}
+
+
+def reset_target(target, http, purge=True, progress=None, trace=None, drop_pending_updates=True):
+    """
+    Reset one target; never raises. Returns a result dict with ok, error,
+    deleted, remaining, polls, preflight, the last getWebhookInfo result
+    and per-step timings in seconds. progress(step, seconds) is called
+    after every step that succeeded; with a trace.Trace every step is also
+    recorded as a phase.
+
+    deleteWebhook runs first, so the old webhook stops delivering. Then
+    pre-flight -> purge and setWebhook -> verify run concurrently
+    (steps.run_steps). The purge only takes jobs created before delivery
+    stopped (on the database clock), so nothing the re-armed webhook
+    enqueues meanwhile is lost.
+    drop_pending_updates=False keeps the updates Telegram has queued; they
+    are delivered to the re-armed webhook.
+    """
+    result = {'name': target['name'], 'ok': False, 'error': None, 'deleted': None, 'remaining': None,
+              'polls': 0, 'preflight': None, 'webhook': None, 'timings': {}}
+    started = time.monotonic()
+    values = {}
+
+    def step(name, fn, *args, **kwargs):
+        def run():
+            t0 = time.monotonic()
+            try:
+                with maybe_phase(trace, name, target['name']):
+                    values[name] = fn(*args, **kwargs)
+            finally:
+                result['timings'][name] = time.monotonic() - t0
+            if progress:
+                progress(name, result['timings'][name])
+            return values[name]
+        return run
+
+    def stop_delivery():
+        data = delete_webhook(token, drop_pending_updates, http=http)
+        if not data.get('ok'):
+            raise RuntimeError(f"deleteWebhook: {data.get('description')}")
+        return datetime.now(timezone.utc)
+
+    def rearm():
+        data = set_webhook(token, target['webhook_url'], target.get('secret_token'),
+                           target.get('max_connections') or 40, drop_pending_updates=drop_pending_updates,
+                           http=http)
+        if not data.get('ok'):
+            raise RuntimeError(f"setWebhook: {data.get('description')}")
+
+    def verify():
+        converged, result['webhook'], _, result['polls'] = wait_for_webhook(
+            token, target['webhook_url'], ALLOWED_UPDATES, http=http)
+        if not converged:
+            raise RuntimeError("webhook did not converge")
+
+    try:
+        missing = [key for key in REQUIRED if not target.get(key)]
+        if missing:
+            raise ValueError(f"missing {', '.join(missing)}")
+        token = target['bot_token']
+        rest = None
+        if target.get('supabase_url') and target.get('service_key'):
+            rest = PostgREST(target['supabase_url'], target['service_key'], http)
+
+        plan = {
+            'delete': (step('delete', stop_delivery), []),
+            'preflight': (step('preflight', preflight, token, rest, http), ['delete']),
+            'set': (step('set', rearm), ['delete']),
+            'verify': (step('verify', verify), ['set']),
+        }
+        if purge and rest:
+            # after preflight, so its "queue before reset" count isn't taken mid-purge
+            plan['purge'] = (step('purge', lambda: purge_queue(rest, server_cutoff(rest, values['delete']))),
+                             ['delete', 'preflight'])
+        try:
+            run_steps(plan)
+        finally:
+            result['preflight'] = values.get('preflight')
+            if 'purge' in values:
+                result['deleted'], result['remaining'] = values['purge']
+        result['ok'] = True
+    except Exception as e:
+        result['error'] = str(e)
+    result['timings']['total'] = time.monotonic() - started
+    return result
+
+
+def reset_all(targets, workers=8, purge=True, trace=None):
+    """
+    Reset targets concurrently on a bounded thread pool; results come back
+    in config order. Targets sharing a Supabase project purge it only once.
+    """
+    purged = set()
+    plan = []
+    for target in targets:
+        project = (target.get('supabase_url') or '').rstrip('/')
+        plan.append((target, purge and project not in purged))
+        purged.add(project)
+
+    workers = max(1, min(workers, len(targets)))
+    # one keep-alive pool per host, wide enough for every worker at once
+    with HttpClient(pool_size=max(10, workers)) as http, ThreadPoolExecutor(workers) as pool:
+        if trace:
+            trace.attach(http)
+        futures = [pool.submit(reset_target, target, http, do_purge, trace=trace) for target, do_purge in plan]
+        return [future.result() for future in futures]
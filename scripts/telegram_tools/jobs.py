@@ -0,0 +1,99 @@
+"""
+Batched operations on the telegram_jobs queue.
+"""
+
+import time
+
+from .rest import in_chunks, in_list
+
+TABLE = 'telegram_jobs'
+STATUSES = ('pending', 'processing', 'completed', 'failed')
+
+
+def job_filters(statuses=None, types=None, before=None):
+    """PostgREST filters; status/type use idx_jobs_status / idx_jobs_type"""
+    filters = []
+    if statuses:
+        filters.append(('status', in_list(statuses)))
+    if types:
+        filters.append(('type', in_list(types)))
+    if before:
+        filters.append(('created_at', f"lt.{before}"))
+    return filters
+
+
+def keyset_filter(last):
+    """Rows strictly after (created_at, id) of the last row seen"""
+    if not last:
+        return []
+    created_at, job_id = last
+    quoted = '"%s"' % job_id.replace('"', '\\"')
+    return [('or', f'(created_at.gt."{created_at}",and(created_at.eq."{created_at}",id.gt.{quoted}))')]
+
+
+def iter_pages(rest, filters=(), columns='*', page_size=500):
+    """
+    Pages of matching jobs oldest-first, keyset-paginated on (created_at, id):
+    every page is an index range scan, however deep, and rows deleted by the
+    caller between pages don't shift the cursor.
+    """
+    last = None
+    while True:
+        page = rest.select(TABLE, columns, [*filters, *keyset_filter(last)],
+                           order='created_at.asc,id.asc', limit=page_size)
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        last = (page[-1]['created_at'], page[-1]['id'])
+
+
+def count_jobs(rest, statuses=None, types=None, before=None):
+    """Exact count without downloading rows"""
+    return rest.count(TABLE, job_filters(statuses, types, before))
+
+
+def purge_jobs(rest, statuses=None, types=None, before=None, batch_size=500, progress=None):
+    """
+    Delete matching jobs oldest-first in bounded batches: select a page of
+    ids ordered by (created_at, id), delete exactly those ids, repeat.
+    Each request touches at most batch_size rows, so nothing times out or
+    holds locks on the whole table; long ids are deleted in several
+    requests so the in.() URL stays under proxy limits (rest.in_chunks).
+
+    progress(deleted, total, elapsed) is called after every batch.
+    Returns the number of deleted rows.
+    """
+    filters = job_filters(statuses, types, before)
+    total = rest.count(TABLE, filters)
+    started = time.monotonic()
+    deleted = 0
+    if progress:
+        progress(deleted, total, 0.0)
+    while True:
+        rows = rest.select(TABLE, 'id', filters, order='created_at.asc,id.asc', limit=batch_size)
+        if not rows:
+            break
+        removed = 0
+        for ids in in_chunks(row['id'] for row in rows):
+            count = rest.delete(TABLE, [('id', in_list(ids))])
+            removed += len(ids) if count is None else count
+        if removed == 0:
+            # nothing went away (RLS / concurrent worker) — don't spin forever
+            break
+        deleted += removed
+        if progress:
+            progress(deleted, total, time.monotonic() - started)
+        if len(rows) < batch_size:
+            break
+    return deleted
+
+
+def print_progress(prefix='   '):
+    """progress callback rewriting one 'Deleted n/total (rows/s)' line; caller ends it"""
+    def report(done, total, elapsed):
+        rate = done / elapsed if elapsed else 0
+        of = f"/{total}" if total is not None else ''
+        print(f"\r{prefix}Deleted {done}{of} ({rate:.0f} rows/s)", end='', flush=True)
+    return report
@@ -0,0 +1,281 @@
+"""
+Synthetic Telegram update traffic for load-testing the webhook route.
+
+Updates are generated deterministically from a seed and POSTed by an
+asyncio client at a fixed arrival rate (open loop: requests are scheduled
+by the clock, not by the previous response, so a slow server shows up as
+latency instead of silently lowering the offered load). Latency is
+measured from the scheduled send time and kept in the same log histograms
+as the queue analytics.
+"""
+
+from collections import Counter
+from urllib.parse import urlsplit
+import asyncio
+import json
+import random
+import ssl
+import time
+
+from .stats import LogHistogram
+
+COMMANDS = ['/start', '/help', '/settings', '/queue', '/language', '/style']
+CALLBACKS = ['lang:menu', 'lang:ru', 'lang:en', 'lang:pl', 'actions:menu', 'reload:stale']
+LANGUAGES = ['ru', 'en', 'pl', 'uk']
+DEFAULT_MIX = {'command': 0.5, 'callback_query': 0.3, 'text': 0.1, 'url': 0.1}
+
+_words = ('AI machine learning model data cloud startup security privacy chip network '
+          'robotics research market product team platform energy battery launch release').split()
+
+
+def _text(rng, words):
+    return ' '.join(rng.choice(_words) for _ in range(words)).capitalize() + '.'
+
+
+def synth_update(update_id, kind, rng, chat_id):
+    """One Telegram update of the given kind, shaped like what the Bot API sends"""
+    user = {
+        'id': chat_id,
+        'is_bot': False,
+        'first_name': f"Load{chat_id % 1000}",
+        'username': f"load_user_{chat_id}",
+        'language_code': rng.choice(LANGUAGES),
+    }
+    message = {
+        'message_id': update_id % 1_000_000,
+        'from': user,
+        'chat': {'id': chat_id, 'type': 'private', 'first_name': user['first_name']},
+        'date': int(time.time()),
+    }
+    if kind == 'callback_query':
+        return {'update_id': update_id, 'callback_query': {
+            'id': str(update_id),
+            'from': user,
+            'message': {**message, 'from': {'id': 0, 'is_bot': True, 'first_name': 'bot'}, 'text': 'menu'},
+            'chat_instance': str(chat_id),
+            'data': rng.choice(CALLBACKS),
+        }}
+    if kind == 'command':
+        message['text'] = rng.choice(COMMANDS)
+        message['entities'] = [{'type': 'bot_command', 'offset': 0, 'length': len(message['text'])}]
+    elif kind == 'url':
+        message['text'] = f"https://example.com/news/{update_id}-{rng.choice(_words)}"
+    else:
+        message['text'] = _text(rng, rng.randint(25, 60))
+    return {'update_id': update_id, 'message': message}
+
+
+class UpdateSource:
+    """
+    Deterministic stream of (update_id, body, kind, duplicate). With
+    duplicates=p a fraction p of requests re-send an update_id already
+    sent (same body), which the route must recognise and skip.
+    """
+
+    def __init__(self, mix=None, duplicates=0.0, seed=1, chats=50, first_id=None):
+        self.rng = random.Random(seed)
+        mix = mix or DEFAULT_MIX
+        self.kinds, self.weights = list(mix), list(mix.values())
+        self.duplicates = duplicates
+        self.chats = [10_000_000 + self.rng.randrange(90_000_000) for _ in range(chats)]
+        # far above real update_ids, so test rows are easy to spot and purge
+        self.next_id = first_id if first_id is not None else 900_000_000_000 + seed * 10_000_000
+        self.recent = []
+
+    def __next__(self):
+        if self.recent and self.rng.random() < self.duplicates:
+            update_id, body, kind = self.rng.choice(self.recent)
+            return update_id, body, kind, True
+        kind = self.rng.choices(self.kinds, self.weights)[0]
+        update_id = self.next_id
+        self.next_id += 1
+        body = json.dumps(synth_update(update_id, kind, self.rng, self.rng.choice(self.chats))).encode()
+        self.recent.append((update_id, body, kind))
+        if len(self.recent) > 1000:
+            self.recent.pop(0)
+        return update_id, body, kind, False
+
+
+class Connection:
+    """Minimal keep-alive HTTP/1.1 POST client on asyncio streams (no third-party deps)"""
+
+    def __init__(self, url, headers=None):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.ssl = ssl.create_default_context() if parts.scheme == 'https' else None
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        host = parts.netloc.rpartition('@')[2]
+        self.head = ''.join(f"{k}: {v}\r\n" for k, v in {
+            'Host': host, 'Content-Type': 'application/json', 'Connection': 'keep-alive', **(headers or {}),
+        }.items())
+        self.reader = self.writer = None
+        self.opened = 0
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = self.writer = None
+
+    async def post(self, body):
+        """(status, response body); a stale keep-alive socket is reopened once"""
+        for attempt in (0, 1):
+            fresh = self.writer is None
+            if fresh:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+                self.opened += 1
+            try:
+                self.writer.write(f"POST {self.path} HTTP/1.1\r\n{self.head}"
+                                  f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+                await self.writer.drain()
+                return await self._response()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if fresh or attempt:
+                    raise
+
+    async def _response(self):
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("server closed the connection")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if 'content-length' in headers:
+            body = await self.reader.readexactly(int(headers['content-length']))
+        elif headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = b''
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if not size:
+                    break
+                body += chunk[:-2]
+        else:
+            body = await self.reader.read()
+            headers['connection'] = 'close'
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, body
+
+
+class LoadResult:
+    """Latency histograms, status / error counters and throughput of one run"""
+
+    def __init__(self):
+        self.response = LogHistogram()   # scheduled send -> response (includes queueing)
+        self.service = LogHistogram()    # actual send -> response
+        self.by_kind = {}
+        self.statuses = Counter()
+        self.errors = Counter()
+        self.sent = 0
+        self.duplicates = 0
+        self.elapsed = 0.0
+        self.connections = 0
+
+    def record(self, kind, duplicate, scheduled, started, status=None, error=None):
+        now = time.perf_counter()
+        self.sent += 1
+        self.duplicates += duplicate
+        if error:
+            self.errors[error] += 1
+            return
+        self.statuses[status] += 1
+        if status >= 400:
+            self.errors[f"http_{status}"] += 1
+        self.response.add(now - scheduled)
+        self.service.add(now - started)
+        self.by_kind.setdefault(kind, LogHistogram()).add(now - scheduled)
+
+    def report(self, offered_rps=None):
+        failed = sum(self.errors.values())
+        return {
+            'requests': self.sent,
+            'duplicates_sent': self.duplicates,
+            'elapsed_s': round(self.elapsed, 3),
+            'offered_rps': offered_rps,
+            'achieved_rps': round(self.sent / self.elapsed, 1) if self.elapsed else None,
+            'ok_rps': round((self.sent - failed) / self.elapsed, 1) if self.elapsed else None,
+            'error_rate': round(failed / self.sent, 4) if self.sent else None,
+            'statuses': {str(k): v for k, v in sorted(self.statuses.items())},
+            'errors': dict(self.errors.most_common()),
+            'connections_opened': self.connections,
+            'latency': self.response.summary(),
+            'service_time': self.service.summary(),
+            'latency_by_kind': {k: h.summary() for k, h in sorted(self.by_kind.items())},
+        }
+
+
+async def run_load(url, secret_token=None, rps=50.0, concurrency=40, duration=30.0,
+                   requests=None, source=None, timeout=30.0, progress=None):
+    """
+    Offer `rps` requests/second (0 = as fast as `concurrency` allows) for
+    `duration` seconds or `requests` requests, whichever ends first.
+    progress(result) is called about once per second. Returns a LoadResult.
+    """
+    source = source or UpdateSource()
+    headers = {'X-Telegram-Bot-Api-Secret-Token': secret_token} if secret_token else {}
+    result = LoadResult()
+    queue = asyncio.Queue(maxsize=0 if rps else concurrency)
+    connections = [Connection(url, headers) for _ in range(concurrency)]
+    started = time.perf_counter()
+
+    async def worker(conn):
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            scheduled, (_, body, kind, duplicate) = item
+            sent_at = time.perf_counter()
+            try:
+                status, _ = await asyncio.wait_for(conn.post(body), timeout)
+                result.record(kind, duplicate, scheduled, sent_at, status=status)
+            except asyncio.TimeoutError:
+                await conn.close()
+                result.record(kind, duplicate, scheduled, sent_at, error='timeout')
+            except (OSError, EOFError, ValueError) as e:
+                await conn.close()
+                result.record(kind, duplicate, scheduled, sent_at, error=type(e).__name__)
+
+    async def reporter():
+        while True:
+            await asyncio.sleep(1.0)
+            result.elapsed = time.perf_counter() - started
+            progress(result)
+
+    workers = [asyncio.create_task(worker(conn)) for conn in connections]
+    ticker = asyncio.create_task(reporter()) if progress else None
+    try:
+        i = 0
+        while (requests is None or i < requests) and time.perf_counter() - started < duration:
+            if rps:
+                scheduled = started + i / rps
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                scheduled = time.perf_counter()
+            await queue.put((scheduled, next(source)))
+            i += 1
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        if ticker:
+            ticker.cancel()
+        for task in workers:
+            task.cancel()
+        for conn in connections:
+            result.connections += conn.opened
+            await conn.close()
+    result.elapsed = time.perf_counter() - started
+    return result
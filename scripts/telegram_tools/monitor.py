@@ -0,0 +1,226 @@
+"""
+Webhook / queue health monitor.
+
+Polls getWebhookInfo and telegram_jobs status counts on an interval, keeps
+the samples of the last `window` seconds in memory and renders them as
+Prometheus text exposition for a /metrics endpoint.
+"""
+
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+
+from .client import telegram_url
+from .jobs import STATUSES, count_jobs
+from .stats import oldest_pending_age
+
+
+def sample_value(value):
+    """Exact exposition value: ints as ints, floats at full precision (:g would round 1792198765 to 1.7922e+09)"""
+    if isinstance(value, int):
+        return f"{value:d}"
+    return repr(float(value))
+
+
+class Sample:
+    """One poll: webhook info + queue counts (None where a call failed)"""
+
+    __slots__ = ('at', 'webhook', 'jobs', 'oldest_pending', 'duration', 'error')
+
+    def __init__(self, at):
+        self.at = at
+        self.webhook = None
+        self.jobs = None
+        self.oldest_pending = None
+        self.duration = 0.0
+        self.error = None
+
+
+class Monitor:
+    """Rolling window of samples plus the counters /metrics needs"""
+
+    def __init__(self, config, rest, http, window=300.0):
+        self.config = config
+        self.rest = rest
+        self.http = http
+        self.window = window
+        self.samples = deque()
+        self.lock = threading.Lock()
+        self.polls = 0
+        self.poll_errors = 0
+        self.delivery_errors = 0
+        self.resets = 0
+        self.last_error_date = None
+
+    def poll(self):
+        sample = Sample(time.time())
+        started = time.monotonic()
+        errors = []
+        try:
+            data = self.http.get(telegram_url(self.config['bot_token'], 'getWebhookInfo')).json()
+            if data.get('ok'):
+                sample.webhook = data['result']
+            else:
+                errors.append(f"getWebhookInfo: {data.get('description')}")
+        except Exception as e:
+            errors.append(f"getWebhookInfo: {e}")
+        if self.rest:
+            try:
+                sample.jobs = {status: count_jobs(self.rest, [status]) for status in STATUSES}
+                sample.oldest_pending = oldest_pending_age(self.rest)
+            except Exception as e:
+                errors.append(f"telegram_jobs: {e}")
+        sample.duration = time.monotonic() - started
+        sample.error = '; '.join(errors) or None
+        self.add(sample)
+        return sample
+
+    def add(self, sample):
+        with self.lock:
+            self.polls += 1
+            self.poll_errors += bool(sample.error)
+            error_date = (sample.webhook or {}).get('last_error_date')
+            if error_date and error_date != self.last_error_date:
+                # a new delivery failure since the previous poll
+                if self.last_error_date is not None:
+                    self.delivery_errors += 1
+                self.last_error_date = error_date
+            self.samples.append(sample)
+            while self.samples and self.samples[0].at < sample.at - self.window:
+                self.samples.popleft()
+
+    def window_stats(self):
+        """Aggregates over the samples currently in the window"""
+        with self.lock:
+            samples = list(self.samples)
+        pending = [s.webhook.get('pending_update_count', 0) for s in samples if s.webhook]
+        backlog = [(s.at, s.jobs['pending']) for s in samples if s.jobs and s.jobs['pending'] is not None]
+        error_dates = {s.webhook.get('last_error_date') for s in samples if s.webhook}
+        cutoff = samples[-1].at - self.window if samples else 0
+        growth = None
+        if len(backlog) >= 2 and backlog[-1][0] > backlog[0][0]:
+            growth = (backlog[-1][1] - backlog[0][1]) / (backlog[-1][0] - backlog[0][0]) * 60
+        return {
+            'samples': len(samples),
+            'pending_updates_avg': sum(pending) / len(pending) if pending else None,
+            'pending_updates_max': max(pending, default=None),
+            'delivery_errors': sum(1 for d in error_dates if d and d >= cutoff),
+            'poll_error_ratio': sum(1 for s in samples if s.error) / len(samples) if samples else None,
+            'backlog_growth_per_min': growth,
+        }
+
+    def latest(self):
+        with self.lock:
+            return self.samples[-1] if self.samples else None
+
+    def metrics(self):
+        """Prometheus text exposition format"""
+        sample = self.latest()
+        stats = self.window_stats()
+        window = f'window="{int(self.window)}s"'
+        lines = []
+
+        def metric(name, kind, help_text, values):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in values:
+                if value is not None:
+                    lines.append(f"{name}{{{labels}}} {sample_value(value)}" if labels
+                                 else f"{name} {sample_value(value)}")
+
+        info = (sample.webhook if sample else None) or {}
+        expected = self.config.get('webhook_url')
+        metric('telegram_webhook_up', 'gauge', "1 if getWebhookInfo points at the configured URL",
+               [('', float(bool(info) and info.get('url') == expected)) if sample else ('', None)])
+        metric('telegram_webhook_pending_updates', 'gauge', "Updates Telegram has not delivered yet",
+               [('', info.get('pending_update_count')), (window, stats['pending_updates_avg'])])
+        metric('telegram_webhook_pending_updates_max', 'gauge', "Max pending updates in the window",
+               [(window, stats['pending_updates_max'])])
+        metric('telegram_webhook_max_connections', 'gauge', "setWebhook max_connections",
+               [('', info.get('max_connections'))])
+        metric('telegram_webhook_last_error_timestamp_seconds', 'gauge', "Last delivery error reported by Telegram",
+               [('', info.get('last_error_date'))])
+        metric('telegram_webhook_delivery_errors', 'gauge', "Distinct delivery errors seen in the window",
+               [(window, stats['delivery_errors'])])
+        metric('telegram_webhook_delivery_errors_total', 'counter', "Delivery errors seen since start",
+               [('', self.delivery_errors)])
+        jobs = (sample.jobs if sample else None) or {}
+        metric('telegram_jobs', 'gauge', "telegram_jobs rows by status",
+               [(f'status="{status}"', count) for status, count in jobs.items()])
+        metric('telegram_jobs_oldest_pending_age_seconds', 'gauge', "Age of the oldest pending job",
+               [('', sample.oldest_pending if sample else None)])
+        metric('telegram_jobs_backlog_growth_per_minute', 'gauge', "Change of pending jobs per minute",
+               [(window, stats['backlog_growth_per_min'])])
+        metric('telegram_monitor_poll_error_ratio', 'gauge', "Share of failed polls in the window",
+               [(window, stats['poll_error_ratio'])])
+        metric('telegram_monitor_polls_total', 'counter', "Polls since start", [('', self.polls)])
+        metric('telegram_monitor_poll_errors_total', 'counter', "Failed polls since start", [('', self.poll_errors)])
+        metric('telegram_monitor_poll_duration_seconds', 'gauge', "Duration of the last poll",
+               [('', sample.duration if sample else None)])
+        metric('telegram_monitor_resets_total', 'counter', "Resets triggered by the monitor", [('', self.resets)])
+        return '\n'.join(lines) + '\n'
+
+
+class BacklogTrigger:
+    """
+    Fires once backlog stays above a threshold for `sustain` consecutive
+    polls, then waits `cooldown` seconds before it can fire again.
+    """
+
+    def __init__(self, pending_updates=None, pending_jobs=None, sustain=3, cooldown=600.0):
+        self.pending_updates = pending_updates
+        self.pending_jobs = pending_jobs
+        self.sustain = sustain
+        self.cooldown = cooldown
+        self.streak = 0
+        self.fired_at = None
+
+    def reason(self, sample):
+        updates = (sample.webhook or {}).get('pending_update_count')
+        jobs = (sample.jobs or {}).get('pending')
+        if self.pending_updates is not None and updates is not None and updates >= self.pending_updates:
+            return f"pending_update_count {updates} >= {self.pending_updates}"
+        if self.pending_jobs is not None and jobs is not None and jobs >= self.pending_jobs:
+            return f"pending jobs {jobs} >= {self.pending_jobs}"
+        return None
+
+    def check(self, sample, now=None):
+        """Reason string when a reset should run now, else None"""
+        now = now or time.monotonic()
+        reason = self.reason(sample)
+        self.streak = self.streak + 1 if reason else 0
+        if not reason or self.streak < self.sustain:
+            return None
+        if self.fired_at is not None and now - self.fired_at < self.cooldown:
+            return None
+        self.fired_at = now
+        self.streak = 0
+        return reason
+
+
+def serve_metrics(monitor, host='127.0.0.1', port=9464):
+    """Start /metrics (and /healthz) in a daemon thread; returns the server"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split('?')[0] == '/metrics':
+                body, kind = monitor.metrics().encode(), 'text/plain; version=0.0.4; charset=utf-8'
+            elif self.path == '/healthz':
+                body, kind = b'ok\n', 'text/plain'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', kind)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,103 @@
+"""
+Recovery of telegram_jobs stuck in 'processing' after a worker died.
+
+Same rules as the cleanup in lib/queue-service.ts, but by started_at and
+in batches: a job whose lease expired goes back to 'pending' with
+retries + 1, or to 'failed' once retries reached max_retries.
+"""
+
+from datetime import datetime, timedelta, timezone
+import time
+
+from .jobs import TABLE, iter_pages, job_filters
+from .rest import in_chunks, in_list
+
+DEFAULT_MAX_RETRIES = 3
+
+
+def stuck_filters(lease_seconds, types=None, now=None):
+    """'processing' jobs whose started_at is older than the lease"""
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(seconds=lease_seconds)
+    return [*job_filters(['processing'], types), ('started_at', f"lt.{cutoff.isoformat()}")]
+
+
+def plan(rows):
+    """
+    Group a page of stuck rows by (retries, exhausted). PostgREST PATCH
+    can't compute retries + 1 server-side, so every group is one PATCH
+    with a literal new value, guarded by retries=eq.<old>. NULL retries
+    count as 0 but keep their own group (retries None): eq.0 never
+    matches NULL, so they need the is.null guard.
+    """
+    groups = {}
+    for row in rows:
+        retries = row.get('retries')
+        exhausted = (retries or 0) >= (row.get('max_retries') or DEFAULT_MAX_RETRIES)
+        groups.setdefault((retries, exhausted), []).append(row['id'])
+    return groups
+
+
+def retries_guard(retries):
+    """The retries filter of a plan() group"""
+    return ('retries', 'is.null' if retries is None else f"eq.{retries}")
+
+
+def requeue_values(retries, exhausted, now):
+    retries = retries or 0
+    if exhausted:
+        return {
+            'status': 'failed',
+            'error': f"Job timeout after {retries} retries",
+            'completed_at': now,
+            'updated_at': now,
+        }
+    return {
+        'status': 'pending',
+        'retries': retries + 1,
+        'started_at': None,
+        'error': 'Job stuck in processing, resetting for retry',
+        'updated_at': now,
+    }
+
+
+def reap(rest, lease_seconds=300, types=None, batch_size=500, dry_run=False):
+    """
+    One pass over stuck jobs. Each PATCH still requires status=processing
+    and the retries value we read, so a job a live worker finished (or
+    another reaper already requeued) in the meantime is left alone.
+
+    Returns {'found', 'requeued', 'failed'}.
+    """
+    result = {'found': 0, 'requeued': 0, 'failed': 0}
+    filters = stuck_filters(lease_seconds, types)
+    for page in iter_pages(rest, filters, 'id,created_at,retries,max_retries', batch_size):
+        result['found'] += len(page)
+        if dry_run:
+            continue
+        now = datetime.now(timezone.utc).isoformat()
+        for (retries, exhausted), group in plan(page).items():
+            for ids in in_chunks(group):
+                updated = rest.update(TABLE, [
+                    ('id', in_list(ids)),
+                    ('status', 'eq.processing'),
+                    retries_guard(retries),
+                ], requeue_values(retries, exhausted, now))
+                updated = len(ids) if updated is None else updated
+                result['failed' if exhausted else 'requeued'] += updated
+    return result
+
+
+def run_reaper(rest, lease_seconds=300, interval=15.0, types=None, batch_size=500, report=None):
+    """
+    Reap forever every `interval` seconds; report(result, elapsed) after each
+    pass. Errors in one pass are reported and retried on the next.
+    """
+    while True:
+        started = time.monotonic()
+        try:
+            result = reap(rest, lease_seconds, types, batch_size)
+        except Exception as e:
+            result = {'error': str(e)}
+        if report:
+            report(result, time.monotonic() - started)
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
@@ -0,0 +1,121 @@
+"""
+Minimal Supabase PostgREST access on top of the shared HTTP client.
+"""
+
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote_plus
+import time
+
+from .client import get_client, supabase_headers
+
+
+class PostgRESTError(Exception):
+    """Non-2xx response from PostgREST"""
+
+    def __init__(self, method, table, response):
+        self.status = response.status_code
+        super().__init__(f"{method} {table}: HTTP {response.status_code} {response.text[:200]}")
+
+
+# proxies in front of PostgREST (nginx, Cloudflare) reject request lines
+# over ~8 KB; an in.() filter gets this much, the rest is URL and other filters
+MAX_FILTER_BYTES = 6000
+
+
+def quote_item(value):
+    return '"%s"' % str(value).replace('"', '\\"')
+
+
+def in_list(values):
+    """PostgREST in.(...) filter value with every item quoted"""
+    quoted = ','.join(quote_item(v) for v in values)
+    return f"in.({quoted})"
+
+
+def in_chunks(values, max_bytes=MAX_FILTER_BYTES):
+    """Split values into lists whose URL-encoded in_list() stays within max_bytes"""
+    empty = len(quote_plus('in.()'))
+    chunk, size = [], empty
+    for value in values:
+        cost = len(quote_plus(quote_item(value))) + len(quote_plus(','))
+        if chunk and size + cost > max_bytes:
+            yield chunk
+            chunk, size = [], empty
+        chunk.append(value)
+        size += cost
+    if chunk:
+        yield chunk
+
+
+def content_range_total(response):
+    """Total from 'Content-Range: 0-24/3573' or '*/0'; None if unknown"""
+    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+
+
+class PostgREST:
+    """Table-level helpers for /rest/v1; filters are lists of (column, 'op.value')"""
+
+    def __init__(self, supabase_url, service_key, http=None):
+        self.base = f"{supabase_url.rstrip('/')}/rest/v1"
+        self.key = service_key
+        self.http = http or get_client()
+
+    def _call(self, method, table, params=None, prefer=None, **kwargs):
+        response = self.http.request(
+            method, f"{self.base}/{table}", params=params,
+            headers=supabase_headers(self.key, prefer), **kwargs
+        )
+        if response.status_code >= 400:
+            raise PostgRESTError(method, table, response)
+        return response
+
+    def count(self, table, filters=(), column='id', method='exact'):
+        """
+        Row count via HEAD + Prefer: count=<method> (no rows are transferred).
+        'estimated' uses the planner's estimate once the table is large.
+        """
+        response = self._call('HEAD', table, [('select', column), *filters], prefer=f'count={method}')
+        return content_range_total(response)
+
+    def clock_offset(self, table):
+        """
+        Server clock minus ours in seconds, from the Date header of an empty
+        HEAD; None without the header. Date has whole seconds, so the true
+        offset is up to 1 s more (plus half the round trip either way).
+        """
+        sent = time.time()
+        response = self._call('HEAD', table, [('select', '*'), ('limit', '0')])
+        received = time.time()
+        date = response.headers.get('Date')
+        if not date:
+            return None
+        return parsedate_to_datetime(date).timestamp() - (sent + received) / 2
+
+    def select(self, table, columns='*', filters=(), order=None, limit=None):
+        params = [('select', columns), *filters]
+        if order:
+            params.append(('order', order))
+        if limit:
+            params.append(('limit', str(limit)))
+        return self._call('GET', table, params).json()
+
+    def delete(self, table, filters):
+        """Delete matching rows; returns the deleted count reported by PostgREST"""
+        response = self._call('DELETE', table, list(filters), prefer='return=minimal,count=exact')
+        return content_range_total(response)
+
+    def update(self, table, filters, values):
+        """PATCH matching rows; returns the updated count reported by PostgREST"""
+        response = self._call('PATCH', table, list(filters), prefer='return=minimal,count=exact', json=values)
+        return content_range_total(response)
+
+    def insert(self, table, rows, prefer='return=minimal', on_conflict=None, retry=False):
+        """POST rows (a list or pre-serialised JSON bytes); not retried by default"""
+        params = [('on_conflict', on_conflict)] if on_conflict else None
+        kwargs = {'data': rows} if isinstance(rows, (bytes, str)) else {'json': rows}
+        return self._call('POST', table, params, prefer=prefer, retry=retry, **kwargs)
+
+    def rpc(self, function, args=None, retry=False):
+        """POST /rest/v1/rpc/<function>; returns the decoded result. retry=True for read-only functions"""
+        return self._call('POST', f"rpc/{function}", json=args or {}, retry=retry).json()
@@ -0,0 +1,108 @@
+"""
+Retention for telegram_webhook_updates, the webhook's idempotency table.
+
+The route inserts one row per update_id and treats a unique violation as
+"already processed". That probe hits the primary key, but the table and
+both indexes only ever grow. Rows older than the window are removed in
+bounded batches walked along idx_telegram_webhook_updates_received_at:
+select the oldest batch_size rows, then delete exactly those, by the
+(received_at, update_id) key of the last one. Every statement touches at
+most batch_size rows, so the webhook's own inserts never queue behind a
+long delete; a burst sharing one received_at is split across batches.
+"""
+
+from datetime import datetime, timedelta, timezone
+import time
+
+from .drain import UPDATES_TABLE
+from .rest import PostgRESTError
+
+# getUpdates keeps an undelivered update for up to 24 hours, so a younger
+# row may still be needed to recognise a redelivery
+MIN_WINDOW = timedelta(hours=24)
+STATS_FUNCTION = 'telegram_webhook_updates_stats'  # supabase/migrations/20261017_*.sql
+
+
+def cutoff_for(older_than, now=None):
+    """ISO timestamp `older_than` before now; refuses windows under MIN_WINDOW"""
+    if older_than < MIN_WINDOW:
+        raise ValueError(f"retention window {older_than} is shorter than {MIN_WINDOW}: "
+                         f"Telegram may still redeliver those updates")
+    return ((now or datetime.now(timezone.utc)) - older_than).isoformat()
+
+
+def count_older(rest, cutoff):
+    """Rows a prune would remove (exact; a range count on the received_at index)"""
+    return rest.count(UPDATES_TABLE, [('received_at', f"lt.{cutoff}")], column='update_id')
+
+
+def table_stats(rest):
+    """
+    {'rows', 'total_bytes', 'table_bytes', 'index_bytes'}. Rows use the
+    planner estimate (exact on small tables); the byte sizes need the SQL
+    function from the migration and are None without it.
+    """
+    stats = {'rows': rest.count(UPDATES_TABLE, column='update_id', method='estimated'),
+             'total_bytes': None, 'table_bytes': None, 'index_bytes': None}
+    try:
+        result = rest.rpc(STATS_FUNCTION, retry=True)  # read-only
+    except PostgRESTError as e:
+        if e.status not in (404, 400):  # function not deployed
+            raise
+        return stats
+    row = result[0] if isinstance(result, list) and result else result or {}
+    for key in ('total_bytes', 'table_bytes', 'index_bytes'):
+        stats[key] = row.get(key)
+    return stats
+
+
+def batch_filter(last):
+    """
+    Rows up to and including `last` in (received_at, update_id) order. A
+    plain received_at <= last would also take every other row sharing the
+    boundary timestamp, however many there are.
+    """
+    received_at, update_id = last['received_at'], last['update_id']
+    return ('or', f'(received_at.lt."{received_at}",'
+                  f'and(received_at.eq."{received_at}",update_id.lte.{update_id}))')
+
+
+def prune_updates(rest, cutoff, batch_size=1000, max_batches=None, max_seconds=None, pause=0.0,
+                  progress=None):
+    """
+    Delete rows with received_at < cutoff, oldest first, one batch per
+    round trip pair. Stops when nothing older is left, or after
+    max_batches / max_seconds (the next run carries on from there).
+
+    progress(deleted, batches, elapsed) is called after every batch.
+    Returns {'deleted', 'batches', 'complete', 'elapsed_s'}.
+    """
+    started = time.monotonic()
+    deleted = batches = 0
+    complete = False
+    while True:
+        rows = rest.select(UPDATES_TABLE, 'received_at,update_id', [('received_at', f"lt.{cutoff}")],
+                           order='received_at.asc,update_id.asc', limit=batch_size)
+        if not rows:
+            complete = True
+            break
+        # the batch's last key bounds the delete; it is older than cutoff by construction
+        removed = rest.delete(UPDATES_TABLE, [batch_filter(rows[-1])])
+        removed = len(rows) if removed is None else removed
+        if removed == 0:
+            # nothing went away (RLS / concurrent pruner) — don't spin forever
+            break
+        deleted += removed
+        batches += 1
+        elapsed = time.monotonic() - started
+        if progress:
+            progress(deleted, batches, elapsed)
+        if len(rows) < batch_size:
+            complete = True
+            break
+        if (max_batches and batches >= max_batches) or (max_seconds and elapsed >= max_seconds):
+            break
+        if pause:
+            time.sleep(pause)
+    return {'deleted': deleted, 'batches': batches, 'complete': complete,
+            'elapsed_s': round(time.monotonic() - started, 3)}
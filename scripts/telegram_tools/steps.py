@@ -0,0 +1,72 @@
+"""
+Dependency-aware step runner.
+
+Steps are named callables plus the names of the steps they wait for.
+Every step whose dependencies have succeeded starts at once on a thread
+pool, so independent work (a Supabase purge and a webhook re-arm) takes
+as long as the longest chain, not the sum. A failing step skips only its
+dependents; the rest still run and all failures are raised together.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class StepsFailed(Exception):
+    """
+    One or more steps failed. errors maps step name -> exception (skipped
+    dependents get a Skipped); results holds what the other steps returned.
+    """
+
+    def __init__(self, errors, results):
+        self.errors = errors
+        self.results = results
+        super().__init__('; '.join(f"{name}: {error}" for name, error in errors.items()))
+
+
+class Skipped(Exception):
+    """A dependency failed, so the step never ran"""
+
+
+def run_steps(steps, workers=None):
+    """
+    steps: {name: (fn, [dependency names])}, fn called without arguments.
+    Returns {name: fn()} once every step is done; raises StepsFailed after
+    all runnable steps have finished if any of them raised.
+    """
+    for name, (_, deps) in steps.items():
+        unknown = [dep for dep in deps if dep not in steps]
+        if unknown:
+            raise ValueError(f"step {name} depends on unknown {', '.join(unknown)}")
+
+    pending = dict(steps)
+    running = {}
+    results, errors = {}, {}
+    with ThreadPoolExecutor(workers or len(steps) or 1) as pool:
+        while pending or running:
+            changed = True
+            while changed:  # a skip can unblock (skip) further dependents
+                changed = False
+                for name, (fn, deps) in list(pending.items()):
+                    failed = [dep for dep in deps if dep in errors]
+                    if failed:
+                        errors[name] = Skipped(f"skipped, {', '.join(failed)} failed")
+                    elif all(dep in results for dep in deps):
+                        running[pool.submit(fn)] = name
+                    else:
+                        continue
+                    del pending[name]
+                    changed = True
+            if not running:
+                break  # what's left waits on itself
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    errors[name] = e
+    for name in pending:
+        errors[name] = ValueError("dependency cycle")
+    if errors:
+        raise StepsFailed(errors, results)
+    return results
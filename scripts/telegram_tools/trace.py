@@ -0,0 +1,178 @@
+"""
+Phase timing and HTTP call tracing for the reset flow.
+
+A Trace records named phases (config, purge, delete, set, verify) and,
+once attached to an HttpClient, every HTTP attempt made inside them:
+method, redacted URL, status, latency, bytes sent / received and any
+retry wait. Phase wall time minus HTTP time is what went to sleeps
+(verify polling, retry backoff) and local work. The JSON form keeps a
+stable key order so two runs can be diffed or shipped to a dashboard.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import json
+import re
+import threading
+import time
+
+from .client import redact
+
+VERSION = 1
+QUERY_MAX = 200
+
+_token = re.compile(r'/bot([^/\s]{6})[^/\s]*')
+
+
+def redact_text(text):
+    """redact() for free text, e.g. a requests error message quoting the URL"""
+    return _token.sub(r'/bot\1…', text)
+
+
+class Trace:
+    """Thread-safe phase / HTTP call recorder; one per command run"""
+
+    def __init__(self, command=None):
+        self.command = command
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+        self.t0 = time.perf_counter()
+        self.phases = []
+        self.calls = []
+        self.lock = threading.Lock()
+        self.local = threading.local()  # current phase per thread (fleet resets run in a pool)
+
+    def now(self):
+        return time.perf_counter() - self.t0
+
+    def attach(self, http):
+        """Record every request `http` makes from now on; returns http"""
+        http.trace = self
+        return http
+
+    @contextmanager
+    def phase(self, name, target=None):
+        record = {'name': name, 'target': target, 'start_s': self.now(), 'duration_s': None,
+                  'ok': True, 'error': None}
+        with self.lock:
+            self.phases.append(record)
+        outer, self.local.phase = getattr(self.local, 'phase', None), record
+        try:
+            yield record
+        except BaseException as e:
+            record['ok'], record['error'] = False, redact_text(str(e)) or type(e).__name__
+            raise
+        finally:
+            record['duration_s'] = self.now() - record['start_s']
+            self.local.phase = outer
+
+    def http(self, method, url, started, response=None, error=None, attempt=0):
+        """Called by HttpClient after every attempt (started = perf_counter at send)"""
+        latency = time.perf_counter() - started
+        phase = getattr(self.local, 'phase', None)
+        request = getattr(response, 'request', None)
+        body = getattr(request, 'body', None) or b''
+        # the sent URL carries the query (PostgREST filters); kept apart and capped, the id lists are long
+        path, _, query = redact(getattr(request, 'url', None) or url).partition('?')
+        call = {
+            'phase': phase['name'] if phase else None,
+            'target': phase['target'] if phase else None,
+            'start_s': started - self.t0,
+            'method': method.upper(),
+            'url': path,
+            'query': query if len(query) <= QUERY_MAX else query[:QUERY_MAX] + '…',
+            'status': response.status_code if response is not None else None,
+            'latency_s': latency,
+            'bytes_out': len(body.encode() if isinstance(body, str) else body),
+            'bytes_in': len(response.content) if response is not None else 0,
+            'attempt': attempt,
+            'retry_wait_s': 0.0,
+            'error': error,
+        }
+        with self.lock:
+            self.calls.append(call)
+        return call
+
+    def summary(self):
+        """One row per phase: wall time, HTTP calls / time / bytes, and the rest (sleeps + local work)"""
+        rows = []
+        with self.lock:
+            phases, calls = list(self.phases), list(self.calls)
+        for phase in phases:
+            mine = [c for c in calls if c['phase'] == phase['name'] and c['target'] == phase['target']]
+            http_s = sum(c['latency_s'] for c in mine)
+            rows.append({
+                'phase': phase['name'],
+                'target': phase['target'],
+                'ok': phase['ok'],
+                'error': phase['error'],
+                'wall_s': phase['duration_s'],
+                'calls': len(mine),
+                'retries': sum(1 for c in mine if c['attempt']),
+                'http_s': http_s,
+                'other_s': max(0.0, (phase['duration_s'] or 0.0) - http_s),
+                'bytes_out': sum(c['bytes_out'] for c in mine),
+                'bytes_in': sum(c['bytes_in'] for c in mine),
+                'max_call_s': max((c['latency_s'] for c in mine), default=None),
+            })
+        return rows
+
+    def as_dict(self):
+        def rounded(record):
+            return {k: round(v, 4) if isinstance(v, float) else v for k, v in record.items()}
+        with self.lock:
+            calls = sorted(self.calls, key=lambda c: c['start_s'])
+        return {
+            'version': VERSION,
+            'command': self.command,
+            'started_at': self.started_at,
+            'total_s': round(self.now(), 4),
+            'phases': [rounded(row) for row in self.summary()],
+            'calls': [rounded(call) for call in calls],
+        }
+
+    def write(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+            f.write('\n')
+
+    def print_summary(self, calls=False):
+        rows = self.summary()
+        if not rows:
+            return
+        # target prefix only when several targets (fleet) share the trace
+        multi = len({r['target'] for r in rows if r['target']}) > 1
+        labels = [f"{r['target']}/{r['phase']}" if multi and r['target'] else r['phase'] for r in rows]
+        width = max(8, *map(len, labels))
+        print(f"\n{'phase':<{width}} {'wall':>8} {'http':>8} {'other':>8} {'calls':>5} {'retry':>5} "
+              f"{'sent':>8} {'recv':>8} {'slowest':>8}")
+        for label, r in zip(labels, rows):
+            slowest = f"{r['max_call_s']:>7.3f}s" if r['max_call_s'] is not None else f"{'-':>8}"
+            print(f"{label:<{width}} {r['wall_s']:>7.3f}s {r['http_s']:>7.3f}s {r['other_s']:>7.3f}s "
+                  f"{r['calls']:>5} {r['retries']:>5} {human_bytes(r['bytes_out']):>8} "
+                  f"{human_bytes(r['bytes_in']):>8} {slowest}{'' if r['ok'] else '  ❌'}")
+        if calls:
+            print()
+            with self.lock:
+                records = sorted(self.calls, key=lambda c: c['start_s'])
+            for c in records:
+                outcome = c['status'] if c['status'] is not None else c['error']
+                wait = f" (+{c['retry_wait_s']:.2f}s backoff)" if c['retry_wait_s'] else ''
+                print(f"  {c['start_s']:>7.3f}s {c['phase'] or '-':<8} {c['method']:<6} {outcome!s:<4} "
+                      f"{c['latency_s'] * 1000:>7.1f}ms {c['url']}{wait}")
+
+
+def human_bytes(n):
+    for unit in ('B', 'KB', 'MB'):
+        if n < 1024 or unit == 'MB':
+            return f"{n:.0f}{unit}" if unit == 'B' else f"{n:.1f}{unit}"
+        n /= 1024
+
+
+@contextmanager
+def maybe_phase(trace, name, target=None):
+    """trace.phase() when tracing, else a no-op"""
+    if trace is None:
+        yield None
+    else:
+        with trace.phase(name, target) as record:
+            yield record
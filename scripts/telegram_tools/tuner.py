@@ -0,0 +1,77 @@
+"""
+max_connections tuning for setWebhook.
+
+The webhook route is driven closed-loop at increasing concurrency (one
+level per step, like Telegram delivering over N parallel connections) and
+the knee is the step with the best throughput / p95 ratio ("power") among
+steps whose error rate and p95 stay within budget: past it, extra
+connections mostly buy queueing, not throughput.
+"""
+
+from .loadgen import UpdateSource, run_load
+
+DEFAULT_STEPS = [1, 2, 5, 10, 20, 40, 60, 80, 100]
+TELEGRAM_MAX = 100  # setWebhook accepts 1..100
+
+
+class Step:
+    """Measurements for one concurrency level"""
+
+    def __init__(self, concurrency, report):
+        self.concurrency = concurrency
+        self.requests = report['requests']
+        self.ok_rps = report['ok_rps'] or 0.0
+        self.error_rate = report['error_rate'] or 0.0
+        self.p50 = report['service_time'].get('p50_s')
+        self.p95 = report['service_time'].get('p95_s')
+        self.valid = True
+
+    @property
+    def power(self):
+        return self.ok_rps / self.p95 if self.p95 else 0.0
+
+    def as_dict(self):
+        return {
+            'concurrency': self.concurrency,
+            'requests': self.requests,
+            'ok_rps': self.ok_rps,
+            'error_rate': self.error_rate,
+            'p50_s': self.p50,
+            'p95_s': self.p95,
+            'power': round(self.power, 1),
+            'valid': self.valid,
+        }
+
+
+async def measure(url, secret_token=None, steps=DEFAULT_STEPS, duration=10.0, max_error_rate=0.01,
+                  p95_budget=None, seed=1, timeout=30.0, progress=None):
+    """
+    Run every concurrency level for `duration` seconds. Stops early after
+    two consecutive levels over the error or latency budget - further
+    levels would only hammer an already saturated server.
+    """
+    results = []
+    over_budget = 0
+    for i, concurrency in enumerate(steps):
+        # fresh update_ids per step, so the route never sees them as duplicates
+        source = UpdateSource(seed=seed, first_id=900_000_000_000 + seed * 10_000_000 + i * 1_000_000)
+        result = await run_load(url, secret_token, rps=0, concurrency=concurrency, duration=duration,
+                                source=source, timeout=timeout)
+        step = Step(concurrency, result.report())
+        step.valid = (step.requests > 0 and step.error_rate <= max_error_rate
+                      and (p95_budget is None or (step.p95 is not None and step.p95 <= p95_budget)))
+        results.append(step)
+        if progress:
+            progress(step)
+        over_budget = 0 if step.valid else over_budget + 1
+        if over_budget >= 2:
+            break
+    return results
+
+
+def pick_knee(steps):
+    """Valid step with the highest power, or None if no step stayed in budget"""
+    valid = [step for step in steps if step.valid]
+    if not valid:
+        return None
+    return max(valid, key=lambda step: (step.power, -step.concurrency))
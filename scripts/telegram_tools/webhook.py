@@ -0,0 +1,83 @@
+"""
+Webhook helpers shared by the reset scripts.
+"""
+
+import time
+
+import requests
+
+from .client import get_client, telegram_url
+
+ALLOWED_UPDATES = ['message', 'callback_query']
+
+
+def webhook_matches(info, url, allowed_updates=None):
+    """True if getWebhookInfo result points at `url` with the expected update types"""
+    if info.get('url') != url:
+        return False
+    if allowed_updates is not None:
+        return set(info.get('allowed_updates') or []) == set(allowed_updates)
+    return True
+
+
+def call(bot_token, method, payload=None, http=None, retry=False):
+    """
+    POST a Bot API method; returns the decoded body ({'ok': False, ...} on
+    non-JSON). Only retried with retry=True, i.e. for methods safe to repeat.
+    """
+    http = http or get_client()
+    response = http.post(telegram_url(bot_token, method), json=payload or {}, retry=retry)
+    try:
+        return response.json()
+    except ValueError:
+        return {'ok': False, 'error_code': response.status_code, 'description': response.text[:200]}
+
+
+def delete_webhook(bot_token, drop_pending_updates=True, http=None):
+    return call(bot_token, 'deleteWebhook', {'drop_pending_updates': drop_pending_updates}, http, retry=True)
+
+
+def set_webhook(bot_token, url, secret_token=None, max_connections=40,
+                allowed_updates=ALLOWED_UPDATES, drop_pending_updates=True, http=None):
+    payload = {
+        'url': url,
+        'max_connections': max_connections,
+        'allowed_updates': allowed_updates,
+        'drop_pending_updates': drop_pending_updates,
+    }
+    if secret_token:
+        payload['secret_token'] = secret_token
+    return call(bot_token, 'setWebhook', payload, http, retry=True)
+
+
+def wait_for_webhook(bot_token, url, allowed_updates=None, timeout=10.0,
+                     first_interval=0.05, max_interval=1.0, http=None):
+    """
+    Poll getWebhookInfo with short exponential intervals until the webhook
+    converges to `url` / `allowed_updates` or `timeout` passes.
+
+    A poll that fails (timeout, dropped connection, non-JSON body) is just
+    retried on the next interval.
+    Returns (converged, info, elapsed_seconds, polls); info is the last
+    result seen (or None if no call succeeded).
+    """
+    http = http or get_client()
+    started = time.monotonic()
+    interval = first_interval
+    info, polls = None, 0
+    while True:
+        polls += 1
+        try:
+            response = http.get(telegram_url(bot_token, 'getWebhookInfo'))
+            data = response.json()
+            if data.get('ok'):
+                info = data.get('result', {})
+                if webhook_matches(info, url, allowed_updates):
+                    return True, info, time.monotonic() - started, polls
+        except (ValueError, requests.RequestException):
+            pass
+        elapsed = time.monotonic() - started
+        if elapsed + interval > timeout:
+            return False, info, elapsed, polls
+        time.sleep(interval)
+        interval = min(interval * 2, max_interval)
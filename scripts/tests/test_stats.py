@@ -0,0 +1,46 @@
+"""
+LogHistogram bucketing and percentile error.
+
+    cd scripts && python -m unittest discover tests
+"""
+
+from pathlib import Path
+import math
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from telegram_tools.stats import LogHistogram  # noqa: E402
+
+# sub-second latencies in seconds, as loadgen / enqueue record them, plus a few over 1s
+SAMPLES = [0.0013, 0.0042, 0.0087, 0.0123, 0.035, 0.0999, 0.25, 0.5, 0.97, 1.03, 2.5, 40.0]
+
+
+class LogHistogramTest(unittest.TestCase):
+    def test_value_lands_in_its_own_bucket(self):
+        for value in SAMPLES:
+            hist = LogHistogram()
+            hist.add(value)
+            (bucket,) = hist.buckets
+            self.assertLessEqual(math.exp(bucket * hist.base), value * (1 + 1e-12))
+            self.assertLess(value, math.exp((bucket + 1) * hist.base))
+
+    def test_buckets_around_one_are_not_merged(self):
+        hist = LogHistogram()
+        hist.add(0.99)
+        hist.add(1.01)
+        self.assertEqual(sorted(hist.buckets), [-1, 0])
+
+    def test_percentile_within_half_a_bucket(self):
+        for value in SAMPLES[:-1]:
+            hist = LogHistogram()
+            for _ in range(99):
+                hist.add(value)
+            hist.add(100.0)  # keeps the max clamp out of the way
+            error = abs(math.log(hist.percentile(50) / value))
+            self.assertLessEqual(error, hist.base / 2 + 1e-12, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
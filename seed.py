@@ -1,7 +1,18 @@
 from datetime import datetime, timedelta
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections import Counter, deque
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import accumulate
+from xml.sax.saxutils import escape, quoteattr
+import argparse
+import gzip
+import io
+import json
+import os
+import random
 import re
+import time
 
 ns = {
     'content': 'http://purl.org/rss/1.0/modules/content/',
@@ -10,32 +21,21 @@ ns = {
     'wp': 'http://wordpress.org/export/1.2/',
     'excerpt': 'http://wordpress.org/export/1.2/excerpt/'
 }
-for prefix, uri in ns.items():
-    ET.register_namespace(prefix, uri)
-
-rss = ET.Element('rss', version='2.0', attrib={
-    'xmlns:excerpt': ns['excerpt'],
-    'xmlns:content': ns['content'],
-    'xmlns:wfw': ns['wfw'],
-    'xmlns:dc': ns['dc'],
-    'xmlns:wp': ns['wp'],
-})
-
-channel = ET.SubElement(rss, 'channel')
-ET.SubElement(channel, 'title').text = 'icoffio demo content'
-ET.SubElement(channel, 'link').text = 'https://icoffio.com'
-ET.SubElement(channel, 'description').text = 'Seed posts for icoffio'
-ET.SubElement(channel, 'language').text = 'ru-RU'
-ET.SubElement(channel, '{%s}wxr_version' % ns['wp']).text = '1.2'
-ET.SubElement(channel, '{%s}base_site_url' % ns['wp']).text = 'https://icoffio.com'
-ET.SubElement(channel, '{%s}base_blog_url' % ns['wp']).text = 'https://icoffio.com'
+
+OUTPUT = "icoffio_seed_content.wxr.xml"
+
+channel_meta = [
+    ('title', 'icoffio demo content'),
+    ('link', 'https://icoffio.com'),
+    ('description', 'Seed posts for icoffio'),
+    ('language', 'ru-RU'),
+    ('wp:wxr_version', '1.2'),
+    ('wp:base_site_url', 'https://icoffio.com'),
+    ('wp:base_blog_url', 'https://icoffio.com'),
+]
 
 # Рубрики (должны совпадать по slug с WP)
 cats = [('Tech','tech'), ('Apple','apple'), ('Games','games'), ('AI','ai'), ('News','news-2')]
-for name, slug in cats:
-    term = ET.SubElement(channel, '{%s}category' % ns['wp'])
-    ET.SubElement(term, '{%s}category_nicename' % ns['wp']).text = slug
-    ET.SubElement(term, '{%s}cat_name' % ns['wp']).text = name
 
 unsplash = [
     "https://images.unsplash.com/photo-1518770660439-4636190af475?q=80&w=1200&auto=format&fit=crop",
@@ -63,42 +63,837 @@ titles = [
     ("News",  "Смарт‑дом 2025: сценарии, которые работают"),
 ]
 
-now = datetime.utcnow()
-for i, (cat, title) in enumerate(titles):
-    item = ET.SubElement(channel, 'item')
-    ET.SubElement(item, 'title').text = title
-    # латинский slug, чтобы не ломались ссылки
-    slug = re.sub(r'[^a-z0-9]+', '-', title.lower().replace('—','-').replace('–','-')).strip('-')
-    if not slug: slug = f"demo-{i+1}"
-    ET.SubElement(item, '{%s}post_name' % ns['wp']).text = slug
-    ET.SubElement(item, 'link').text = f'https://icoffio.com/article/{slug}'
-    pub = (now - timedelta(days=i)).strftime('%Y-%m-%d %H:%M:%S')
-    ET.SubElement(item, 'pubDate').text = (now - timedelta(days=i)).strftime('%a, %d %b %Y %H:%M:%S +0000')
-    ET.SubElement(item, '{%s}post_date' % ns['wp']).text = pub
-    ET.SubElement(item, '{%s}post_date_gmt' % ns['wp']).text = pub
-    ET.SubElement(item, '{%s}status' % ns['wp']).text = 'publish'
-    ET.SubElement(item, '{%s}post_type' % ns['wp']).text = 'post'
-    ET.SubElement(item, '{%s}comment_status' % ns['wp']).text = 'closed'
-    ET.SubElement(item, '{%s}ping_status' % ns['wp']).text = 'closed'
-    # категория
-    ET.SubElement(item, 'category', domain='category', nicename=cat.lower()).text = cat
-    # отрывок
-    excerpt = f"Короткий анонс: {title}. Практичные выводы и ссылки внутри."
-    ET.SubElement(item, '{%s}encoded' % ns['excerpt']).text = excerpt
-    # контент
+
+# Словари для синтетического корпуса (--items)
+topics = {
+    'AI':    ["локальные LLM", "нейросети в смартфонах", "генерация изображений", "ИИ‑ассистенты", "обучение моделей", "распознавание речи"],
+    'Tech':  ["тонкие ноутбуки", "мониторы для работы", "USB‑C зарядка", "мини‑ПК", "механические клавиатуры", "домашние NAS"],
+    'Apple': ["iOS 19", "MacBook для видео", "Apple Watch", "AirPods", "Vision Pro", "iPad для заметок"],
+    'Games': ["инди‑хиты", "ретро‑консоли", "геймпады", "облачный гейминг", "портативные консоли", "киберспорт"],
+    'News':  ["гаджет недели", "смарт‑дом", "умные кольца", "электросамокаты", "носимая электроника", "рынок смартфонов"],
+}
+angles = [
+    "что важно при выборе", "пять неочевидных функций", "опыт и лайфхаки", "когда это действительно полезно",
+    "сравнение вариантов", "что изменилось за год", "стоит ли переплачивать", "базовый сетап без боли",
+]
+patterns = ["{topic}: {angle}", "{angle} — {topic}", "{topic} в 2025: {angle}", "Гид: {topic} и {angle}"]
+paragraphs = [
+    "Демо‑контент для настройки фронтенда. Суть: что произошло, почему важно и что делать читателю.",
+    "Тестовая публикация: предназначена только для проверки макета и ленты.",
+    "Разбираем сценарии использования и типичные ошибки при первом знакомстве.",
+    "Коротко о цене, доступности и альтернативах, которые стоит рассмотреть.",
+    "Практичные выводы: что можно сделать уже сегодня без лишних затрат.",
+    "Мнение редакции и ссылки на полезные материалы по теме.",
+]
+
+SHARD_SIZE = 5000
+
+
+# Транслитерация для slug: одна таблица для str.translate, без циклов по символам
+_translit = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'ж': 'zh',
+    'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o',
+    'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts',
+    'ч': 'ch', 'ш': 'sh', 'щ': 'shch', 'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu',
+    'я': 'ya', 'є': 'ye', 'і': 'i', 'ї': 'yi', 'ґ': 'g', 'ў': 'u',
+    # латиница с диакритикой (pl/de/fr/es)
+    'ą': 'a', 'ć': 'c', 'ę': 'e', 'ł': 'l', 'ń': 'n', 'ó': 'o', 'ś': 's', 'ź': 'z',
+    'ż': 'z', 'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'à': 'a', 'á': 'a', 'â': 'a',
+    'ç': 'c', 'è': 'e', 'é': 'e', 'ê': 'e', 'ë': 'e', 'í': 'i', 'î': 'i', 'ï': 'i',
+    'ñ': 'n', 'ô': 'o', 'ú': 'u', 'ù': 'u', 'û': 'u', 'ý': 'y', 'ÿ': 'y',
+}
+SLUG_TABLE = str.maketrans(_translit)
+_non_slug = re.compile(r'[^a-z0-9]+')
+SLUG_MAX = 80
+
+
+@lru_cache(maxsize=1 << 16)
+def slugify(title, max_len=SLUG_MAX):
+    """Латинский slug из заголовка (кириллица транслитерируется); повторы берутся из кэша"""
+    slug = _non_slug.sub('-', title.lower().translate(SLUG_TABLE)).strip('-')
+    if len(slug) > max_len:
+        slug = slug[:max_len].rsplit('-', 1)[0]
+    return slug
+
+
+class SlugIndex:
+    """
+    Индекс уникальности slug: set занятых + счётчик на каждую базу,
+    поэтому следующий свободный суффикс находится за O(1), без перебора -2, -3, ...
+    counts — уже выданные повторы базы (для продолжения нумерации между шардами).
+    """
+
+    def __init__(self, taken=(), counts=None):
+        self.taken = set(taken)
+        self.counts = dict(counts or {})
+
+    def __contains__(self, slug):
+        return slug in self.taken
+
+    def __len__(self):
+        return len(self.taken)
+
+    def add(self, base, fallback='post'):
+        base = base or fallback
+        n = self.counts.get(base, 0) + 1
+        slug = base if n == 1 else f"{base}-{n}"
+        # редкий случай: "база-N" уже занята другим заголовком
+        while slug in self.taken:
+            n += 1
+            slug = f"{base}-{n}"
+        self.counts[base] = n
+        self.taken.add(slug)
+        return slug
+
+
+def post_link(slug):
+    """Постоянная ссылка поста — она же guid в индексе инкрементального режима"""
+    return f"https://icoffio.com/article/{slug}"
+
+
+def slugify_batch(batch, index=None, fallback='post'):
+    """Уникальные slug'и для списка заголовков; index можно переиспользовать между батчами"""
+    index = SlugIndex() if index is None else index
+    add = index.add
+    return [add(base, fallback) for base in map(slugify, batch)]
+
+
+def make_post(i, cat, title, slug, date, body=paragraphs[:2]):
+    """Одна запись поста — всё, что нужно для <item>"""
     img = unsplash[i % len(unsplash)]
-    content_html = f"""
-    <p><img src="{img}" alt="" /></p>
+    content_html = f'''<p><img src="{img}" alt="" /></p>
     <p><strong>{title}</strong></p>
-    <p>Демо‑контент для настройки фронтенда. Суть: что произошло, почему важно и что делать читателю.</p>
-    <p>Тестовая публикация: предназначена только для проверки макета и ленты.</p>
+    ''' + "\n    ".join(f"<p>{p}</p>" for p in body)
+    return {
+        'title': title,
+        'slug': slug,
+        'category': cat,
+        'pub_date': date.strftime('%a, %d %b %Y %H:%M:%S +0000'),
+        'post_date': date.strftime('%Y-%m-%d %H:%M:%S'),
+        'excerpt': f"Короткий анонс: {title}. Практичные выводы и ссылки внутри.",
+        'content': content_html,
+        'image': img,
+    }
+
+
+def demo_posts(now=None):
+    """Демо-набор: 15 заголовков из titles"""
+    now = now or datetime.utcnow()
+    slugs = slugify_batch([title for _, title in titles], fallback='demo')
+    for i, (cat, title) in enumerate(titles):
+        yield make_post(i, cat, title, slugs[i], now - timedelta(days=i))
+
+
+def synthetic_titles(shard, start, stop, seed, mix):
+    """Рубрики и заголовки шарда — отдельный RNG, чтобы их можно было пересчитать дёшево"""
+    rng = random.Random(f"{seed}:{shard}:titles")
+    names, weights = zip(*mix)
+    cum_weights = list(accumulate(weights))
+    out = []
+    # всё для одного поста тянется подряд: при росте --items начало шарда не меняется
+    for _ in range(stop - start):
+        cat = rng.choices(names, cum_weights=cum_weights)[0]
+        title = rng.choice(patterns).format(topic=rng.choice(topics[cat]), angle=rng.choice(angles))
+        out.append((cat, title[0].upper() + title[1:]))
+    return out
+
+
+def shard_slug_counts(shard, start, stop, seed, mix):
+    """Сколько раз каждая база slug встречается в шарде"""
+    return Counter(map(slugify, (title for _, title in synthetic_titles(shard, start, stop, seed, mix))))
+
+
+def synthetic_shard(shard, start, stop, seed, mix, days, until, slug_counts=None):
+    """
+    Посты items [start, stop).
+    RNG зависит только от seed и номера шарда, поэтому результат
+    не зависит от числа процессов. slug_counts — повторы баз slug
+    в предыдущих шардах, чтобы суффиксы были сквозными по всему файлу.
+    """
+    rng = random.Random(f"{seed}:{shard}")
+    shard_titles = synthetic_titles(shard, start, stop, seed, mix)
+    slugs = slugify_batch([title for _, title in shard_titles], SlugIndex(counts=slug_counts))
+    posts = []
+    for i, (cat, title), slug in zip(range(start, stop), shard_titles, slugs):
+        date = until - timedelta(seconds=rng.randrange(days * 86400) if days else 0)
+        body = rng.sample(paragraphs, rng.randint(2, len(paragraphs)))
+        posts.append(make_post(i, cat, title, slug, date, body))
+    return posts
+
+
+def render_shard(*job, indent='  '):
+    """Шард сразу в виде отрендеренных <item> — рендер тоже уходит в воркер"""
+    render = WXRWriter(None, indent).render_item
+    return [render(post) for post in synthetic_shard(*job)]
+
+
+def bounded_map(pool, fn, jobs, window):
+    """
+    Как pool.map, но в работе не больше window заданий: pool.map отправляет
+    все задания сразу, и готовые шарды копятся в памяти, пока потребитель
+    медленно пишет предыдущие. Результаты — по порядку.
+    """
+    inflight = deque()
+    for args in jobs:
+        if len(inflight) >= window:
+            yield inflight.popleft().result()
+        inflight.append(pool.submit(fn, *args))
+    while inflight:
+        yield inflight.popleft().result()
+
+
+def synthetic_shards(items, seed, mix, days, until, workers, task=synthetic_shard):
+    """
+    Выполнить task для каждого шарда в пуле процессов, отдавая результаты по порядку.
+    Два прохода: сначала считаем базы slug по шардам (дёшево),
+    затем запускаем task с накопленными счётчиками предыдущих шардов.
+    """
+    bounds = [(n, start, min(start + SHARD_SIZE, items)) for n, start in enumerate(range(0, items, SHARD_SIZE))]
+    pool = ProcessPoolExecutor(workers) if workers > 1 and len(bounds) > 1 else None
+
+    def run(fn, *columns):
+        if not pool:
+            return map(fn, *columns)
+        return bounded_map(pool, fn, zip(*columns), 2 * workers)
+
+    try:
+        per_shard = run(shard_slug_counts, *zip(*[(n, a, b, seed, mix) for n, a, b in bounds]))
+        offsets, seen = [], Counter()
+        for counts in per_shard:
+            offsets.append(dict(seen))
+            seen.update(counts)
+        jobs = [(n, a, b, seed, mix, days, until, offsets[n]) for n, a, b in bounds]
+        yield from run(task, *zip(*jobs))
+    finally:
+        if pool:
+            pool.shutdown()
+
+
+def synthetic_defaults(mix=None, until=None, workers=None):
+    """Значения по умолчанию для синтетического режима"""
+    return (
+        mix or [(name, 1) for name, _ in cats],
+        until or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0),
+        workers or os.cpu_count() or 1,
+    )
+
+
+def synthetic_posts(items, seed=0, mix=None, days=365, until=None, workers=None):
+    """Синтетический корпус постами (dict), например для загрузки в Supabase"""
+    mix, until, workers = synthetic_defaults(mix, until, workers)
+    for posts in synthetic_shards(items, seed, mix, days, until, workers):
+        yield from posts
+
+
+class WXRWriter:
+    """
+    Потоковая запись WXR: заголовок канала, рубрики и каждый <item>
+    уходят в файл сразу, в памяти держится только текущий пост.
+    indent='' — компактный вывод без переводов строк.
+    """
+
+    def __init__(self, fh, indent='  '):
+        self.fh = fh
+        self.indent = indent
+        self.nl = '\n' if indent else ''
+        # неизменные части <item> собираем один раз, а не на каждый пост
+        self._open_item = f'{indent * 2}<item>{self.nl}'
+        self._status = ''.join((
+            self._el(3, 'wp:status', 'publish'),
+            self._el(3, 'wp:post_type', 'post'),
+            self._el(3, 'wp:comment_status', 'closed'),
+            self._el(3, 'wp:ping_status', 'closed'),
+        ))
+        self._close_item = self._el(3, 'dc:creator', 'admin') + f'{indent * 2}</item>{self.nl}'
+        self.tail = f'{indent}</channel>{self.nl}</rss>{self.nl}'
+
+    def _el(self, depth, tag, text, attrs=None):
+        attr = ''.join(f' {k}={quoteattr(v)}' for k, v in attrs.items()) if attrs else ''
+        return f"{self.indent * depth}<{tag}{attr}>{escape(text)}</{tag}>{self.nl}"
+
+    def start(self, meta=channel_meta):
+        xmlns = ''.join(f' xmlns:{prefix}={quoteattr(uri)}' for prefix, uri in ns.items())
+        out = [
+            f'<?xml version="1.0" encoding="utf-8"?>{self.nl}',
+            f'<rss version="2.0"{xmlns}>{self.nl}',
+            f'{self.indent}<channel>{self.nl}',
+        ]
+        out.extend(self._el(2, tag, text) for tag, text in meta)
+        self.fh.write(''.join(out))
+
+    def category(self, name, slug):
+        i = self.indent
+        self.fh.write(
+            f'{i * 2}<wp:category>{self.nl}'
+            + self._el(3, 'wp:category_nicename', slug)
+            + self._el(3, 'wp:cat_name', name)
+            + f'{i * 2}</wp:category>{self.nl}'
+        )
+
+    def render_item(self, post):
+        el = self._el
+        return ''.join((
+            self._open_item,
+            el(3, 'title', post['title']),
+            el(3, 'wp:post_name', post['slug']),
+            el(3, 'link', post_link(post['slug'])),
+            el(3, 'pubDate', post['pub_date']),
+            el(3, 'wp:post_date', post['post_date']),
+            el(3, 'wp:post_date_gmt', post['post_date']),
+            self._status,
+            # категория
+            el(3, 'category', post['category'],
+               {'domain': 'category', 'nicename': post['category'].lower()}),
+            # отрывок и контент
+            el(3, 'excerpt:encoded', post['excerpt']),
+            el(3, 'content:encoded', post['content']),
+            self._close_item,
+        ))
+
+    def item(self, post):
+        self.fh.write(self.render_item(post))
+
+    def raw(self, fragments):
+        """Готовые <item> (например, от воркера пула)"""
+        self.fh.writelines(fragments)
+
+    def header(self):
+        """Заголовок канала с рубриками строкой — для самостоятельных частей"""
+        fh, self.fh = self.fh, io.StringIO()
+        self.start()
+        for name, slug in cats:
+            self.category(name, slug)
+        head, self.fh = self.fh.getvalue(), fh
+        return head
+
+    def close(self):
+        self.fh.write(self.tail)
+
+
+@contextmanager
+def open_wxr(path, indent='  '):
+    """WXR-файл с заголовком канала и рубриками; items пишет вызывающий"""
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        writer = WXRWriter(f, indent)
+        writer.start()
+        for name, slug in cats:
+            writer.category(name, slug)
+        yield writer
+        writer.close()
+
+
+def write_wxr(path, posts, indent='  '):
+    """Записать посты в WXR-файл потоково, вернуть число items"""
+    count = 0
+    with open_wxr(path, indent) as writer:
+        for post in posts:
+            writer.item(post)
+            count += 1
+    return count
+
+
+def rendered_chunks(items=None, indent='  ', seed=0, mix=None, days=365, until=None, workers=None):
+    """Отрендеренные <item> пачками: демо-набор целиком или синтетика по шардам"""
+    if not items:
+        render = WXRWriter(None, indent).render_item
+        yield [render(post) for post in demo_posts()]
+        return
+    mix, until, workers = synthetic_defaults(mix, until, workers)
+    yield from synthetic_shards(items, seed, mix, days, until, workers, partial(render_shard, indent=indent))
+
+
+def write_synthetic_wxr(path, items, seed=0, mix=None, days=365, until=None, indent='  ', workers=None):
+    """Синтетический корпус из items постов, шардированный по процессам"""
+    count = 0
+    with open_wxr(path, indent) as writer:
+        for chunk in rendered_chunks(items, indent, seed, mix, days, until, workers):
+            writer.raw(chunk)
+            count += len(chunk)
+    return count
+
+
+def compressor(kind, level=None):
+    """bytes -> bytes для --compress; zstd — опциональный пакет zstandard"""
+    if kind == 'gzip':
+        # mtime=0 — одинаковый вход даёт одинаковый .gz
+        return partial(gzip.compress, compresslevel=level or 6, mtime=0)
+    if kind == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise SystemExit("❌ Для --compress zstd нужен пакет zstandard: pip install zstandard")
+        # ZstdCompressor не потокобезопасен — отдельный на каждую часть
+        return lambda data: zstandard.ZstdCompressor(level=level or 3).compress(data)
+    return lambda data: data
+
+
+def part_path(output, n, compress=None):
+    """icoffio_seed_content.wxr.xml -> icoffio_seed_content.part001.wxr.xml.gz"""
+    base = output[:-len('.wxr.xml')] if output.endswith('.wxr.xml') else output
+    ext = {'gzip': '.gz', 'zstd': '.zst'}.get(compress, '')
+    return f"{base}.part{n:03d}.wxr.xml{ext}"
+
+
+class WXRParts:
     """
-    ET.SubElement(item, '{%s}encoded' % ns['content']).text = content_html.strip()
-    ET.SubElement(item, '{%s}creator' % ns['dc']).text = 'admin'
+    Экспорт частями: каждая часть — самостоятельный WXR (заголовок канала,
+    рубрики, items, хвост), ограниченный max_items и/или max_bytes (до сжатия).
+    Готовые части сжимаются и пишутся на диск в пуле потоков, пока генерация
+    продолжается (zlib/zstd отпускают GIL); в памяти не больше workers + 1 частей.
+    """
+
+    def __init__(self, output, indent='  ', max_items=None, max_bytes=None, compress=None, level=None, workers=None):
+        writer = WXRWriter(None, indent)
+        self.head, self.tail = writer.header().encode('utf-8'), writer.tail.encode('utf-8')
+        self.output = output
+        self.max_items = max_items or float('inf')
+        self.max_bytes = max_bytes or float('inf')
+        self.compress_kind = compress
+        self.compress = compressor(compress, level)
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(self.workers)
+        self.inflight = deque()
+        self.paths = []
+        self.items = self.raw_bytes = self.disk_bytes = 0
+        self._reset()
+
+    def _reset(self):
+        self.batch = []
+        self.size = len(self.head) + len(self.tail)
+
+    def add(self, item):
+        data = item.encode('utf-8')
+        if self.batch and (len(self.batch) >= self.max_items or self.size + len(data) > self.max_bytes):
+            self.flush()
+        self.batch.append(data)
+        self.size += len(data)
+        self.items += 1
+
+    def flush(self):
+        if not self.batch:
+            return
+        path = part_path(self.output, len(self.paths) + 1, self.compress_kind)
+        payload = b''.join([self.head, *self.batch, self.tail])
+        while len(self.inflight) >= self.workers:
+            self._collect(self.inflight.popleft())
+        self.inflight.append(self.pool.submit(self._write, path, payload))
+        self.paths.append(path)
+        self._reset()
+
+    def _write(self, path, payload):
+        data = self.compress(payload)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return len(payload), len(data)
+
+    def _collect(self, future):
+        raw, disk = future.result()
+        self.raw_bytes += raw
+        self.disk_bytes += disk
+
+    def close(self):
+        try:
+            self.flush()
+            while self.inflight:
+                self._collect(self.inflight.popleft())
+        finally:
+            self.pool.shutdown()
+        return self.paths
+
+
+def write_wxr_parts(output, chunks, indent='  ', max_items=None, max_bytes=None, compress=None, level=None, workers=None):
+    """Разложить отрендеренные <item> по частям; вернуть WXRParts со статистикой"""
+    parts = WXRParts(output, indent, max_items, max_bytes, compress, level, workers)
+    try:
+        for chunk in chunks:
+            for item in chunk:
+                parts.add(item)
+    finally:
+        parts.close()
+    return parts
+
+
+def is_ndjson(path):
+    return path.endswith(('.ndjson', '.jsonl', '.ndjson.gz', '.jsonl.gz'))
+
+
+def iter_manifest(path):
+    """(slug, guid) из NDJSON: манифест seed.py или вывод wxr_ingest.py (там guid — link)"""
+    opener = gzip.open if path.endswith('.gz') else open
+    loads = json.loads
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                row = loads(line)
+                if row.get('slug'):
+                    yield row['slug'], row.get('guid') or row.get('link')
+
+
+class ExportIndex:
+    """
+    Что уже выгружено: set slug'ов и отдельно guid'ы, которые не совпадают
+    с post_link(slug) (чужие экспорты). Канонические guid не хранятся —
+    для своих постов индекс стоит ровно один slug на пост.
+    """
+
+    def __init__(self):
+        self.slugs = set()
+        self.guids = {}  # guid -> slug
+
+    def __len__(self):
+        return len(self.slugs)
+
+    def add(self, slug, guid=None):
+        self.slugs.add(slug)
+        if guid and guid != post_link(slug):
+            self.guids[guid] = slug
+
+    def has(self, slug, guid=None):
+        return slug in self.slugs or (guid or post_link(slug)) in self.guids
+
+    def entries(self):
+        """Строки манифеста по порядку slug — одинаковый индекс даёт одинаковый файл"""
+        extra = {slug: guid for guid, slug in self.guids.items()}
+        for slug in sorted(self.slugs):
+            yield manifest_entry(slug, extra.get(slug))
+
+
+def manifest_entry(slug, guid=None):
+    return {'slug': slug, 'guid': guid} if guid and guid != post_link(slug) else {'slug': slug}
+
+
+def load_export_index(paths):
+    """
+    Индекс из прошлых экспортов потоково: WXR (части, .gz/.zst) читаются через
+    iterparse, NDJSON построчно — в памяти только ключи, не посты.
+    """
+    index = ExportIndex()
+    for path in paths:
+        if is_ndjson(path):
+            keys = iter_manifest(path)
+        else:
+            # wxr_ingest сам импортирует seed, поэтому не на уровне модуля
+            from wxr_ingest import iter_keys
+            keys = iter_keys([path])
+        for slug, guid in keys:
+            index.add(slug, guid)
+    return index
+
+
+def only_new(posts, index, delta):
+    """
+    Пропустить посты, уже попавшие в индекс. Новые сразу добавляются в индекс
+    (повтор внутри прогона тоже отсекается) и в delta['new'] — для манифеста.
+    """
+    for post in posts:
+        guid = post.get('guid')
+        if index.has(post['slug'], guid):
+            delta['skipped'] += 1
+            continue
+        index.add(post['slug'], guid)
+        delta['new'].append(manifest_entry(post['slug'], guid))
+        yield post
+
+
+def update_manifest(path, index, new, existed):
+    """Дописать новые записи в манифест; если его не было — записать весь индекс"""
+    dumps = partial(json.dumps, ensure_ascii=False)
+    if existed:
+        # одной записью: оборванный прогон не оставит полстроки посреди файла
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(''.join(dumps(entry) + '\n' for entry in new))
+        return
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.writelines(dumps(entry) + '\n' for entry in index.entries())
+    os.replace(tmp, path)
+
+
+def render_posts(posts, indent='  ', size=SHARD_SIZE):
+    """Посты -> отрендеренные <item> пачками по size (для дельты, где посты уже отфильтрованы)"""
+    render = WXRWriter(None, indent).render_item
+    chunk = []
+    for post in posts:
+        chunk.append(render(post))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+ARTICLE_COLUMNS = (
+    'job_id', 'chat_id', 'title', 'category', 'slug_en', 'content_en', 'excerpt_en', 'url_en', 'image_url',
+    'author', 'languages', 'source', 'meta_description', 'published', 'featured', 'created_at',
+)
+
+
+def article_row(post, chat_id=0):
+    """Пост -> строка published_articles (как пишет /api/admin/publish-article, язык en)"""
+    slug = f"{post['slug']}-en"
+    row = {
+        'job_id': f"seed:{post['slug']}",
+        'chat_id': chat_id,
+        'title': post['title'],
+        'category': post['category'].lower(),
+        'slug_en': slug,
+        'content_en': post['content'],
+        'excerpt_en': post['excerpt'],
+        'url_en': f"https://icoffio.com/en/article/{slug}",
+        'image_url': post['image'],
+        'author': 'icoffio Seed',
+        'languages': ['en'],
+        'source': 'seed',
+        'meta_description': post['excerpt'][:160],
+        'published': post.get('status', 'publish') == 'publish',
+        'featured': False,
+    }
+    if post.get('post_date'):
+        # без даты (черновики, битый pubDate) created_at ставит база
+        row['created_at'] = f"{post['post_date']}+00"
+    return row
+
+
+def row_batches(rows, max_rows=500, max_bytes=1 << 20):
+    """
+    Нарезать строки на JSON-массивы, ограниченные и по числу строк, и по размеру тела.
+    Каждая строка сериализуется один раз; отдаём (payload, число строк).
+    """
+    batch, size = [], 2
+    for row in rows:
+        chunk = json.dumps(row, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if batch and (len(batch) >= max_rows or size + len(chunk) + 1 > max_bytes):
+            yield b'[' + b','.join(batch) + b']', len(batch)
+            batch, size = [], 2
+        batch.append(chunk)
+        size += len(chunk) + 1
+    if batch:
+        yield b'[' + b','.join(batch) + b']', len(batch)
+
+
+def load_supabase(posts, supabase_url, service_key, table='published_articles', chat_id=0,
+                  batch_rows=500, batch_bytes=1 << 20, concurrency=4):
+    """
+    Залить посты в Supabase батчами upsert (on_conflict=job_id) через PostgREST.
+    Одновременно в полёте до concurrency батчей, соединения берутся из пула одной сессии.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    rest = f"{supabase_url.rstrip('/')}/rest/v1"
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'apikey': service_key,
+        'Authorization': f'Bearer {service_key}',
+        'Content-Type': 'application/json',
+    })
+
+    def post(path, payload, prefer):
+        response = session.post(f"{rest}/{path}", data=payload, headers={'Prefer': prefer}, timeout=60)
+        if response.status_code not in (200, 201, 204):
+            raise RuntimeError(f"{path}: HTTP {response.status_code} {response.text[:200]}")
+
+    # chat_id ссылается на user_preferences — заводим служебного пользователя, если его нет
+    post('user_preferences?on_conflict=chat_id',
+         json.dumps([{'chat_id': chat_id, 'username': 'seed'}]),
+         'resolution=ignore-duplicates,return=minimal')
+
+    started = time.perf_counter()
+    rows = sent = 0
+
+    def report(final=False):
+        elapsed = time.perf_counter() - started
+        rate = rows / elapsed if elapsed else 0
+        line = f"  {rows} rows  {sent / 1e6:.1f} MB  {elapsed:.1f}s  {rate:.0f} rows/s"
+        print(f"\r{line}", end='\n' if final else '', flush=True)
+
+    def upsert(payload, n):
+        # columns + missing=default: строка без created_at получает DEFAULT, а не NULL,
+        # даже если в батче у других строк дата есть
+        post(f"{table}?on_conflict=job_id&columns={','.join(ARTICLE_COLUMNS)}", payload,
+             'resolution=merge-duplicates,missing=default,return=minimal')
+        return n, len(payload)
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        inflight = set()
+        batches = row_batches((article_row(p, chat_id) for p in posts), batch_rows, batch_bytes)
+        for payload, n in batches:
+            if len(inflight) >= concurrency:
+                done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    n_done, size = future.result()
+                    rows, sent = rows + n_done, sent + size
+                report()
+            inflight.add(pool.submit(upsert, payload, n))
+        for future in inflight:
+            n_done, size = future.result()
+            rows, sent = rows + n_done, sent + size
+    report(final=True)
+    session.close()
+    return rows
+
+
+def parse_mix(value):
+    """'AI=3,Tech=1' -> [('AI', 3.0), ('Tech', 1.0)]"""
+    mix = []
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in topics:
+            raise argparse.ArgumentTypeError(f"неизвестная рубрика: {name} (есть: {', '.join(topics)})")
+        try:
+            weight = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"некорректный вес: {part}")
+        if not weight > 0:
+            raise argparse.ArgumentTypeError(f"вес должен быть больше нуля: {part}")
+        mix.append((name, weight))
+    return mix
+
+
+def parse_size(value):
+    """'64M' -> 67108864; понимает K/M/G"""
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    value = value.strip().upper().rstrip('B')
+    try:
+        if value and value[-1] in units:
+            return int(float(value[:-1]) * units[value[-1]])
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"некорректный размер: {value}")
+
+
+def add_supabase_args(parser):
+    """Флаги загрузки в Supabase — общие для seed.py и wxr_ingest.py"""
+    db = parser.add_argument_group("загрузка в Supabase")
+    db.add_argument('--supabase', action='store_true', help="залить посты в published_articles напрямую")
+    db.add_argument('--supabase-url', default=os.getenv('NEXT_PUBLIC_SUPABASE_URL') or os.getenv('SUPABASE_URL'),
+                    help="URL проекта или локального PostgREST (по умолчанию NEXT_PUBLIC_SUPABASE_URL)")
+    db.add_argument('--supabase-key', default=os.getenv('SUPABASE_SERVICE_ROLE_KEY'),
+                    help="service role key (по умолчанию SUPABASE_SERVICE_ROLE_KEY)")
+    db.add_argument('--chat-id', type=int, default=0, help="chat_id для строк (по умолчанию 0, как в админке)")
+    db.add_argument('--batch-rows', type=int, default=500, help="строк в одном upsert (по умолчанию 500)")
+    db.add_argument('--batch-bytes', type=int, default=1 << 20, help="макс. размер тела запроса (по умолчанию 1 MiB)")
+    db.add_argument('--concurrency', type=int, default=4, help="батчей в полёте одновременно (по умолчанию 4)")
+    return db
+
+
+def run_supabase_load(args, posts):
+    """--supabase: проверить флаги, залить посты и напечатать итог"""
+    if not args.supabase_url or not args.supabase_key:
+        raise SystemExit("❌ Нужны --supabase-url и --supabase-key (или NEXT_PUBLIC_SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY)")
+    print(f"⬆️  Загрузка в {args.supabase_url} ...")
+    try:
+        count = load_supabase(posts, args.supabase_url, args.supabase_key, chat_id=args.chat_id,
+                              batch_rows=args.batch_rows, batch_bytes=args.batch_bytes,
+                              concurrency=args.concurrency)
+    except Exception as e:
+        raise SystemExit(f"\n❌ Ошибка загрузки: {e}")
+    print(f"Готово: {count} статей в published_articles")
+    return count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="WXR-экспорт демо-контента icoffio")
+    parser.add_argument('-o', '--output', default=OUTPUT, help=f"файл экспорта (по умолчанию {OUTPUT})")
+    parser.add_argument('--indent', type=int, default=2, help="отступ в пробелах для pretty-вывода")
+    parser.add_argument('--compact', action='store_true', help="без отступов и переводов строк")
+    synth = parser.add_argument_group("синтетический корпус")
+    synth.add_argument('--items', type=int, help="сгенерировать N постов вместо демо-набора")
+    synth.add_argument('--mix', type=parse_mix, help="веса рубрик, например AI=3,Tech=2,News=1")
+    synth.add_argument('--days', type=int, default=365, help="разброс дат публикации в днях (по умолчанию 365)")
+    synth.add_argument('--until', type=datetime.fromisoformat, help="самая поздняя дата, YYYY-MM-DD (по умолчанию сегодня)")
+    synth.add_argument('--seed', type=int, default=0, help="seed RNG — одинаковый seed даёт одинаковый файл")
+    synth.add_argument('--workers', type=int, help="число процессов (по умолчанию по числу CPU)")
+    split = parser.add_argument_group("экспорт частями")
+    split.add_argument('--part-items', type=int, help="не больше N items в части")
+    split.add_argument('--part-bytes', type=parse_size, help="не больше размера части до сжатия, например 64M")
+    split.add_argument('--compress', choices=['gzip', 'zstd'], help="сжимать части (по умолчанию части по 50000 items)")
+    split.add_argument('--compress-level', type=int, help="уровень сжатия (gzip 1-9, zstd 1-22)")
+    inc = parser.add_argument_group("инкрементальный режим (только новые посты)")
+    inc.add_argument('--since', nargs='+', metavar='EXPORT',
+                     help="прошлые экспорты: WXR, части .gz/.zst или NDJSON (wxr_ingest.py, манифест)")
+    inc.add_argument('--manifest', help="NDJSON-манифест slug'ов: читается как индекс и дополняется новыми постами")
+    add_supabase_args(parser)
+    return parser.parse_args(argv)
+
+
+def clobbers(output, path):
+    """Перезапишет ли дельта в output файл прошлого экспорта path (сам файл или его часть)"""
+    output, path = os.path.abspath(output), os.path.abspath(path)
+    base = output[:-len('.wxr.xml')] if output.endswith('.wxr.xml') else output
+    return path == output or path.startswith(base + '.part')
+
+
+def source_posts(args):
+    """Посты прогона: синтетика (--items) или демо-набор"""
+    if args.items:
+        return synthetic_posts(args.items, args.seed, args.mix, args.days, args.until, args.workers)
+    return demo_posts()
+
+
+def write_output(args, chunks, indent):
+    """Отрендеренные <item> в один WXR-файл или частями (--part-*, --compress)"""
+    if args.part_items or args.part_bytes or args.compress:
+        max_items = args.part_items or (None if args.part_bytes else 50000)
+        parts = write_wxr_parts(args.output, chunks, indent, max_items, args.part_bytes,
+                                args.compress, args.compress_level, args.workers)
+        for path in parts.paths:
+            print(f"  {path}")
+        ratio = parts.disk_bytes / parts.raw_bytes if parts.raw_bytes else 1
+        print(f"Готово: частей {len(parts.paths)}, {parts.items} items, "
+              f"{parts.raw_bytes / 1e6:.1f} MB -> {parts.disk_bytes / 1e6:.1f} MB ({ratio:.0%})")
+        return
+    count = 0
+    with open_wxr(args.output, indent) as writer:
+        for chunk in chunks:
+            writer.raw(chunk)
+            count += len(chunk)
+    print(f"Готово: {args.output} ({count} items)")
+
+
+def run_incremental(args, indent):
+    """
+    --since / --manifest: индекс уже выгруженного, на выход (файл или Supabase)
+    идут только новые посты, затем манифест дополняется. Манифест пишется
+    после выгрузки — упавший прогон просто повторится целиком.
+    """
+    sources = list(args.since or [])
+    existed = bool(args.manifest) and os.path.exists(args.manifest)
+    if existed:
+        sources.append(args.manifest)
+    if not args.supabase and any(clobbers(args.output, path) for path in sources):
+        raise SystemExit(f"❌ {args.output} перезапишет прошлый экспорт: укажите другой -o для дельты")
+    started = time.perf_counter()
+    index = load_export_index(sources)
+    print(f"📇 Индекс: {len(index)} постов из {len(sources)} файлов за {time.perf_counter() - started:.1f}s")
+
+    delta = {'new': [], 'skipped': 0}
+    posts = only_new(source_posts(args), index, delta)
+    if args.supabase:
+        run_supabase_load(args, posts)
+    else:
+        write_output(args, render_posts(posts, indent), indent)
+    print(f"Новых постов: {len(delta['new'])}, пропущено уже выгруженных: {delta['skipped']}")
+    if args.manifest:
+        update_manifest(args.manifest, index, delta['new'], existed)
+        print(f"📝 Манифест {args.manifest}: {len(index)} постов")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    indent = '' if args.compact else ' ' * args.indent
+    if args.since or args.manifest:
+        run_incremental(args, indent)
+    elif args.supabase:
+        run_supabase_load(args, source_posts(args))
+    else:
+        write_output(args, rendered_chunks(args.items, indent, args.seed, args.mix, args.days,
+                                           args.until, args.workers), indent)
 
-xml_str = ET.tostring(rss, encoding='utf-8')
-pretty = minidom.parseString(xml_str).toprettyxml(indent="  ", encoding='utf-8')
-with open("icoffio_seed_content.wxr.xml", "wb") as f:
-    f.write(pretty)
 
-print("Готово: icoffio_seed_content.wxr.xml")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
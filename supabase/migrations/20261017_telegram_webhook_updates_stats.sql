@@ -0,0 +1,35 @@
+-- ============================================
+-- TELEGRAM WEBHOOK UPDATES: SIZE STATS FOR RETENTION
+-- Date: 2026-10-17
+-- ============================================
+
+-- Read by scripts/telegram-prune-updates.py (telegram-tools prune) to report
+-- the table size before and after pruning. PostgREST exposes it as
+-- POST /rest/v1/rpc/telegram_webhook_updates_stats. Without this function the
+-- pruner still works and reports only the row estimate.
+CREATE OR REPLACE FUNCTION telegram_webhook_updates_stats()
+RETURNS TABLE (
+  total_bytes BIGINT,
+  table_bytes BIGINT,
+  index_bytes BIGINT,
+  estimated_rows BIGINT
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT
+    pg_total_relation_size(c.oid),
+    pg_relation_size(c.oid),
+    pg_indexes_size(c.oid),
+    GREATEST(c.reltuples, 0)::BIGINT
+  FROM pg_class c
+  WHERE c.oid = 'public.telegram_webhook_updates'::regclass;
+$$;
+
+REVOKE ALL ON FUNCTION telegram_webhook_updates_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION telegram_webhook_updates_stats() TO service_role;
+
+COMMENT ON FUNCTION telegram_webhook_updates_stats() IS
+  'Size of telegram_webhook_updates and its indexes, for the retention pruner';
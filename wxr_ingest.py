@@ -0,0 +1,161 @@
+"""
+Потоковое чтение WXR — обратная сторона seed.py.
+<item> разбираются через iterparse и сразу выбрасываются из дерева,
+поэтому память не растёт с размером экспорта. Понимает .gz/.zst части.
+"""
+from email.utils import parsedate_to_datetime
+import xml.etree.ElementTree as ET
+import argparse
+import gzip
+import json
+import re
+import sys
+
+from seed import add_supabase_args, ns, run_supabase_load, slugify
+
+WP = '{%s}' % ns['wp']
+tags = {
+    'slug': WP + 'post_name',
+    'post_date': WP + 'post_date_gmt',
+    'post_date_local': WP + 'post_date',
+    'status': WP + 'status',
+    'post_type': WP + 'post_type',
+    'excerpt': '{%s}encoded' % ns['excerpt'],
+    'content': '{%s}encoded' % ns['content'],
+    'creator': '{%s}creator' % ns['dc'],
+}
+_img = re.compile(r'<img[^>]+src="([^"]+)"')
+
+
+def open_export(path):
+    """Файл экспорта в бинарном режиме; '-' — stdin, .gz/.zst распаковываются на лету"""
+    if path == '-':
+        return sys.stdin.buffer
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if path.endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            raise SystemExit("❌ Для .zst нужен пакет zstandard: pip install zstandard")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return open(path, 'rb')
+
+
+def valid_date(value):
+    """wp:post_date* годится как timestamp: не пусто и не 0000-00-00 (так WordPress пишет черновики)"""
+    return bool(value) and not value.startswith('0000-00-00')
+
+
+def rfc822_date(value):
+    """pubDate -> 'YYYY-MM-DD HH:MM:SS'; None, если дата битая (не прерывать импорт из-за одного поста)"""
+    try:
+        return parsedate_to_datetime(value).strftime('%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        return None
+
+
+def item_to_post(item):
+    """<item> -> dict в формате seed.make_post (title, slug, category, даты, excerpt, content)"""
+    get = item.findtext
+    title = get('title') or ''
+    pub_date = get('pubDate')
+    post_date = next(filter(valid_date, (get(tags['post_date']), get(tags['post_date_local']))), None)
+    if not post_date and pub_date:
+        post_date = rfc822_date(pub_date)
+    content = get(tags['content']) or ''
+    image = _img.search(content)
+    category = next((c.text for c in item.iterfind('category') if c.get('domain') == 'category'), None)
+    return {
+        'title': title,
+        'slug': get(tags['slug']) or slugify(title),
+        'category': category or 'general',
+        'pub_date': pub_date,
+        'post_date': post_date,
+        'excerpt': get(tags['excerpt']) or '',
+        'content': content,
+        'image': image.group(1) if image else None,
+        'status': get(tags['status']) or 'publish',
+        'link': get('link'),
+        'author': get(tags['creator']),
+    }
+
+
+def iter_items(path, post_types=('post',)):
+    """
+    Отдавать <item> из экспорта по одному. После обработки элемент и
+    уже прочитанные дети <channel> очищаются — дерево не накапливается.
+    """
+    with open_export(path) as f:
+        channel = None
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'channel':
+                    channel = elem
+                continue
+            if elem.tag != 'item':
+                continue
+            if not post_types or elem.findtext(tags['post_type'], 'post') in post_types:
+                yield elem
+            elem.clear()
+            if channel is not None:
+                channel.clear()
+
+
+def item_key(item):
+    """(slug, guid) без разбора контента — ключ для индекса seed.py --since"""
+    slug = item.findtext(tags['slug']) or slugify(item.findtext('title') or '')
+    return slug, item.findtext('guid') or item.findtext('link')
+
+
+def iter_keys(paths, post_types=('post',)):
+    """Только ключи постов из экспорта — дешевле iter_posts, контент не трогается"""
+    for path in paths:
+        for item in iter_items(path, post_types):
+            yield item_key(item)
+
+
+def iter_posts(paths, post_types=('post',)):
+    """Посты из одного или нескольких файлов экспорта (например, частей .partNNN)"""
+    for path in paths:
+        for item in iter_items(path, post_types):
+            yield item_to_post(item)
+
+
+def write_ndjson(posts, out):
+    """Посты построчно в NDJSON; вернуть число строк"""
+    count = 0
+    dumps = json.dumps
+    for post in posts:
+        out.write(dumps(post, ensure_ascii=False))
+        out.write('\n')
+        count += 1
+    return count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Импорт WXR-экспорта: NDJSON или сразу в Supabase")
+    parser.add_argument('inputs', nargs='+', help="файлы экспорта (.wxr.xml, .gz, .zst) или '-' для stdin")
+    parser.add_argument('--ndjson', default='-', help="куда писать NDJSON (по умолчанию stdout)")
+    parser.add_argument('--post-type', action='append', dest='post_types',
+                        help="какие wp:post_type брать (по умолчанию post; можно повторять)")
+    add_supabase_args(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    posts = iter_posts(args.inputs, tuple(args.post_types or ('post',)))
+    if args.supabase:
+        run_supabase_load(args, posts)
+        return
+    if args.ndjson == '-':
+        write_ndjson(posts, sys.stdout)
+        return
+    with open(args.ndjson, 'w', encoding='utf-8') as out:
+        count = write_ndjson(posts, out)
+    print(f"Готово: {args.ndjson} ({count} постов)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()